@@ -6,6 +6,8 @@ ILC="\033[3m"
 ORG="\033[1;33m"
 RST="\033[0m"
 
+MICRO_BASELINE="bench/micro_baseline.json"
+
 function _error()
 {
     echo -e "${RED}${BOLD}[❌] ERROR:\n${RST}\t$1\n\t${ILC}\"$2\"${RST}"
@@ -53,7 +55,37 @@ function _debug()
 
 function _tests_run()
 {
-    _info "no unit tests found, please run ./build.sh to build the project."
+    _info "running the unit tests..."
+    cd src || _error "cd failed" "src directory not found"
+    if ! python3 -m pytest -q tests; then
+        _error "unit tests error" "some unit tests failed"
+    fi
+    _success "unit tests passed"
+    exit 0
+}
+
+function _bench_run()
+{
+    _info "running the load benchmark against the local mock server..."
+    cd src || _error "cd failed" "src directory not found"
+    if ! python3 -m bench.load; then
+        _error "benchmark error" "load benchmark failed"
+    fi
+    _success "load benchmark done"
+    exit 0
+}
+
+function _micro_run()
+{
+    _info "running the microbenchmarks..."
+    cd src || _error "cd failed" "src directory not found"
+    if [ -f "$MICRO_BASELINE" ]; then
+        python3 -m bench.micro --compare "$MICRO_BASELINE" || _error "benchmark error" "regression against $MICRO_BASELINE"
+    else
+        python3 -m bench.micro --save "$MICRO_BASELINE" || _error "benchmark error" "microbenchmarks failed"
+        _info "baseline saved to src/$MICRO_BASELINE"
+    fi
+    _success "microbenchmarks done"
     exit 0
 }
 
@@ -81,7 +113,9 @@ ARGUMENTS:
       $0 [-d|--debug]   debug flags compilation
       $0 [-c|--clean]   clean the project
       $0 [-f|--fclean]  fclean the project
-      $0 [-t|--tests]   run unit tests ⚠️ not implemented yet ⚠️
+      $0 [-t|--tests]   run the unit tests (pytest)
+      $0 [-b|--bench]   run the load benchmark against the mock server
+      $0 [-m|--micro]   run the microbenchmarks, compared with the saved baseline
 EOF
         exit 0
         ;;
@@ -99,6 +133,12 @@ EOF
     -t|--tests)
         _tests_run
         ;;
+    -b|--bench)
+        _bench_run
+        ;;
+    -m|--micro)
+        _micro_run
+        ;;
     -r|--re)
         _fclean
         _all
@@ -0,0 +1,6 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## __init__
+##
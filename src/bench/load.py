@@ -0,0 +1,136 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## load
+##
+
+import os
+import sys
+import json
+import signal
+import asyncio
+import argparse
+import threading
+import subprocess
+from zappy import logger
+from zappy.mock_server import MockServer
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEAM_NAME = "bench"
+
+class ServerThread(threading.Thread):
+    """
+    Runs a MockServer on its own event loop, next to the client processes.
+    """
+    def __init__(self, server: MockServer) -> None:
+        super().__init__(daemon=True)
+        self.server = server
+        self.ready = threading.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop_event: asyncio.Event | None = None
+
+    def run(self) -> None:
+        asyncio.run(self._main())
+
+    async def _main(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        await self.server.start()
+        self.ready.set()
+        await self._stop_event.wait()
+        await self.server.stop()
+
+    def stop(self) -> None:
+        if self._loop is not None and self._stop_event is not None:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+        self.join()
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, int(round(q / 100 * (len(values) - 1)))))
+    return values[index]
+
+def _client_commands(mode: str, port: int, clients: int) -> list[list[str]]:
+    base = ["-p", str(port), "-n", TEAM_NAME, "-h", "127.0.0.1"]
+    if mode == "team":
+        return [[sys.executable, os.path.join(SRC_DIR, "team.py"), *base, "-a", str(clients), "-m", str(clients)]]
+    return [[sys.executable, os.path.join(SRC_DIR, "main.py"), *base] for _ in range(clients)]
+
+def run_load(clients: int, args: argparse.Namespace) -> dict:
+    """
+    Connect clients to a fresh mock server for args.duration seconds and collect the results.
+    """
+    server = MockServer(width=args.width, height=args.height, teams=[TEAM_NAME], slots=clients,
+                        freq=args.freq, tick_units=args.tick_units, seed=args.seed, start_food=args.start_food)
+    thread = ServerThread(server)
+    thread.start()
+    thread.ready.wait()
+
+    processes = [subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                 for command in _client_commands(args.mode, server.port, clients)]
+    threading.Event().wait(args.duration)
+    cpu_time = 0.0
+    for process in processes:
+        if process.poll() is None:
+            process.send_signal(signal.SIGINT)
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        cpu_time += usage.ru_utime + usage.ru_stime
+    thread.stop()
+
+    commands = sum(stats.commands for stats in server.stats)
+    responses = [latency for stats in server.stats for latency in stats.response_latencies]
+    reactions = [latency for stats in server.stats for latency in stats.reaction_latencies]
+    return {
+        "clients": clients,
+        "mode": args.mode,
+        "connected": len(server.stats),
+        "commands_per_sec": commands / args.duration,
+        "dropped_commands": sum(stats.dropped for stats in server.stats),
+        "response_ms": {f"p{q}": percentile(responses, q) * 1000 for q in (50, 90, 99)},
+        "reaction_ms": {f"p{q}": percentile(reactions, q) * 1000 for q in (50, 90, 99)},
+        "cpu_percent_per_client": cpu_time / args.duration / clients * 100,
+    }
+
+def print_results(results: list[dict]) -> None:
+    print(f"{'clients':>7} {'cmd/s':>9} {'resp p50/p90/p99 (ms)':>24} {'react p50/p90/p99 (ms)':>24} {'cpu%/client':>11}")
+    for result in results:
+        response = "/".join(f"{value:.1f}" for value in result["response_ms"].values())
+        reaction = "/".join(f"{value:.2f}" for value in result["reaction_ms"].values())
+        print(f"{result['clients']:>7} {result['commands_per_sec']:>9.1f} {response:>24} {reaction:>24} {result['cpu_percent_per_client']:>11.1f}")
+
+def main() -> None:
+    """
+    End-to-end load benchmark: 1..N clients against the local mock server.
+    Response latency is command arrival to answer, reaction latency is the
+    time a client takes to send its next command once it has nothing pending.
+    """
+    parser = argparse.ArgumentParser(description="Zappy AI load benchmark")
+    parser.add_argument('--clients', type=lambda s: [int(n) for n in s.split(',')], default=[1, 2, 4, 8],
+                        help='Comma separated client counts to run')
+    parser.add_argument('--mode', choices=["process", "team"], default="process",
+                        help='One process per client or the asyncio team runtime')
+    parser.add_argument('--duration', type=float, default=5.0, help='Seconds per run')
+    parser.add_argument('-f', '--freq', type=int, default=1000, help='Server frequency')
+    parser.add_argument('--tick-units', type=int, default=1, help='Time units advanced per tick')
+    parser.add_argument('-x', '--width', type=int, default=20, help='World width')
+    parser.add_argument('-y', '--height', type=int, default=20, help='World height')
+    parser.add_argument('--seed', type=int, default=42, help='World seed')
+    parser.add_argument('--start-food', type=int, default=1000, help='Food given to every client')
+    parser.add_argument('--json', type=str, default=None, help='Write the results to this file')
+    args = parser.parse_args()
+
+    results = []
+    for clients in args.clients:
+        logger.info("Running load benchmark with %s client(s)...", clients)
+        results.append(run_load(clients, args))
+    print_results(results)
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## memory
+##
+
+import gc
+import argparse
+import tracemalloc
+from zappy.ai import ZappyAI
+from zappy.logger import configure_logging
+from zappy.vision import MAX_LEVEL
+from zappy.parsing import parse_inventory, parse_look
+from bench.micro import TEAM_NAME, look_message, inventory_message
+
+DEFAULT_AGENTS = 500
+DEFAULT_WORLD = 30
+TOP_SOURCES = 8
+
+def make_agent(level: int, world: int, commands: list[str]) -> ZappyAI:
+    """
+    An agent as it is in the middle of a game: world map sized, inventory and
+    vision parsed, commands in flight. It is never connected.
+    """
+    agent = ZappyAI(host="", port=0, team_name=TEAM_NAME)
+    agent.set_world_size(world, world)
+    agent.level = level
+    parse_inventory(inventory_message(level), agent)
+    parse_look(look_message(level), agent)
+    for command in commands:
+        agent.scheduler.push(command)
+    return agent
+
+def measure(agents: int, level: int, world: int) -> tuple[float, tracemalloc.Snapshot]:
+    """
+    Bytes allocated per agent, with the snapshot of every allocation still alive.
+    """
+    # Warm every cache shared by all the agents before measuring
+    commands = ["Forward", "Left", "Take food", "Look", "Inventory"]
+    make_agent(level, world, commands)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    population = [make_agent(level, world, commands) for _ in range(agents)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del population
+    return (after - before) / agents, snapshot
+
+def main() -> None:
+    """
+    Memory held by every agent when many of them share a process.
+    """
+    parser = argparse.ArgumentParser(description="Zappy AI memory benchmark")
+    parser.add_argument('-a', '--agents', type=int, default=DEFAULT_AGENTS, help='Agents to create')
+    parser.add_argument('-w', '--world', type=int, default=DEFAULT_WORLD, help='Side of the square world')
+    parser.add_argument('--level', type=int, default=None, help='Only measure agents of this level')
+    parser.add_argument('--top', action='store_true', help='Show the source lines holding the most memory')
+    args = parser.parse_args()
+    configure_logging("CRITICAL")
+
+    levels = [args.level] if args.level is not None else range(1, MAX_LEVEL + 1)
+    for level in levels:
+        per_agent, snapshot = measure(args.agents, level, args.world)
+        print(f"level {level}: {per_agent:>9.0f} bytes per agent ({args.agents} agents, {args.world}x{args.world} world)")
+        if args.top:
+            for stat in snapshot.statistics('lineno')[:TOP_SOURCES]:
+                print(f"    {stat.size / args.agents:>8.0f} B  {stat.traceback[0]}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## micro
+##
+
+import sys
+import json
+import timeit
+import platform
+import argparse
+from typing import Callable
+from zappy import ELEVATION_REQUIREMENTS
+from zappy.vision import Vision, VISION_ITEMS, MAX_LEVEL
+from zappy.game import GameWorld
+from zappy.logger import configure_logging
+from zappy.planner import plan_route
+from zappy.world_map import WorldMap
+from zappy.collector import plan_collection
+from zappy.ai import ZappyAI
+from zappy.batch import AgentBatch
+from zappy.decision_engine import DecisionEngine
+from zappy.parsing import parse_inventory, parse_look
+
+TEAM_NAME = "bench"
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.10 # slowdown flagged as a regression
+HOSTED_AGENTS = 100 # agents sharing a process in the host benchmarks
+LEVELS = range(1, MAX_LEVEL + 1)
+# Slowest time allowed at any level on the reference host, in nanoseconds,
+# whatever the baseline; only checked with --ceilings
+CEILINGS = {
+    "plan_collection": 1_200_000,
+}
+
+class BenchAgent(DecisionEngine):
+    """
+    A DecisionEngine without a socket, commands only go to the scheduler.
+    """
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        DecisionEngine.__init__(self, host="", port=0, team_name=TEAM_NAME)
+        self.set_world_size(30, 30)
+
+    def send_command_immediately(self, command: str) -> None:
+        pass
+
+class HostedAgent(ZappyAI):
+    """
+    A ZappyAI without a socket, as hosted by TeamRuntime.
+    """
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        ZappyAI.__init__(self, host="", port=0, team_name=TEAM_NAME)
+        self.set_world_size(30, 30)
+
+    def send_command_immediately(self, command: str) -> None:
+        pass
+
+def look_message(level: int, seed: int = 42) -> str:
+    """
+    Look answer of a player of the given level on a seeded world.
+    """
+    world = GameWorld(30, 30, [TEAM_NAME], 1, seed)
+    player = world.join(TEAM_NAME)
+    player.level = level
+    return world.look(player)
+
+def inventory_message(level: int) -> str:
+    """
+    Inventory answer with all but one stone needed for the level's elevation.
+    """
+    requirements = dict(ELEVATION_REQUIREMENTS[min(level, MAX_LEVEL - 1)][1])
+    for stone, count in requirements.items():
+        if count:
+            requirements[stone] = count - 1
+            break
+    return "[food 12, " + ", ".join(f"{stone} {count}" for stone, count in requirements.items()) + "]"
+
+def _inventory(level: int) -> dict[str, int]:
+    agent = BenchAgent()
+    parse_inventory(inventory_message(level), agent)
+    return agent.inventory
+
+def bench_parse_inventory(level: int) -> Callable[[], None]:
+    agent = BenchAgent()
+    message = inventory_message(level)
+    return lambda: parse_inventory(message, agent)
+
+def bench_parse_look(level: int) -> Callable[[], None]:
+    agent = BenchAgent()
+    message = look_message(level)
+    return lambda: parse_look(message, agent)
+
+def bench_path_to_tile(level: int) -> Callable[[], None]:
+    tiles = range((level + 1) ** 2)
+    def run() -> None:
+        for tile in tiles:
+            DecisionEngine._get_path_to_tile(tile, 0, 30, 30)
+    return run
+
+def bench_path_to_tile_cold(level: int) -> Callable[[], None]:
+    run_cached = bench_path_to_tile(level)
+    def run() -> None:
+        plan_route.cache_clear()
+        run_cached()
+    return run
+
+def bench_find_closest(level: int) -> Callable[[], None]:
+    vision = Vision.parse(look_message(level))
+    def run() -> None:
+        for item in VISION_ITEMS:
+            DecisionEngine._find_closest_ressource(vision, item)
+    return run
+
+def bench_elevation_requirements(level: int) -> Callable[[], None]:
+    inventory = _inventory(level)
+    return lambda: DecisionEngine._check_elevation_requirements(level, inventory)
+
+def bench_fold_vision(level: int) -> Callable[[], None]:
+    """
+    A Look folded into the world map from a new pose every time.
+    """
+    world_map = WorldMap(30, 30)
+    vision = Vision.parse(look_message(level))
+    def run() -> None:
+        world_map.x = (world_map.x + 1) % world_map.width
+        world_map.fold_vision(vision)
+    return run
+
+def bench_plan_collection(level: int) -> Callable[[], None]:
+    """
+    A collection pass after every stone of the next elevation and some food.
+    """
+    vision = Vision.parse(look_message(level))
+    wanted = {stone: count for stone, count in ELEVATION_REQUIREMENTS[min(level, MAX_LEVEL - 1)][1].items() if count}
+    wanted["food"] = 10
+    return lambda: plan_collection(vision, wanted)
+
+def bench_dispatch(level: int) -> Callable[[], None]:
+    """
+    One answer of every kind: ok, ko, Look, Inventory and a broadcast.
+    """
+    agent = BenchAgent()
+    script = [("Forward", "ok"), ("Take thystame", "ko"), ("Look", look_message(level)),
+              ("Inventory", inventory_message(level)), (None, "message 3, hello")]
+    def run() -> None:
+        for command, answer in script:
+            if command is not None:
+                agent.scheduler.push(command)
+            agent.handle_server_message(answer, agent)
+        agent.level = level
+    return run
+
+def bench_make_decision(level: int) -> Callable[[], None]:
+    agent = BenchAgent()
+    agent.level = level
+    parse_inventory(inventory_message(level), agent)
+    vision = Vision.parse(look_message(level))
+    def run() -> None:
+        agent.scheduler.clear()
+        agent.reset_action_plan()
+        agent.update_vision(vision)
+        agent.make_decision()
+    return run
+
+def _hosted_agents(level: int) -> tuple[list[HostedAgent], Callable[[], None]]:
+    """
+    HOSTED_AGENTS idle agents of the level, each seeing its own seeded
+    world, and a function making them idle again after a Look.
+    """
+    agents = [HostedAgent() for _ in range(HOSTED_AGENTS)]
+    visions = [Vision.parse(look_message(level, seed)) for seed in range(HOSTED_AGENTS)]
+    for agent in agents:
+        agent.level = level
+        parse_inventory(inventory_message(level), agent)
+    def reset() -> None:
+        for agent, vision in zip(agents, visions):
+            agent.scheduler.clear()
+            agent.reset_action_plan()
+            agent.update_vision(vision)
+    return agents, reset
+
+def bench_host_decisions(level: int) -> Callable[[], None]:
+    agents, reset = _hosted_agents(level)
+    def run() -> None:
+        reset()
+        for agent in agents:
+            agent.fill_command_queue()
+    return run
+
+def bench_host_batch(level: int) -> Callable[[], None]:
+    agents, reset = _hosted_agents(level)
+    batch = AgentBatch()
+    def run() -> None:
+        reset()
+        batch.decide(agents)
+    return run
+
+BENCHMARKS: dict[str, Callable[[int], Callable[[], None]]] = {
+    "parse_inventory": bench_parse_inventory,
+    "parse_look": bench_parse_look,
+    "get_path_to_tile": bench_path_to_tile,
+    "get_path_to_tile_cold": bench_path_to_tile_cold,
+    "find_closest_ressource": bench_find_closest,
+    "check_elevation_requirements": bench_elevation_requirements,
+    "fold_vision": bench_fold_vision,
+    "plan_collection": bench_plan_collection,
+    "handle_server_message": bench_dispatch,
+    "make_decision": bench_make_decision,
+    "host_decisions": bench_host_decisions,
+    "host_batch": bench_host_batch,
+}
+
+def measure(function: Callable[[], None], repeat: int) -> float:
+    """
+    Best time of one call over repeat runs, in nanoseconds.
+    Every run lasts at least 0.2 s, like timeit's autorange.
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+def run_benchmarks(pattern: str | None, repeat: int) -> dict[str, float]:
+    results = {}
+    for name, factory in BENCHMARKS.items():
+        for level in LEVELS:
+            key = f"{name}[level={level}]"
+            if pattern is None or pattern in key:
+                results[key] = measure(factory(level), repeat)
+                print(f"{key:<45} {results[key]:>12.0f} ns", flush=True)
+    return results
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """
+    Print the change against the baseline and return the regressed benchmarks.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<45} {'baseline':>12} {'current':>12} {'change':>8}")
+    for key, current in results.items():
+        if key not in baseline:
+            continue
+        change = current / baseline[key] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"{key:<45} {baseline[key]:>10.0f}ns {current:>10.0f}ns {change:>+8.1%}{flag}")
+    return regressions
+
+def over_ceiling(results: dict[str, float]) -> list[str]:
+    """
+    Print and return the benchmarks slower than their ceiling.
+    """
+    exceeded = []
+    for key, current in results.items():
+        ceiling = CEILINGS.get(key.split("[", 1)[0])
+        if ceiling is not None and current > ceiling:
+            exceeded.append(key)
+            print(f"{key:<45} {current:>12.0f} ns over its {ceiling} ns ceiling")
+    return exceeded
+
+def main() -> None:
+    """
+    Microbenchmarks of the client's hot paths on synthetic state at every level.
+    Results can be saved as a JSON baseline and compared against one later,
+    the run fails when a benchmark regressed, or went over its ceiling when
+    those are checked: they hold on the reference host only.
+    """
+    parser = argparse.ArgumentParser(description="Zappy AI microbenchmarks")
+    parser.add_argument('-k', '--filter', type=str, default=None, help='Only run the benchmarks containing this text')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='Runs per benchmark, the best one is kept')
+    parser.add_argument('--save', type=str, default=None, help='Save the results as a JSON baseline')
+    parser.add_argument('--compare', type=str, default=None, help='JSON baseline to compare the results with')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='Slowdown ratio flagged as a regression')
+    parser.add_argument('--ceilings', action='store_true', help='Also fail over the absolute CEILINGS (reference host only)')
+    args = parser.parse_args()
+    configure_logging("CRITICAL")
+
+    results = run_benchmarks(args.filter, args.repeat)
+    failed = args.ceilings and bool(over_ceiling(results))
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"python": platform.python_version(), "results": results}, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}.")
+            failed = True
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## tune
+##
+
+import os
+import json
+import time
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from zappy.logger import configure_logging
+from zappy.decision_engine import Tuning, FORK_TIMER, INCANTATION_FOOD
+from zappy.simulator import simulate, DEFAULT_MAX_UNITS, DEFAULT_WIDTH, DEFAULT_HEIGHT, DEFAULT_SLOTS, \
+    DEFAULT_AGENTS, DEFAULT_MAX_AGENTS
+from zappy import FOOD_SURVIVAL_THRESHOLD
+
+DEFAULT_GAMES = 20
+GAMES_PER_TASK = 4
+
+def int_list(text: str) -> list[int]:
+    return [int(value) for value in text.split(',')]
+
+def play(config: tuple[int, int, int], seeds: range, settings: dict) -> tuple[tuple[int, int, int], list[dict]]:
+    """
+    Play some seeds of one configuration, in a worker process.
+    """
+    tuning = Tuning(*config)
+    return config, [simulate(seed, tuning, **settings) for seed in seeds]
+
+def summarize(config: tuple[int, int, int], games: list[dict]) -> dict:
+    count = len(games)
+    levels = [level for game in games for level in game["levels"]]
+    return {
+        "fork_timer": config[0],
+        "food_survival": config[1],
+        "incantation_food": config[2],
+        "games": count,
+        "survival": sum(game["survival"] for game in games) / count,
+        "lifetime": sum(game["lifetime"] for game in games) / count,
+        "players": sum(game["players"] for game in games) / count,
+        "max_level": sum(game["max_level"] for game in games) / count,
+        "best_level": max(game["max_level"] for game in games),
+        "mean_level": sum(levels) / len(levels) if levels else 0.0,
+    }
+
+def sweep(configs: list[tuple[int, int, int]], games: int, first_seed: int, jobs: int, settings: dict) -> list[dict]:
+    """
+    Play every configuration on the same seeds, spread over a process pool.
+    """
+    results: dict[tuple[int, int, int], list[dict]] = {config: [] for config in configs}
+    with ProcessPoolExecutor(max_workers=jobs, initializer=configure_logging, initargs=("CRITICAL",)) as pool:
+        tasks = [pool.submit(play, config, range(start, min(start + GAMES_PER_TASK, first_seed + games)), settings)
+                 for config in configs
+                 for start in range(first_seed, first_seed + games, GAMES_PER_TASK)]
+        for task in tasks:
+            config, played = task.result()
+            results[config].extend(played)
+    return [summarize(config, played) for config, played in results.items()]
+
+def print_results(results: list[dict]) -> None:
+    print(f"{'fork':>5} {'food':>5} {'incant':>6} {'games':>6} {'survival':>9} {'lifetime':>9} {'players':>7} {'max lvl':>7} {'best':>4} {'mean lvl':>8}")
+    for result in results:
+        print(f"{result['fork_timer']:>5} {result['food_survival']:>5} {result['incantation_food']:>6} {result['games']:>6} "
+              f"{result['survival']:>9.0f} {result['lifetime']:>9.0f} {result['players']:>7.1f} {result['max_level']:>7.2f} "
+              f"{result['best_level']:>4} {result['mean_level']:>8.2f}")
+
+def main() -> None:
+    """
+    Sweep the decision thresholds over seeded headless games.
+    """
+    parser = argparse.ArgumentParser(description="Zappy AI threshold sweep")
+    parser.add_argument('--fork-timer', type=int_list, default=[FORK_TIMER],
+                        help='Comma-separated answers between two forks')
+    parser.add_argument('--food-survival', type=int_list, default=[FOOD_SURVIVAL_THRESHOLD],
+                        help='Comma-separated life (time units) under which food comes first')
+    parser.add_argument('--incantation-food', type=int_list, default=[INCANTATION_FOOD],
+                        help='Comma-separated life (time units) needed to start an incantation')
+    parser.add_argument('-g', '--games', type=int, default=DEFAULT_GAMES, help='Seeded games per configuration')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the first game')
+    parser.add_argument('--units', type=int, default=DEFAULT_MAX_UNITS, help='Time units a game lasts at most')
+    parser.add_argument('-x', '--width', type=int, default=DEFAULT_WIDTH, help='World width')
+    parser.add_argument('-y', '--height', type=int, default=DEFAULT_HEIGHT, help='World height')
+    parser.add_argument('-c', '--clients', type=int, default=DEFAULT_SLOTS, help='Slots of the team')
+    parser.add_argument('-a', '--agents', type=int, default=DEFAULT_AGENTS, help='Agents joining at start')
+    parser.add_argument('-m', '--max-agents', type=int, default=DEFAULT_MAX_AGENTS, help='Agents alive at most')
+    parser.add_argument('-b', '--batched', action='store_true', help='Decide for the agents in batched steps')
+    parser.add_argument('-j', '--jobs', type=int, default=len(os.sched_getaffinity(0)), help='Worker processes')
+    parser.add_argument('--json', type=str, default=None, help='Write the results to this file')
+    args = parser.parse_args()
+
+    configs = list(itertools.product(args.fork_timer, args.food_survival, args.incantation_food))
+    settings = {"max_units": args.units, "width": args.width, "height": args.height, "slots": args.clients,
+                "agents": args.agents, "max_agents": args.max_agents, "batched": args.batched}
+    started = time.perf_counter()
+    results = sweep(configs, args.games, args.seed, args.jobs, settings)
+    elapsed = time.perf_counter() - started
+    # Best first: furthest level reached, then longest survival
+    results.sort(key=lambda result: (result["max_level"], result["survival"]), reverse=True)
+    print_results(results)
+    print(f"{len(configs) * args.games} games in {elapsed:.1f}s")
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+
+if __name__ == "__main__":
+    main()
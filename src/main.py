@@ -8,8 +8,12 @@
 import argparse
 from zappy import logger
 from typing import NoReturn
-from zappy.ai import ZappyAI
+from zappy.ai import ZappyAI, DEFAULT_RECONNECTS
 from zappy.exception import ZappyError
+from zappy.swarm import Swarm, DEFAULT_MAX_RESTARTS
+from zappy.runtime import DEFAULT_MAX_AGENTS
+from zappy.metrics import start_exporters, DEFAULT_STATS_INTERVAL
+from zappy.logger import configure_logging, DEFAULT_LOG_LEVEL, LOG_LEVELS
 
 ZAPPY_AI_ERROR = 84
 ZAPPY_AI_SUCCESS = 0
@@ -23,17 +27,46 @@ def main() -> NoReturn:
     parser.add_argument('-p', '--port', type=int, required=True, help='Port to connect to the Zappy server')
     parser.add_argument('-n', '--name', type=str, required=True, help='Name of the team to join')
     parser.add_argument('-h', '--host', type=str, default='localhost', help='Host to connect to the Zappy server')
+    parser.add_argument('-k', '--team-key', type=str, default=None, help='Secret shared by the team to sign broadcasts (default: the team name)')
+    parser.add_argument('-r', '--reconnects', type=int, default=DEFAULT_RECONNECTS, help='Reconnection attempts after losing the server')
+    parser.add_argument('--swarm', type=int, default=None, help='Run this many agents, one worker process each')
+    parser.add_argument('-m', '--max-agents', type=int, default=DEFAULT_MAX_AGENTS, help='Maximum number of workers of the swarm')
+    parser.add_argument('--max-restarts', type=int, default=DEFAULT_MAX_RESTARTS, help='Restarts of a swarm worker whose agent is still alive')
+    parser.add_argument('-l', '--log-level', type=str.upper, choices=LOG_LEVELS, default=DEFAULT_LOG_LEVEL, help='Minimum level of the messages to log')
+    parser.add_argument('--trace', type=str, default=None, help='Write a JSON-lines trace of the protocol to this file')
+    parser.add_argument('--trace-sample', type=float, default=1.0, help='Fraction of the protocol lines kept in the trace')
+    parser.add_argument('--record', type=str, default=None, help='Record every line exchanged with the server to this transcript')
+    parser.add_argument('--metrics-port', type=int, default=None, help='Serve Prometheus metrics on this local port')
+    parser.add_argument('--metrics-file', type=str, default=None, help='Periodically rewrite a metrics file at this path (one per worker with --swarm)')
+    parser.add_argument('--metrics-interval', type=float, default=DEFAULT_STATS_INTERVAL, help='Seconds between two rewrites of the metrics file')
     parser.add_argument('-v', '--version', action='version', version=f"ZappyAI version {ZAP_AI_VERSION}", help='Print the version of the AI')
 
     args = parser.parse_args()
+    configure_logging(args.log_level, args.trace, args.trace_sample)
+
+    if args.swarm is not None:
+        swarm = Swarm(args, workers=args.swarm, max_agents=args.max_agents, max_restarts=args.max_restarts)
+        exit(ZAPPY_AI_SUCCESS if swarm.run() else ZAPPY_AI_ERROR)
+
+    try:
+        exporters = start_exporters(args.metrics_port, args.metrics_file, args.metrics_interval)
+    except OSError as e:
+        logger.error("Could not start the metrics exporter: %s", e)
+        exit(ZAPPY_AI_ERROR)
 
     success = False
     try:
-        ai_client = ZappyAI(host=args.host, port=args.port, team_name=args.name)
+        ai_client = ZappyAI(host=args.host, port=args.port, team_name=args.name, team_key=args.team_key)
+        ai_client.max_reconnects = args.reconnects
+        if args.record is not None:
+            ai_client.start_recording(args.record)
         success = ai_client.run()
     except ZappyError as e:
-        logger.error(f"An error occurred at: {e.where}: {e.what}")
+        logger.error("An error occurred at: %s: %s", e.where, e.what)
         success = False
+    finally:
+        for exporter in exporters:
+            exporter.stop()
     exit(ZAPPY_AI_SUCCESS if success else ZAPPY_AI_ERROR)
 
 if __name__ == "__main__":
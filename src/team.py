@@ -0,0 +1,68 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## team
+##
+
+import asyncio
+import argparse
+from zappy import logger
+from typing import NoReturn
+from zappy.exception import ZappyError
+from zappy.metrics import start_exporters, DEFAULT_STATS_INTERVAL
+from zappy.logger import configure_logging, DEFAULT_LOG_LEVEL, LOG_LEVELS
+from zappy.runtime import TeamRuntime, DEFAULT_MAX_AGENTS
+
+ZAPPY_AI_ERROR = 84
+ZAPPY_AI_SUCCESS = 0
+ZAP_AI_VERSION = "0.0.1"
+
+def main() -> NoReturn:
+    """
+    Entry point of the multi-agent Zappy AI client, one process for the whole team.
+    """
+    parser = argparse.ArgumentParser(description="Zappy AI Team Client", add_help=False)
+    parser.add_argument('-p', '--port', type=int, required=True, help='Port to connect to the Zappy server')
+    parser.add_argument('-n', '--name', type=str, required=True, help='Name of the team to join')
+    parser.add_argument('-h', '--host', type=str, default='localhost', help='Host to connect to the Zappy server')
+    parser.add_argument('-a', '--agents', type=int, default=1, help='Number of agents to connect at start')
+    parser.add_argument('-m', '--max-agents', type=int, default=DEFAULT_MAX_AGENTS, help='Maximum number of agents hosted by this process')
+    parser.add_argument('-b', '--batch', action='store_true', help='Decide for the idle agents together, once per loop iteration')
+    parser.add_argument('-k', '--team-key', type=str, default=None, help='Secret shared by the team to sign broadcasts (default: the team name)')
+    parser.add_argument('-l', '--log-level', type=str.upper, choices=LOG_LEVELS, default=DEFAULT_LOG_LEVEL, help='Minimum level of the messages to log')
+    parser.add_argument('--trace', type=str, default=None, help='Write a JSON-lines trace of the protocol to this file')
+    parser.add_argument('--trace-sample', type=float, default=1.0, help='Fraction of the protocol lines kept in the trace')
+    parser.add_argument('--metrics-port', type=int, default=None, help='Serve Prometheus metrics on this local port')
+    parser.add_argument('--metrics-file', type=str, default=None, help='Periodically rewrite a metrics file at this path')
+    parser.add_argument('--metrics-interval', type=float, default=DEFAULT_STATS_INTERVAL, help='Seconds between two rewrites of the metrics file')
+    parser.add_argument('-v', '--version', action='version', version=f"ZappyAI version {ZAP_AI_VERSION}", help='Print the version of the AI')
+
+    args = parser.parse_args()
+    configure_logging(args.log_level, args.trace, args.trace_sample)
+
+    try:
+        exporters = start_exporters(args.metrics_port, args.metrics_file, args.metrics_interval)
+    except OSError as e:
+        logger.error("Could not start the metrics exporter: %s", e)
+        exit(ZAPPY_AI_ERROR)
+
+    success = False
+    try:
+        runtime = TeamRuntime(host=args.host, port=args.port, team_name=args.name,
+                              initial_agents=args.agents, max_agents=args.max_agents,
+                              team_key=args.team_key, batched=args.batch)
+        success = asyncio.run(runtime.run())
+    except KeyboardInterrupt:
+        logger.info("User interruption. Closing connections.")
+        success = True
+    except ZappyError as e:
+        logger.error("An error occurred at: %s: %s", e.where, e.what)
+        success = False
+    finally:
+        for exporter in exporters:
+            exporter.stop()
+    exit(ZAPPY_AI_SUCCESS if success else ZAPPY_AI_ERROR)
+
+if __name__ == "__main__":
+    main()
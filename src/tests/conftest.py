@@ -0,0 +1,54 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## conftest
+##
+
+import pytest
+from zappy.clock import DEFAULT_FREQUENCY
+from zappy.broadcast import BroadcastChannel
+from zappy.decision_engine import DecisionEngine
+
+TEAM_NAME = "team1"
+
+class ServerTime:
+    """
+    Server time the test moves forward in time units, read in seconds.
+    """
+    def __init__(self, frequency: float = DEFAULT_FREQUENCY) -> None:
+        self.frequency = frequency
+        self.units = 0
+
+    def __call__(self) -> float:
+        return self.units / self.frequency
+
+class OfflineAgent(DecisionEngine):
+    """
+    A DecisionEngine without a socket: commands only go to the scheduler,
+    server lines are fed to handle_server_message by the test, at a server
+    time the test moves forward.
+    """
+    __slots__ = ("time",)
+
+    def __init__(self, team_key: str | None = None) -> None:
+        DecisionEngine.__init__(self, host="", port=0, team_name=TEAM_NAME, team_key=team_key)
+        self.time = ServerTime()
+        self.clock.now = self.scheduler.now = self.time
+        # Its rate limit started on the wall clock
+        self.broadcasts = BroadcastChannel(team_key or TEAM_NAME, self.clock)
+        self.set_world_size(10, 10)
+
+    def wait(self, units: int) -> None:
+        self.time.units += units
+
+    def send_command_immediately(self, command: str) -> None:
+        pass
+
+    def feed(self, *lines: str) -> None:
+        for line in lines:
+            self.handle_server_message(line, self)
+
+@pytest.fixture
+def agent() -> OfflineAgent:
+    return OfflineAgent()
@@ -0,0 +1,81 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_batch
+##
+
+import random
+from zappy.ai import ZappyAI
+from zappy.batch import AgentBatch
+from zappy.parsing import parse_inventory, parse_look
+from zappy.simulator import Simulation
+from tests.conftest import TEAM_NAME
+
+LOOKS = (
+    "[player, food, linemate, ]",
+    "[player linemate deraumere sibur, , food food, phiras, , , thystame, mendiane, ]",
+    "[player player, sibur, , food, , linemate linemate, , , food]",
+    "[player food, , , ]",
+)
+INVENTORIES = (
+    "[food 1, linemate 0, deraumere 0, sibur 0, mendiane 0, phiras 0, thystame 0]",
+    "[food 12, linemate 1, deraumere 1, sibur 1, mendiane 0, phiras 0, thystame 0]",
+    "[food 30, linemate 2, deraumere 0, sibur 1, mendiane 0, phiras 2, thystame 0]",
+    "[food 5, linemate 1, deraumere 1, sibur 2, mendiane 0, phiras 1, thystame 0]",
+)
+
+class HostedAgent(ZappyAI):
+    """
+    A ZappyAI without a socket: commands only go to the scheduler.
+    """
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        ZappyAI.__init__(self, host="", port=0, team_name=TEAM_NAME)
+        self.set_world_size(10, 10)
+
+    def send_command_immediately(self, command: str) -> None:
+        pass
+
+def hosted_agents(count: int) -> list[HostedAgent]:
+    """
+    Idle agents of every level, fed, starving, ready to fork or not.
+    """
+    agents = []
+    for index in range(count):
+        agent = HostedAgent()
+        parse_inventory(INVENTORIES[index % len(INVENTORIES)], agent)
+        agent.level = 1 + index % 4
+        agent.timer_fork = 0 if index % 3 else 5
+        parse_look(LOOKS[index % len(LOOKS)], agent)
+        agents.append(agent)
+    return agents
+
+def sent(agents: list[HostedAgent]) -> list[tuple[list[str], list[str]]]:
+    return [([pending.command for pending in agent.scheduler.pending], agent.action_plan) for agent in agents]
+
+def test_a_batched_step_decides_like_every_agent_alone():
+    # Same seed for both: senders and rendezvous are drawn at random
+    random.seed(4)
+    alone = hosted_agents(16)
+    for agent in alone:
+        agent.fill_command_queue()
+    random.seed(4)
+    batched = hosted_agents(16)
+    AgentBatch().decide(batched)
+    assert sent(batched) == sent(alone)
+    assert any(commands for commands, _ in sent(alone))
+
+def test_busy_agents_are_left_out_of_the_step():
+    agents = hosted_agents(2)
+    agents[0].send_command("Look")
+    batch = AgentBatch()
+    batch.decide(agents)
+    assert len(batch) == 1
+    assert [pending.command for pending in agents[0].scheduler.pending] == ["Look"]
+
+def test_batched_games_are_the_same_games():
+    for seed in (1, 2):
+        settings = {"width": 3, "height": 3, "slots": 3, "agents": 3, "max_agents": 3}
+        assert Simulation(seed, batched=True, **settings).run(2000) == Simulation(seed, **settings).run(2000)
@@ -0,0 +1,102 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_broadcast
+##
+
+import base64
+from zappy.clock import ServerClock
+from zappy.broadcast import (BroadcastChannel, TeamMessage, KIND_INCANTATION, KIND_JOIN,
+                             BURST, REFILL_UNITS, SEQ_MODULO, MAX_STONE_COUNT)
+from tests.conftest import OfflineAgent
+
+TEAM_KEY = "team1:secret"
+
+class FakeTime:
+    def __init__(self) -> None:
+        self.seconds = 0.0
+
+    def __call__(self) -> float:
+        return self.seconds
+
+def channel(key: str = TEAM_KEY, time: FakeTime | None = None) -> BroadcastChannel:
+    return BroadcastChannel(key, ServerClock(now=time or FakeTime()))
+
+def beacon(level: int = 3) -> TeamMessage:
+    return TeamMessage(KIND_INCANTATION, level, players=2, x=4, y=5,
+                       stones={"linemate": 2, "thystame": 1}, rendezvous=77)
+
+def test_round_trip():
+    sender, receiver = channel(), channel()
+    text = sender.encode(beacon())
+    assert len(text) == 32
+    message = receiver.decode(text)
+    assert (message.kind, message.level, message.players, message.x, message.y, message.rendezvous) == \
+        (KIND_INCANTATION, 3, 2, 4, 5, 77)
+    assert message.stones == {"linemate": 2, "thystame": 1}
+    assert (message.sender, message.seq) == (sender.sender, 1)
+
+def test_stone_counts_are_capped():
+    sender, receiver = channel(), channel()
+    message = receiver.decode(sender.encode(TeamMessage(KIND_JOIN, 2, stones={"sibur": 40})))
+    assert message.stones == {"sibur": MAX_STONE_COUNT}
+
+def test_replays_and_older_messages_are_dropped():
+    time = FakeTime()
+    sender, receiver = channel(time=time), channel()
+    first = sender.encode(beacon())
+    second = sender.encode(beacon())
+    assert receiver.decode(second) is not None
+    assert receiver.decode(second) is None
+    assert receiver.decode(first) is None
+
+def test_sequence_wraps_around():
+    sender, receiver = channel(), channel()
+    sender.seq = SEQ_MODULO - 2
+    assert receiver.decode(sender.encode(beacon())).seq == SEQ_MODULO - 1
+    assert receiver.decode(sender.encode(beacon())).seq == 0
+
+def test_own_messages_are_ignored():
+    sender = channel()
+    assert sender.decode(sender.encode(beacon())) is None
+
+def test_other_teams_and_forgeries_are_dropped():
+    sender = channel()
+    text = sender.encode(beacon())
+    assert channel("team2:secret").decode(text) is None
+    data = bytearray(base64.urlsafe_b64decode(text))
+    receiver = channel()
+    for index in range(len(data)):
+        forged = bytearray(data)
+        forged[index] ^= 0x01
+        assert receiver.decode(base64.urlsafe_b64encode(forged).decode('ascii')) is None
+    assert receiver.decode(text) is not None
+
+def test_garbage_is_dropped():
+    receiver = channel()
+    assert receiver.decode("hello") is None
+    assert receiver.decode("!" * 32) is None
+    # Characters outside the alphabet, the right length once they are skipped or not
+    assert receiver.decode("A" * 28 + "!!!!") is None
+    assert receiver.decode(channel().encode(beacon())[:-4] + "!!!!") is None
+    assert receiver.decode("") is None
+
+def test_rate_limit_refills_in_server_time():
+    time = FakeTime()
+    sender = channel(time=time)
+    for _ in range(BURST):
+        assert sender.encode(beacon()) is not None
+    assert sender.encode(beacon()) is None
+    time.seconds += REFILL_UNITS / sender.clock.frequency
+    assert sender.encode(beacon()) is not None
+    assert sender.encode(beacon()) is None
+
+def test_agents_get_authentic_broadcasts_with_their_direction(monkeypatch):
+    received = []
+    monkeypatch.setattr(OfflineAgent, "on_team_message",
+                        lambda self, message, direction, state: received.append((message.level, direction)))
+    agent = OfflineAgent(TEAM_KEY)
+    text = channel().encode(beacon(level=4))
+    agent.feed(f"message 3, {text}", f"message 3, {text}", "message 5, hello", "message x, broken")
+    assert received == [(4, 3)]
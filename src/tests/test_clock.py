@@ -0,0 +1,102 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_clock
+##
+
+import pytest
+from zappy import FOOD_UNITS
+from zappy.clock import ServerClock, DEFAULT_FREQUENCY, MAX_POLL_UNITS, SETTLED_ERROR, UNSETTLED_ERROR
+
+class WallTime:
+    def __init__(self) -> None:
+        self.seconds = 0.0
+
+    def __call__(self) -> float:
+        return self.seconds
+
+def clock_at(time: WallTime) -> ServerClock:
+    return ServerClock(now=time)
+
+def answer(clock: ServerClock, time: WallTime, command: str, seconds: float, success: bool = True) -> None:
+    sent_at = time.seconds
+    time.seconds += seconds
+    clock.on_reply(command, sent_at, success)
+
+def test_the_first_sample_sets_the_frequency():
+    time = WallTime()
+    clock = clock_at(time)
+    assert clock.frequency == DEFAULT_FREQUENCY
+    answer(clock, time, "Forward", 7 / 50)
+    assert clock.frequency == pytest.approx(50)
+    assert clock.units == 7
+
+def test_samples_converge_on_the_server_frequency():
+    time = WallTime()
+    clock = clock_at(time)
+    for _ in range(40):
+        answer(clock, time, "Look", 7 / 200)
+    assert clock.frequency == pytest.approx(200)
+    assert clock.relative_error() == SETTLED_ERROR
+    assert clock_at(time).relative_error() == UNSETTLED_ERROR
+
+def test_short_and_bunched_answers_are_not_sampled():
+    time = WallTime()
+    clock = clock_at(time)
+    answer(clock, time, "Inventory", 0.5) # one time unit: mostly round trip
+    answer(clock, time, "Forward", 0.0)   # read along with the previous answer
+    assert clock.samples == 0 and clock.frequency == DEFAULT_FREQUENCY
+    assert clock.units == 8
+
+def test_queued_commands_count_from_the_previous_answer():
+    time = WallTime()
+    clock = clock_at(time)
+    sent_at = time.seconds
+    time.seconds = 7 / 100
+    clock.on_reply("Forward", sent_at, True)
+    time.seconds = 14 / 100
+    clock.on_reply("Forward", sent_at, True) # sent with the first, started after it
+    assert clock.frequency == pytest.approx(100)
+
+def test_refused_incantations_are_not_sampled():
+    time = WallTime()
+    clock = clock_at(time)
+    answer(clock, time, "Incantation", 0.01, success=False)
+    assert clock.samples == 0
+    answer(clock, time, "Incantation", 3.0)
+    assert clock.frequency == pytest.approx(100)
+
+def test_food_is_predicted_between_inventories():
+    time = WallTime()
+    clock = clock_at(time)
+    assert clock.predicted_food() is None
+    clock.on_inventory(10)
+    time.seconds += 3 * FOOD_UNITS / DEFAULT_FREQUENCY
+    assert clock.predicted_food() == 7
+    assert clock.predicted_life() == pytest.approx(7 * FOOD_UNITS)
+    clock.on_reply("Take food", time.seconds, True)
+    assert clock.predicted_food() == 8
+    clock.on_reply("Set food", time.seconds, True)
+    clock.on_reply("Take food", time.seconds, False)
+    assert clock.predicted_food() == 7
+    time.seconds += 100 * FOOD_UNITS / DEFAULT_FREQUENCY
+    assert clock.predicted_food() == 0
+
+def test_inventory_is_polled_near_thresholds_or_when_stale():
+    time = WallTime()
+    clock = clock_at(time)
+    assert clock.should_poll_inventory([])
+    clock.on_inventory(20)
+    assert not clock.should_poll_inventory([5 * FOOD_UNITS])
+    assert clock.should_poll_inventory([20 * FOOD_UNITS])
+    time.seconds += MAX_POLL_UNITS / DEFAULT_FREQUENCY
+    assert clock.should_poll_inventory([])
+
+def test_the_error_bound_grows_with_time():
+    time = WallTime()
+    clock = clock_at(time)
+    clock.on_inventory(10)
+    assert clock.uncertainty() == FOOD_UNITS
+    time.seconds += 1.0
+    assert clock.uncertainty() == pytest.approx(FOOD_UNITS + DEFAULT_FREQUENCY * UNSETTLED_ERROR)
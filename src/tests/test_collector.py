@@ -0,0 +1,37 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_collector
+##
+
+from zappy.vision import Vision
+from zappy.planner import MOVE_TIME
+from zappy.collector import plan_collection, TAKE_TIME
+
+ROW = Vision.parse("[player, food, linemate, sibur]")
+# One stone on each of six tiles: more stops than the exhaustive search covers
+SCATTERED = Vision.parse("[player, linemate, , deraumere, sibur, , mendiane, phiras, thystame]")
+STONES = ("linemate", "deraumere", "sibur", "mendiane", "phiras", "thystame")
+
+def test_collects_several_tiles_in_one_pass():
+    plan = plan_collection(ROW, {"linemate": 1, "sibur": 1})
+    assert plan.commands == ["Forward", "Take linemate", "Right", "Forward", "Take sibur"]
+    assert plan.taken == {"linemate": 1, "sibur": 1}
+    assert plan.time == 3 * MOVE_TIME + 2 * TAKE_TIME
+
+def test_budget_limits_the_stops():
+    plan = plan_collection(ROW, {"linemate": 1, "sibur": 1}, budget=MOVE_TIME + TAKE_TIME)
+    assert plan.commands == ["Forward", "Take linemate"]
+
+def test_nothing_to_collect():
+    assert not plan_collection(ROW, {})
+    assert not plan_collection(ROW, {"thystame": 2})
+    assert not plan_collection(Vision(), {"food": 1})
+
+def test_stops_past_the_exhaustive_search_are_inserted():
+    wanted = dict.fromkeys(STONES, 1)
+    plan = plan_collection(SCATTERED, wanted, budget=1000)
+    assert plan.taken == wanted
+    plan = plan_collection(SCATTERED, wanted, budget=60)
+    assert plan.time <= 60 and len(plan.taken) == 3
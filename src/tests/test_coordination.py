@@ -0,0 +1,112 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_coordination
+##
+
+from zappy.clock import ServerClock
+from zappy.parsing import parse_inventory, parse_look
+from zappy.broadcast import BroadcastChannel, TeamMessage, KIND_INCANTATION, KIND_JOIN, KIND_DISBAND
+from zappy.coordination import Gathering, LEADER_TIMEOUT_UNITS, MAX_HOPS_PER_BEACON
+from tests.conftest import OfflineAgent, TEAM_NAME
+
+FED = "[food 20, linemate 0, deraumere 0, sibur 0, mendiane 0, phiras 0, thystame 0]"
+
+def beacon(rendezvous: int, sender: int, level: int = 2, players: int = 1) -> TeamMessage:
+    return TeamMessage(KIND_INCANTATION, level, players, rendezvous=rendezvous, sender=sender)
+
+def leader(rendezvous: int = 500, inventory: str = FED) -> OfflineAgent:
+    agent = OfflineAgent()
+    parse_inventory(inventory, agent)
+    agent.level = 2
+    agent.gathering.lead(2, rendezvous, agent.broadcasts.sender)
+    return agent
+
+def broadcasts(agent: OfflineAgent) -> list[TeamMessage]:
+    channel = BroadcastChannel(TEAM_NAME, ServerClock())
+    return [channel.decode(pending.command.partition(' ')[2])
+            for pending in agent.scheduler.pending if pending.name == "Broadcast"]
+
+def test_the_lowest_key_wins():
+    gathering = Gathering()
+    gathering.lead(2, 500, 9)
+    assert gathering.outranked_by(beacon(400, 99))
+    assert gathering.outranked_by(beacon(500, 8))
+    assert not gathering.outranked_by(beacon(500, 10))
+    assert not gathering.outranked_by(beacon(600, 1))
+
+def test_followers_walk_a_few_hops_per_beacon():
+    gathering = Gathering()
+    gathering.follow(beacon(500, 9), (1, 0), now=0.0)
+    assert gathering.following and gathering.is_from_leader(beacon(500, 9))
+    assert [gathering.next_hop() for _ in range(MAX_HOPS_PER_BEACON + 1)] == \
+        [(1, 0)] * MAX_HOPS_PER_BEACON + [None]
+    gathering.heard(None, now=1.0)
+    assert gathering.arrived and gathering.next_hop() is None
+    assert not gathering.leader_lost(1.0 + LEADER_TIMEOUT_UNITS / 100, frequency=100)
+    assert gathering.leader_lost(1.0 + (LEADER_TIMEOUT_UNITS + 1) / 100, frequency=100)
+
+def test_a_leader_leading_again_keeps_its_rendezvous():
+    gathering = Gathering()
+    gathering.lead(2, 500, 9)
+    gathering.reset()
+    assert gathering.last_led(2) == 500
+    assert gathering.last_led(3) == 0
+
+def test_an_outranked_leader_disbands_then_follows():
+    agent = leader(500)
+    agent.on_team_message(beacon(400, 7), 3, agent)
+    assert agent.gathering.following and agent.gathering.rendezvous == 400
+    [disband] = broadcasts(agent)
+    assert (disband.kind, disband.rendezvous) == (KIND_DISBAND, 500)
+
+def test_a_leader_ignores_the_leaders_it_outranks():
+    agent = leader(500)
+    agent.on_team_message(beacon(600, 7), 3, agent)
+    assert agent.gathering.leading and agent.gathering.rendezvous == 500
+    assert not broadcasts(agent)
+
+def test_leaders_count_their_followers():
+    agent = leader(500)
+    agent.on_team_message(TeamMessage(KIND_JOIN, 2, rendezvous=500, sender=7), 1, agent)
+    agent.on_team_message(TeamMessage(KIND_JOIN, 2, rendezvous=600, sender=8), 1, agent)
+    assert agent.gathering.followers == {7}
+
+def test_followers_only_listen_to_their_leader_disbanding():
+    agent = OfflineAgent()
+    parse_inventory(FED, agent)
+    agent.level = 2
+    agent.on_team_message(beacon(500, 7), 3, agent)
+    assert agent.gathering.following
+    agent.on_team_message(TeamMessage(KIND_DISBAND, 2, rendezvous=500, sender=8), 3, agent)
+    assert agent.gathering.following
+    agent.on_team_message(TeamMessage(KIND_DISBAND, 2, rendezvous=500, sender=7), 3, agent)
+    assert not agent.gathering.role
+
+def test_a_leader_short_of_stones_calls_it_off():
+    # Someone took the stones of the rendezvous tile, we hold none to set again
+    agent = leader(500)
+    parse_look("[player, food, , ]", agent)
+    assert not agent._elevate()
+    assert not agent.gathering.role
+    [disband] = broadcasts(agent)
+    assert (disband.kind, disband.rendezvous) == (KIND_DISBAND, 500)
+
+def test_a_leader_without_vision_stays_on_its_rendezvous():
+    agent = leader(500)
+    # The map remembers a linemate we miss, one tile ahead
+    parse_look("[player, , linemate, ]", agent)
+    agent.reset_vision()
+    assert not agent._recall_world_map()
+    agent.gathering.reset()
+    assert agent._recall_world_map()
+
+def test_no_rendezvous_without_the_food_to_wait_for_it():
+    agent = OfflineAgent()
+    parse_inventory("[food 9, linemate 1, deraumere 1, sibur 1, mendiane 0, phiras 0, thystame 0]", agent)
+    agent.level = 2
+    parse_look("[player, food, , ]", agent)
+    assert agent._elevate()
+    assert not agent.gathering.role
+    assert "Take food" in agent.action_plan
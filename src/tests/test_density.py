@@ -0,0 +1,86 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_density
+##
+
+import pytest
+from zappy.vision import Vision
+from zappy.world_map import WorldMap, STALE_HALF_LIFE
+from zappy.density import (DensityMap, PRIOR_DENSITY, SMOOTHING, REBASE_AGE, TEAMMATE_MEMORY,
+                           TEAMMATE_PENALTY, REGION_SIDE)
+
+def maps(width: int = 10, height: int = 10) -> tuple[WorldMap, DensityMap]:
+    """
+    A world map posed so a level 1 cone stays in the first region, and its density map.
+    """
+    world_map = WorldMap(width, height)
+    world_map.x, world_map.y = 1, 2
+    density = DensityMap()
+    density.resize(world_map.width, world_map.height)
+    return world_map, density
+
+def look(world_map: WorldMap, density: DensityMap, answer: str) -> None:
+    vision = Vision.parse(answer)
+    density.observe(world_map, vision)
+    world_map.fold_vision(vision)
+
+def test_regions_cover_the_frame():
+    _, density = maps()
+    assert (density.columns, density.rows) == (3, 3)
+    assert list(density.region_tiles) == [16, 16, 8, 16, 16, 8, 8, 8, 4]
+    assert density._region(9, 9) == 8 and density._region(REGION_SIDE, 0) == 1
+
+def test_looks_are_blended_into_the_region():
+    world_map, density = maps()
+    look(world_map, density, "[, food, food, linemate]")
+    assert density.expected_yield(0, {"food": 1.0}, world_map.time, 1.0) == pytest.approx(0.5)
+    assert density.expected_yield(0, {"linemate": 1.0}, world_map.time, 1.0) == pytest.approx(0.25)
+    look(world_map, density, "[, , , ]")
+    assert density.expected_yield(0, {"food": 1.0}, world_map.time, 1.0) == pytest.approx(0.5 * (1 - SMOOTHING))
+
+def test_estimates_decay_back_to_the_prior():
+    world_map, density = maps()
+    look(world_map, density, "[, , , ]")
+    prior = PRIOR_DENSITY["food"]
+    assert density.expected_yield(0, {"food": 1.0}, world_map.time, 1.0) == 0.0
+    world_map.tick(STALE_HALF_LIFE)
+    assert density.expected_yield(0, {"food": 1.0}, world_map.time, 1.0) == pytest.approx(prior / 2)
+    # Never seen: what the server spawns
+    assert density.expected_yield(4, {"food": 1.0}, world_map.time, 1.0) == pytest.approx(prior)
+
+def test_seen_tiles_become_unknown_again():
+    world_map, density = maps()
+    look(world_map, density, "[, , , ]")
+    assert density._unknown_tiles(world_map.time)[0] == pytest.approx(12)
+    world_map.tick(STALE_HALF_LIFE)
+    assert density._unknown_tiles(world_map.time)[0] == pytest.approx(14)
+    # Looking at the same cells again replaces their sight
+    look(world_map, density, "[, , , ]")
+    assert density._unknown_tiles(world_map.time)[0] == pytest.approx(12)
+
+def test_rebasing_keeps_the_sight():
+    world_map, density = maps()
+    look(world_map, density, "[, , , ]")
+    world_map.tick(REBASE_AGE)
+    unknown = density._unknown_tiles(world_map.time)[0]
+    assert density.epoch == world_map.time
+    assert unknown == pytest.approx(16 - 4 * 0.5 ** (REBASE_AGE / STALE_HALF_LIFE))
+    world_map.tick(STALE_HALF_LIFE)
+    assert 16 - density._unknown_tiles(world_map.time)[0] == pytest.approx((16 - unknown) / 2)
+
+def test_teammates_heard_make_their_direction_worth_less():
+    _, density = maps()
+    density.heard_teammate((1, 0), now=0)
+    assert density._crowding(3, 0, now=0) == pytest.approx(1 - TEAMMATE_PENALTY)
+    assert density._crowding(-3, 0, now=0) == 1.0
+    assert density._crowding(3, 0, now=TEAMMATE_MEMORY // 2) == pytest.approx(1 - TEAMMATE_PENALTY / 2)
+    assert density._crowding(3, 0, now=TEAMMATE_MEMORY) == 1.0
+
+def test_exploration_leaves_the_ground_just_swept():
+    world_map, density = maps()
+    look(world_map, density, "[, , , ]")
+    x, y = density.target(world_map, {"food": 1.0})
+    assert density._region(x, y) != 0
+    assert density.target(world_map, {}) is None
@@ -0,0 +1,47 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_forkserver
+##
+
+import os
+import socket
+import argparse
+import pytest
+from zappy.forkserver import ForkedAgent, DEFAULT_SOCKET
+from tests.conftest import TEAM_NAME
+
+@pytest.fixture
+def forked():
+    """
+    A connected ForkedAgent, the server's end of its socket and the requester's end of its answers.
+    """
+    listener = socket.create_server(("127.0.0.1", 0))
+    host, port = listener.getsockname()
+    settings = argparse.Namespace(host=host, port=port, name=TEAM_NAME, team_key=None, reconnects=0,
+                                  socket=DEFAULT_SOCKET)
+    requester, answers = socket.socketpair()
+    agent = ForkedAgent(settings, requested_at=0.0, requester=requester)
+    agent.connect_to_server()
+    peer, _ = listener.accept()
+    listener.close()
+    answers.setblocking(False)
+    yield agent, peer, answers
+    agent.close_sock()
+    peer.close()
+    answers.close()
+
+def test_ready_is_reported_once_the_team_name_is_sent(forked):
+    agent, peer, answers = forked
+    peer.sendall(b"WELCOME\n")
+    assert agent.read_from_server() == "WELCOME"
+    agent.send_command_immediately(TEAM_NAME)
+    # Only buffered so far
+    with pytest.raises(BlockingIOError):
+        answers.recv(64)
+    peer.sendall(b"1\n10 10\n")
+    assert agent.read_from_server() == "1"
+    assert peer.recv(64) == f"{TEAM_NAME}\n".encode()
+    assert answers.recv(64).startswith(f"ready {os.getpid()} ".encode())
+    assert agent.requested_at is None and agent.requester is None
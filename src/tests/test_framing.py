@@ -0,0 +1,88 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_framing
+##
+
+import socket
+import asyncio
+from zappy.framing import LineFramer
+from zappy.mock_server import MockServer
+
+def test_partial_line_waits_for_its_newline():
+    framer = LineFramer()
+    assert framer.feed(b"Elevation und") == []
+    assert len(framer) == len("Elevation und")
+    assert framer.feed(b"erway") == []
+    assert framer.feed(b"\n") == ["Elevation underway"]
+    assert len(framer) == 0
+
+def test_several_lines_in_one_chunk():
+    framer = LineFramer()
+    assert framer.feed(b"ok\nko\n[food 3, linemate 1]\nmess") == ["ok", "ko", "[food 3, linemate 1]"]
+    assert framer.feed(b"age 2, hello\n") == ["message 2, hello"]
+
+def test_empty_lines_are_kept():
+    assert LineFramer().feed(b"\n\nok\n") == ["", "", "ok"]
+
+def test_multibyte_character_split_across_chunks():
+    data = "message 1, é\n".encode('utf-8')
+    framer = LineFramer()
+    assert framer.feed(data[:-2]) == []
+    assert framer.feed(data[-2:]) == ["message 1, é"]
+
+def test_buffer_is_compacted_then_grown():
+    framer = LineFramer(capacity=8)
+    assert framer.feed(b"ok\nabcde") == ["ok"]
+    # Compacted: the partial line moves to the front of the buffer
+    assert framer.feed(b"fg\n") == ["abcdefg"]
+    # Grown: a single line longer than the buffer
+    line = b"x" * 50
+    assert framer.feed(line[:30]) == []
+    assert framer.feed(line[30:] + b"\nok\n") == [line.decode(), "ok"]
+
+def test_recv_from_a_socket():
+    left, right = socket.socketpair()
+    with left, right:
+        framer = LineFramer()
+        right.sendall(b"WELCOME\n3\n10 1")
+        assert framer.recv_from(left) == ["WELCOME", "3"]
+        right.sendall(b"0\n")
+        assert framer.recv_from(left) == ["10 10"]
+        right.close()
+        assert framer.recv_from(left) is None
+
+def _read_lines(sock: socket.socket, framer: LineFramer, count: int) -> list[str]:
+    lines = []
+    while len(lines) < count:
+        received = framer.recv_from(sock)
+        assert received is not None, "connection closed"
+        lines.extend(received)
+    return lines
+
+def _play(port: int) -> list[str]:
+    framer = LineFramer()
+    with socket.create_connection(("127.0.0.1", port), timeout=5) as sock:
+        lines = _read_lines(sock, framer, 1)
+        sock.sendall(b"team1\n")
+        lines += _read_lines(sock, framer, 2)
+        sock.sendall(b"Look\nInventory\nForward\n")
+        return lines + _read_lines(sock, framer, 3)
+
+def test_mock_server_session():
+    async def session() -> list[str]:
+        server = MockServer(width=12, height=8, teams=["team1"], freq=1000, seed=1)
+        port = await server.start()
+        try:
+            return await asyncio.to_thread(_play, port)
+        finally:
+            await server.stop()
+
+    welcome, slots, size, look, inventory, forward = asyncio.run(session())
+    assert welcome == "WELCOME"
+    assert int(slots) >= 0
+    assert size == "12 8"
+    assert look.startswith("[player") and look.endswith("]")
+    assert inventory.startswith("[food ")
+    assert forward == "ok"
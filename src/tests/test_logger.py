@@ -0,0 +1,82 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_logger
+##
+
+import json
+import random
+import logging
+import pytest
+from zappy.logger import SamplingFilter, configure_logging, stop_logging, trace, TRACE_LOGGER_NAME
+
+RECORDS = 4000
+PACKAGE_LOGGER = "zappy.logger"
+
+@pytest.fixture
+def logging_restored():
+    """
+    Put the package and trace loggers back as the import left them.
+    """
+    package = logging.getLogger(PACKAGE_LOGGER)
+    traces = logging.getLogger(TRACE_LOGGER_NAME)
+    saved = (list(package.handlers), package.level, list(traces.handlers), traces.level, traces.propagate)
+    yield
+    stop_logging()
+    package.handlers[:], package.level, traces.handlers[:], traces.level, traces.propagate = saved
+
+def record(name: str = TRACE_LOGGER_NAME) -> logging.LogRecord:
+    return logging.LogRecord(name, logging.INFO, __file__, 0, "rx", None, None)
+
+def read_trace(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+def test_sampling_keeps_about_the_rate():
+    random.seed(1)
+    sampling = SamplingFilter(0.25)
+    kept = sum(sampling.filter(record()) for _ in range(RECORDS))
+    assert kept == pytest.approx(RECORDS / 4, rel=0.1)
+
+def test_sampling_at_the_bounds_is_exact():
+    assert all(SamplingFilter(1.0).filter(record()) for _ in range(100))
+    assert not any(SamplingFilter(0.0).filter(record()) for _ in range(100))
+
+def test_tracing_is_off_by_default(logging_restored, tmp_path):
+    configure_logging("INFO")
+    assert not logging.getLogger(TRACE_LOGGER_NAME).isEnabledFor(logging.INFO)
+    trace("rx", line="ok")
+    stop_logging()
+    assert not list(tmp_path.iterdir())
+
+def test_traces_are_json_lines(logging_restored, tmp_path):
+    path = tmp_path / "trace.jsonl"
+    configure_logging("INFO", trace_path=str(path))
+    trace("tx", line="Forward", in_flight=1)
+    trace("rx", line="ok")
+    logging.getLogger(PACKAGE_LOGGER).info("not a trace")
+    stop_logging()
+    entries = read_trace(path)
+    assert [(entry["event"], entry["line"]) for entry in entries] == [("tx", "Forward"), ("rx", "ok")]
+    assert entries[0]["in_flight"] == 1
+    assert entries[0]["mono"] <= entries[1]["mono"]
+
+def test_traces_are_sampled(logging_restored, tmp_path):
+    random.seed(2)
+    path = tmp_path / "trace.jsonl"
+    configure_logging("INFO", trace_path=str(path), trace_sample=0.1)
+    for _ in range(RECORDS):
+        trace("rx", line="ok")
+    stop_logging()
+    assert len(read_trace(path)) == pytest.approx(RECORDS / 10, rel=0.2)
+
+def test_reconfiguring_does_not_pile_handlers(logging_restored, tmp_path):
+    for attempt in range(3):
+        configure_logging("DEBUG", trace_path=str(tmp_path / f"{attempt}.jsonl"))
+    assert len(logging.getLogger(PACKAGE_LOGGER).handlers) == 1
+    assert len(logging.getLogger(TRACE_LOGGER_NAME).handlers) == 1
+    trace("rx", line="ok")
+    stop_logging()
+    assert len(read_trace(tmp_path / "2.jsonl")) == 1
+    configure_logging("INFO")
+    assert not logging.getLogger(TRACE_LOGGER_NAME).handlers
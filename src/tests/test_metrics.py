@@ -0,0 +1,83 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_metrics
+##
+
+from zappy.metrics import Metrics, MetricFamily, Counter, Gauge, Histogram, StatsFileExporter
+from tests.conftest import OfflineAgent
+
+def samples(text: str) -> dict[str, float]:
+    """
+    The samples of a Prometheus text exposition, by name and labels.
+    """
+    values = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, _, value = line.rpartition(" ")
+            values[name] = float(value)
+    return values
+
+def test_families_start_with_help_and_type():
+    family = MetricFamily("zappy_things_total", "counter", "Things.", Counter)
+    family.labels().inc()
+    assert family.render() == ["# HELP zappy_things_total Things.", "# TYPE zappy_things_total counter",
+                               "zappy_things_total 1"]
+
+def test_labels_are_sorted_and_quoted():
+    family = MetricFamily("zappy_latency", "gauge", "Latency.", Gauge)
+    family.labels(command="Look", agent="2").set(0.5)
+    assert family.render()[-1] == 'zappy_latency{agent="2",command="Look"} 0.5'
+    assert family.labels(agent="2", command="Look") is family.labels(command="Look", agent="2")
+
+def test_histogram_buckets_are_cumulative():
+    family = MetricFamily("zappy_wait_seconds", "histogram", "Waits.", lambda: Histogram((0.1, 1.0)))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        family.labels(command="Look").observe(value)
+    assert family.render()[2:] == [
+        'zappy_wait_seconds_bucket{command="Look",le="0.1"} 2',
+        'zappy_wait_seconds_bucket{command="Look",le="1.0"} 3',
+        'zappy_wait_seconds_bucket{command="Look",le="+Inf"} 4',
+        'zappy_wait_seconds_sum{command="Look"} 3.65',
+        'zappy_wait_seconds_count{command="Look"} 4',
+    ]
+
+def test_the_exposition_ends_with_a_newline():
+    text = Metrics().render()
+    assert text.endswith("\n") and not text.endswith("\n\n")
+    assert "# TYPE zappy_commands_in_flight gauge" in text
+
+def test_commands_are_counted_by_name(agent):
+    agent.metrics = Metrics()
+    agent.send_command("Take food")
+    agent.send_command("Look")
+    agent.feed("ko", "[player]")
+    values = samples(agent.metrics.render())
+    assert values['zappy_commands_sent_total{command="Take"}'] == 1
+    assert values['zappy_command_failures_total{command="Take"}'] == 1
+    assert values['zappy_command_latency_seconds_count{command="Look"}'] == 1
+
+def test_commands_in_flight_are_summed_over_the_agents():
+    metrics = Metrics()
+    first, second = OfflineAgent(), OfflineAgent()
+    first.metrics = second.metrics = metrics
+    first.send_command("Look")
+    first.send_command("Forward")
+    second.send_command("Inventory")
+    assert metrics.in_flight.labels().value == 3
+    first.feed("[player]")
+    assert metrics.in_flight.labels().value == 2
+    # An agent leaving takes its commands out of the sum
+    first.close_sock()
+    assert metrics.in_flight.labels().value == 1
+    second.feed("[food 10, linemate 0, deraumere 0, sibur 0, mendiane 0, phiras 0, thystame 0]")
+    assert metrics.in_flight.labels().value == 0
+
+def test_stats_files_hold_the_exposition(tmp_path):
+    metrics = Metrics()
+    metrics.decisions.labels().inc(3)
+    path = tmp_path / "stats.prom"
+    StatsFileExporter(metrics, str(path)).write()
+    assert samples(path.read_text())["zappy_decisions_total"] == 3
+    assert not (tmp_path / "stats.prom.tmp").exists()
@@ -0,0 +1,71 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_peephole
+##
+
+import pytest
+from zappy.peephole import fold_turns, optimize, MAX_TRUSTED_AGE
+from zappy.world_map import WorldMap
+from tests.conftest import OfflineAgent
+
+# Our tile holds food and a linemate, the one ahead is empty
+LOOK_ANSWER = "[player food linemate,linemate,,food]"
+
+@pytest.fixture
+def looked(agent: OfflineAgent) -> OfflineAgent:
+    agent.send_command("Look")
+    agent.feed(LOOK_ANSWER)
+    return agent
+
+def test_turns_are_folded():
+    assert fold_turns(["Right", "Left", "Forward"]) == ["Forward"]
+    assert fold_turns(["Left", "Left", "Left", "Take food"]) == ["Right", "Take food"]
+    assert fold_turns(["Forward", "Right", "Right", "Right", "Right"]) == ["Forward"]
+    assert fold_turns(["Right", "Right"]) == ["Left", "Left"]
+
+def test_takes_follow_what_the_map_saw(looked):
+    plan = ["Take food", "Take food", "Take sibur", "Take linemate", "Forward", "Take linemate"]
+    assert optimize(plan, looked.world_map, looked.level) == ["Take food", "Take linemate", "Forward"]
+
+def test_takes_are_kept_on_cells_not_seen_recently(looked):
+    assert optimize(["Take sibur"], WorldMap(10, 10), 1) == ["Take sibur"]
+    for _ in range(MAX_TRUSTED_AGE + 1):
+        looked.world_map.tick()
+    assert optimize(["Take sibur"], looked.world_map, looked.level) == ["Take sibur"]
+
+def test_looks_are_dropped_while_the_previous_one_holds(looked):
+    assert optimize(["Look", "Forward", "Look"], looked.world_map, 1, pending=["Look"]) == ["Forward", "Look"]
+    assert optimize(["Look", "Inventory", "Look"], looked.world_map, 1) == ["Look", "Inventory"]
+    assert optimize(["Look", "Take food", "Look"], looked.world_map, 1) == ["Look", "Take food", "Look"]
+
+def test_pending_commands_move_us_first(looked):
+    assert optimize(["Take food"], looked.world_map, 1, pending=["Forward"]) == []
+    assert optimize(["Take food"], looked.world_map, 1, pending=["Take food"]) == []
+
+def test_sets_stop_once_the_cell_holds_what_the_level_needs(looked):
+    # Level 1 needs one linemate, our tile has it already
+    assert optimize(["Set linemate"], looked.world_map, 1) == []
+    assert optimize(["Set linemate"], looked.world_map, 2) == []
+    # Level 3 needs two
+    assert optimize(["Set linemate", "Set linemate"], looked.world_map, 3) == ["Set linemate"]
+    assert optimize(["Set sibur", "Set sibur"], looked.world_map, 2) == ["Set sibur"]
+    # Not needed by the level: kept
+    assert optimize(["Set food"], looked.world_map, 1) == ["Set food"]
+
+def test_only_turns_are_folded_after_an_incantation(looked):
+    plan = ["Take sibur", "Incantation", "Take sibur", "Right", "Right", "Right"]
+    assert optimize(plan, looked.world_map, 1) == ["Incantation", "Take sibur", "Left"]
+
+def test_optimize_action_plan_starts_after_the_commands_in_flight(looked):
+    looked.send_command("Look")
+    looked.action_plan = ["Look", "Left", "Right", "Take sibur", "Take food", "Forward"]
+    looked.optimize_action_plan()
+    assert looked.action_plan == ["Take food", "Forward"]
+
+def test_a_failed_take_keeps_the_rest_of_the_collection(looked):
+    looked.send_command("Take linemate")
+    looked.action_plan = ["Take linemate", "Right", "Take food", "Forward"]
+    looked.feed("ko")
+    assert looked.action_plan == ["Right", "Take food", "Forward"]
@@ -0,0 +1,77 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_planner
+##
+
+from collections import deque
+from zappy import ORIENTATIONS
+from zappy.planner import plan_route, plan_relative, route_time, MOVE_TIME
+
+NORTH, EAST, SOUTH, WEST = range(4)
+
+def walk(route: tuple[str, ...], orientation: int, width: int, height: int) -> tuple[int, int]:
+    x = y = 0
+    for command in route:
+        if command == "Left":
+            orientation = (orientation - 1) % 4
+        elif command == "Right":
+            orientation = (orientation + 1) % 4
+        else:
+            dx, dy = ORIENTATIONS[orientation]
+            x, y = (x + dx) % width, (y + dy) % height
+    return x, y
+
+def shortest_lengths(orientation: int, width: int, height: int) -> dict[tuple[int, int], int]:
+    """
+    Fewest commands to reach every cell of the torus, by breadth-first search.
+    """
+    lengths = {(0, 0): 0}
+    seen = {(0, 0, orientation)}
+    queue = deque([(0, 0, orientation, 0)])
+    while queue:
+        x, y, facing, length = queue.popleft()
+        dx, dy = ORIENTATIONS[facing]
+        for state in (((x + dx) % width, (y + dy) % height, facing),
+                      (x, y, (facing - 1) % 4), (x, y, (facing + 1) % 4)):
+            if state not in seen:
+                seen.add(state)
+                lengths.setdefault(state[:2], length + 1)
+                queue.append((*state, length + 1))
+    return lengths
+
+def test_straight_ahead():
+    assert plan_route(0, -3, NORTH) == ("Forward",) * 3
+    assert plan_route(0, 0, WEST) == ()
+
+def test_turning_around():
+    assert plan_route(0, 2, NORTH) == ("Left", "Left", "Forward", "Forward")
+
+def test_wraps_around_the_shorter_way():
+    assert plan_route(8, 0, EAST, 10, 10) == ("Left", "Left", "Forward", "Forward")
+    assert plan_route(0, 2, NORTH, 4, 4) == ("Forward", "Forward")
+    # Without the world size, no wrap-around is assumed
+    assert len(plan_route(8, 0, EAST)) == 8
+
+def test_walks_the_faced_axis_first():
+    assert plan_route(2, -1, EAST) == ("Forward", "Forward", "Left", "Forward")
+    assert plan_route(2, -1, NORTH) == ("Forward", "Right", "Forward", "Forward")
+
+def test_routes_are_shortest_on_a_torus():
+    width, height = 5, 4
+    for orientation in range(4):
+        lengths = shortest_lengths(orientation, width, height)
+        for dx in range(-width, width + 1):
+            for dy in range(-height, height + 1):
+                route = plan_route(dx, dy, orientation, width, height)
+                assert walk(route, orientation, width, height) == (dx % width, dy % height)
+                assert len(route) == lengths[(dx % width, dy % height)]
+
+def test_relative_targets():
+    assert plan_relative(1, 0, NORTH) == ("Right", "Forward")
+    assert plan_relative(0, 2, SOUTH) == ("Forward", "Forward")
+    assert plan_relative(-1, 1, EAST) == ("Forward", "Left", "Forward")
+
+def test_route_time():
+    assert route_time(("Left", "Forward")) == 2 * MOVE_TIME
@@ -0,0 +1,179 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_scheduler
+##
+
+from zappy.scheduler import (CommandScheduler, PendingCommand, MAX_IN_FLIGHT, ELEVATION_UNITS,
+                             MAX_ELEVATION_UNITS, REPLY_OK, REPLY_LOOK, REPLY_INVENTORY,
+                             REPLY_SLOTS, REPLY_ELEVATION)
+
+from tests.conftest import ServerTime
+
+LOOK_ANSWER = "[player food, linemate, , ]"
+
+def scheduler_with(*commands: str, time: ServerTime | None = None) -> CommandScheduler:
+    scheduler = CommandScheduler(now=time or ServerTime())
+    for command in commands:
+        scheduler.push(command)
+    return scheduler
+
+def test_reply_kind_follows_the_command_name():
+    assert PendingCommand("Forward", 0.0).reply == REPLY_OK
+    assert PendingCommand("Take food", 0.0).reply == REPLY_OK
+    assert PendingCommand("Broadcast some text", 0.0).reply == REPLY_OK
+    assert PendingCommand("Look", 0.0).reply == REPLY_LOOK
+    assert PendingCommand("Inventory", 0.0).reply == REPLY_INVENTORY
+    assert PendingCommand("Connect_nbr", 0.0).reply == REPLY_SLOTS
+    assert PendingCommand("Incantation", 0.0).reply == REPLY_ELEVATION
+    assert PendingCommand("Take food", 0.0).name == "Take"
+
+def test_window_is_bounded():
+    scheduler = scheduler_with(*["Forward"] * MAX_IN_FLIGHT)
+    assert scheduler.is_full()
+    assert scheduler.free_slots() == 0
+    assert scheduler.push("Look") is None
+    assert len(scheduler) == MAX_IN_FLIGHT
+
+def test_answers_retire_commands_in_order():
+    scheduler = scheduler_with("Forward", "Look", "Inventory", "Take food")
+    assert scheduler.match("ok").command == "Forward"
+    assert scheduler.match(LOOK_ANSWER).command == "Look"
+    assert scheduler.match("[food 10, linemate 0]").command == "Inventory"
+    assert scheduler.match("ko").command == "Take food"
+    assert not scheduler
+
+def test_events_do_not_answer_commands():
+    scheduler = scheduler_with("Forward")
+    for event in ("message 3, hello", "eject: 2", "dead"):
+        assert scheduler.match(event) is None
+    assert scheduler.is_pending("Forward")
+    assert scheduler.match("ok").command == "Forward"
+
+def test_lines_with_nothing_pending_are_events():
+    scheduler = scheduler_with()
+    assert scheduler.match("ok") is None
+    assert scheduler.match("ko") is None
+    assert not scheduler.elevation_ended
+    assert scheduler.match("Current level: 3") is None
+
+def test_own_incantation_stays_pending_while_underway():
+    time = ServerTime()
+    scheduler = scheduler_with("Incantation", "Forward", time=time)
+    underway = scheduler.match("Elevation underway")
+    assert underway.command == "Incantation" and underway.underway
+    assert len(scheduler) == 2
+    time.units += ELEVATION_UNITS
+    assert scheduler.match("Current level: 2").command == "Incantation"
+    assert scheduler.match("ok").command == "Forward"
+    assert not scheduler.elevations
+
+def test_own_incantation_failing_once_underway():
+    time = ServerTime()
+    scheduler = scheduler_with("Incantation", "Forward", time=time)
+    scheduler.match("Elevation underway")
+    time.units += ELEVATION_UNITS
+    assert scheduler.match("ko").command == "Incantation"
+    assert not scheduler.elevation_ended and not scheduler.elevations
+    assert scheduler.match("ko").command == "Forward"
+
+def test_own_incantation_refused_right_away():
+    scheduler = scheduler_with("Incantation", "Forward")
+    assert scheduler.match("ko").command == "Incantation"
+    assert scheduler.match("ok").command == "Forward"
+
+def test_someone_elses_incantation_succeeding():
+    time = ServerTime()
+    scheduler = scheduler_with("Forward", time=time)
+    assert scheduler.match("Elevation underway") is None
+    time.units += ELEVATION_UNITS
+    assert scheduler.match("Current level: 3") is None
+    assert scheduler.elevation_ended and not scheduler.elevations
+    assert scheduler.match("ok").command == "Forward"
+    assert not scheduler.elevation_ended
+
+def test_someone_elses_incantation_failing():
+    # The ko ends their incantation, it does not answer our Forward
+    time = ServerTime()
+    scheduler = scheduler_with("Forward", time=time)
+    scheduler.match("Elevation underway")
+    time.units += ELEVATION_UNITS
+    assert scheduler.match("ko") is None
+    assert scheduler.elevation_ended
+    assert scheduler.match("ok").command == "Forward"
+
+def test_answers_during_someone_elses_incantation():
+    # Too early to end their ritual: the ko answers our Take
+    time = ServerTime()
+    scheduler = scheduler_with("Take food", "Forward", time=time)
+    scheduler.match("Elevation underway")
+    time.units += 7
+    assert scheduler.match("ko").command == "Take food"
+    assert scheduler.match("ok").command == "Forward"
+    time.units += ELEVATION_UNITS
+    assert scheduler.match("ko") is None and scheduler.elevation_ended
+
+def test_a_ko_never_answers_a_command_that_cannot_fail():
+    # Their ritual ended sooner than our frequency estimate says it could
+    time = ServerTime()
+    scheduler = scheduler_with("Look", "Take food", time=time)
+    scheduler.match("Elevation underway")
+    time.units += 7
+    assert scheduler.match("ko") is None and scheduler.elevation_ended
+    assert scheduler.match(LOOK_ANSWER).command == "Look"
+    assert scheduler.match("ko").command == "Take food"
+
+def test_teammate_ritual_starting_while_ours_is_queued_then_both_end():
+    time = ServerTime()
+    scheduler = scheduler_with("Incantation", "Look", time=time)
+    # Their start arrives first and is taken for ours, then ours starts
+    assert scheduler.match("Elevation underway").command == "Incantation"
+    time.units += 1
+    assert scheduler.match("Elevation underway") is None
+    assert len(scheduler.elevations) == 2
+    time.units += ELEVATION_UNITS - 1
+    assert scheduler.match("Current level: 2").command == "Incantation"
+    time.units += 1
+    assert scheduler.match("ko") is None and scheduler.elevation_ended
+    assert not scheduler.elevations
+    assert scheduler.match(LOOK_ANSWER).command == "Look"
+
+def test_teammate_ritual_starting_while_ours_is_queued_then_ours_refused():
+    time = ServerTime()
+    scheduler = scheduler_with("Incantation", "Forward", time=time)
+    assert scheduler.match("Elevation underway").command == "Incantation"
+    # Refused right away: we already take part in their ritual
+    assert scheduler.match("ko").command == "Incantation"
+    assert scheduler.match("ok").command == "Forward"
+    time.units += ELEVATION_UNITS
+    assert scheduler.match("ko") is None and scheduler.elevation_ended
+
+def test_unmatched_ends_do_not_take_answers():
+    scheduler = scheduler_with("Incantation", "Forward")
+    # A level before our Incantation started is someone else's
+    assert scheduler.match("Current level: 2") is None
+    assert scheduler.match("ko").command == "Incantation"
+    assert scheduler.match("ok").command == "Forward"
+
+def test_starts_without_an_end_are_forgotten():
+    time = ServerTime()
+    scheduler = scheduler_with("Take food", time=time)
+    scheduler.match("Elevation underway")
+    time.units += MAX_ELEVATION_UNITS + 1
+    assert scheduler.match("ko").command == "Take food"
+    assert not scheduler.elevations
+
+def test_someone_else_starting_while_ours_is_underway():
+    scheduler = scheduler_with("Incantation")
+    scheduler.match("Elevation underway")
+    assert scheduler.match("Elevation underway") is None
+    assert len(scheduler.elevations) == 2
+    assert scheduler.is_pending("Incantation")
+
+def test_clear_forgets_everything():
+    scheduler = scheduler_with("Forward", "Look")
+    scheduler.match("Elevation underway")
+    scheduler.clear()
+    assert not scheduler
+    assert not scheduler.elevations and not scheduler.elevation_ended
@@ -0,0 +1,111 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_server
+##
+
+import logging
+from zappy.server import ZappyServer
+from zappy.scheduler import COMMAND_REPLIES, ELEVATION_UNITS
+from tests.conftest import OfflineAgent
+
+LOOK_ANSWER = "[player food linemate,linemate,,food]"
+INVENTORY_ANSWER = "[food 7, linemate 2, deraumere 0, sibur 1, mendiane 0, phiras 0, thystame 0]"
+EAST = 1 # orientations are north, east, south, west
+
+def send(agent: OfflineAgent, *commands: str) -> None:
+    for command in commands:
+        agent.send_command(command)
+
+def test_every_reply_kind_has_a_handler():
+    assert set(COMMAND_REPLIES.values()) <= set(ZappyServer._REPLY_HANDLERS)
+
+def test_events_are_dispatched_on_their_first_word():
+    assert set(ZappyServer._EVENT_HANDLERS) == {"message", "dead", "Elevation", "Current", "eject:", "ko"}
+
+def test_look_and_inventory_answers(agent):
+    send(agent, "Look", "Inventory")
+    agent.feed(LOOK_ANSWER, INVENTORY_ANSWER)
+    assert agent.vision.count(0, "food") == 1 and agent.vision.count(1, "linemate") == 1
+    assert agent.inventory["food"] == 7 and agent.inventory["sibur"] == 1
+    assert not agent.scheduler
+
+def test_moves_follow_the_answers(agent):
+    send(agent, "Forward", "Right", "Forward")
+    agent.feed("ok", "ok")
+    assert agent.scheduler.is_pending("Forward")
+    # North wraps to the last row, then one step east
+    assert (agent.world_map.x, agent.world_map.y, agent.world_map.orientation) == (0, 9, EAST)
+    agent.feed("ok")
+    assert (agent.world_map.x, agent.world_map.y, agent.world_map.orientation) == (1, 9, EAST)
+    assert not agent.scheduler
+
+def test_take_answers_update_the_inventory(agent):
+    send(agent, "Take food", "Take linemate")
+    agent.feed("ok", "ko")
+    assert agent.inventory["food"] == 1
+    assert agent.inventory["linemate"] == 0
+
+def test_free_slots_and_eggs_reach_the_hooks(agent, monkeypatch):
+    calls = []
+    monkeypatch.setattr(OfflineAgent, "on_free_slots", lambda self, slots: calls.append(("slots", slots)))
+    monkeypatch.setattr(OfflineAgent, "on_egg_laid", lambda self: calls.append(("egg",)))
+    send(agent, "Connect_nbr", "Fork", "Connect_nbr")
+    agent.feed("2", "ok", "0")
+    assert calls == [("slots", 2), ("egg",)]
+
+def test_own_incantation(agent):
+    send(agent, "Incantation", "Look")
+    agent.feed("Elevation underway")
+    assert agent.level == 1 and agent.scheduler.is_pending("Incantation")
+    agent.wait(ELEVATION_UNITS)
+    agent.feed("Current level: 2", LOOK_ANSWER)
+    assert agent.level == 2
+    assert not agent.scheduler
+
+def test_elevated_by_someone_else(agent):
+    send(agent, "Forward")
+    agent.feed("Elevation underway")
+    agent.wait(ELEVATION_UNITS)
+    agent.feed("Current level: 2")
+    assert agent.level == 2
+    assert agent.scheduler.is_pending("Forward")
+
+def test_ko_ending_someone_elses_incantation(agent, caplog):
+    send(agent, "Forward")
+    with caplog.at_level(logging.INFO):
+        agent.feed("Elevation underway")
+        agent.wait(ELEVATION_UNITS)
+        agent.feed("ko")
+    assert "The incantation we took part in failed." in caplog.messages
+    assert agent.level == 1 and agent.scheduler.is_pending("Forward")
+
+def test_agents_stay_put_during_someone_elses_incantation(agent):
+    agent.feed("Elevation underway")
+    agent.make_decision()
+    assert [pending.command for pending in agent.scheduler.pending] == ["Look"]
+    assert not agent.action_plan
+    agent.wait(ELEVATION_UNITS)
+    agent.feed("Current level: 2", LOOK_ANSWER)
+    assert not agent.scheduler.elevations
+
+def test_ko_with_nothing_pending_is_unexpected(agent, caplog):
+    agent.feed("ko")
+    assert "Received unexpected 'ko' with no command pending." in caplog.messages
+
+def test_unknown_lines_are_reported(agent, caplog):
+    agent.feed("WELCOME")
+    assert any("unexpected message 'WELCOME'" in message for message in caplog.messages)
+
+def test_ejection_forgets_the_vision(agent):
+    send(agent, "Look")
+    agent.feed(LOOK_ANSWER)
+    revision = agent.vision_revision
+    agent.feed("eject: 3")
+    assert not agent.vision and agent.vision_revision > revision
+
+def test_death(agent):
+    send(agent, "Forward")
+    agent.feed("dead")
+    assert not agent.is_alive
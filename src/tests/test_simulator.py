@@ -0,0 +1,52 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_simulator
+##
+
+import logging
+import pytest
+from zappy.game import GameWorld, RESOURCES
+from zappy.simulator import simulate, Simulation
+from zappy.decision_engine import Tuning
+
+UNITS = 2000 # time units per game, enough for the first elevations
+
+def test_a_seed_always_plays_the_same_game():
+    assert simulate(3, max_units=UNITS) == simulate(3, max_units=UNITS)
+
+def test_the_team_grows_and_levels_up():
+    result = simulate(3, max_units=UNITS)
+    assert result["survival"] == UNITS
+    assert result["players"] > 1
+    assert len(result["levels"]) == result["players"]
+    assert result["max_level"] >= 2
+
+def test_agents_are_capped():
+    result = Simulation(5, max_agents=2).run(UNITS)
+    assert result["players"] <= 2
+
+def test_tuning_changes_the_game():
+    # Never forking keeps the team to the agents joining on free slots
+    lone = Simulation(3, Tuning(fork_timer=UNITS * 10), slots=1).run(UNITS)
+    assert lone["players"] == 1
+
+def test_a_player_inside_a_ritual_cannot_start_another():
+    world = GameWorld(1, 1, ["team"], slots=3, seed=1)
+    leader, follower, other = (world.join("team") for _ in range(3))
+    world._tile(0, 0)[RESOURCES.index("linemate")] = 1
+    assert world.start_command(leader, "Incantation") == "Elevation underway"
+    assert world.start_command(follower, "Incantation") == "ko"
+    assert follower.incantation is leader.incantation
+    assert world.finish_command(leader, "Incantation") == "Current level: 2"
+    assert [player.level for player in (leader, follower, other)] == [2, 2, 2]
+    assert (follower.id, "Current level: 2") in world.outbox
+
+@pytest.mark.parametrize("size, agents, seed", [(2, 2, 2), (3, 3, 3)])
+def test_crowded_agents_match_every_answer(caplog, size, agents, seed):
+    # On a small world the rituals of teammates keep starting on our tile
+    with caplog.at_level(logging.INFO):
+        result = Simulation(seed, width=size, height=size, slots=agents, agents=agents, max_agents=agents).run(3000)
+    assert result["max_level"] >= 3
+    assert not [message for message in caplog.messages if "unexpected" in message]
@@ -0,0 +1,55 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_swarm
+##
+
+import socket
+import argparse
+import threading
+import multiprocessing
+from zappy.swarm import Swarm, SwarmAgent
+from tests.conftest import TEAM_NAME
+
+def settings_for(port: int) -> argparse.Namespace:
+    return argparse.Namespace(host="127.0.0.1", port=port, name=TEAM_NAME, team_key=None, reconnects=0,
+                              log_level="CRITICAL", trace=None, trace_sample=1.0,
+                              metrics_file=None, metrics_interval=1.0)
+
+def refusing_server() -> socket.socket:
+    """
+    A server greeting every client and refusing its team: no slot left.
+    """
+    listener = socket.create_server(("127.0.0.1", 0))
+    def serve() -> None:
+        while True:
+            try:
+                client, _ = listener.accept()
+            except OSError:
+                return
+            with client:
+                client.sendall(b"WELCOME\n")
+                client.recv(1024)
+                client.sendall(b"ko\n")
+    threading.Thread(target=serve, daemon=True).start()
+    return listener
+
+def test_refused_workers_are_not_restarted():
+    listener = refusing_server()
+    try:
+        swarm = Swarm(settings_for(listener.getsockname()[1]), workers=2, max_agents=2, max_restarts=3)
+        assert not swarm.run()
+    finally:
+        listener.close()
+    assert swarm.restarted == 0
+    assert swarm.results == [False, False]
+
+def test_only_lost_connections_are_worth_restarting():
+    agent = SwarmAgent(multiprocessing.Queue(), 0, settings_for(0))
+    assert not agent.worth_restarting(False) # never joined
+    agent.joined = True
+    assert agent.worth_restarting(False)
+    assert not agent.worth_restarting(True) # the game is over
+    agent.refused = True
+    assert not agent.worth_restarting(False)
@@ -0,0 +1,40 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_team
+##
+
+import asyncio
+import logging
+from zappy.mock_server import MockServer
+from zappy.runtime import TeamRuntime
+from tests.conftest import TEAM_NAME
+
+FREQUENCY = 1000
+SECONDS = 4.0
+
+async def play(width: int, height: int, agents: int, seed: int) -> MockServer:
+    """
+    A team of agents on a fresh mock server for SECONDS, then both are stopped.
+    """
+    server = MockServer(width=width, height=height, teams=[TEAM_NAME], slots=agents,
+                        freq=FREQUENCY, seed=seed, start_food=40)
+    port = await server.start()
+    team = TeamRuntime("127.0.0.1", port, TEAM_NAME, initial_agents=agents, max_agents=agents)
+    try:
+        await asyncio.wait_for(team.run(), SECONDS)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        await server.stop()
+    return server
+
+def test_co_located_agents_stay_in_step(caplog):
+    # One tile: every elevation of one agent happens on the other's tile
+    with caplog.at_level(logging.INFO):
+        server = asyncio.run(play(1, 1, 2, seed=1))
+    assert len(server.stats) == 2
+    warnings = [record.getMessage() for record in caplog.records if record.levelno >= logging.WARNING]
+    assert not [warning for warning in warnings if "unexpected" in warning or "Could not parse" in warning]
+    assert any("ritual" in message or "LEVEL UP" in message for message in caplog.messages)
@@ -0,0 +1,133 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_transport
+##
+
+import socket
+import threading
+import pytest
+from zappy import ai
+from zappy.ai import ZappyAI, RECONNECT_DELAY, MAX_RECONNECT_DELAY
+from zappy.transport import Transport
+from zappy.exception import ZappyError, ConnectionLost, ConnectionClosed
+from tests.conftest import TEAM_NAME
+
+TIMEOUT = 0.05 # seconds, for the waits expected to time out
+
+@pytest.fixture
+def connection():
+    """
+    A connected Transport and the server's end of its socket.
+    """
+    listener = socket.create_server(("127.0.0.1", 0))
+    transport = Transport()
+    transport.connect(*listener.getsockname())
+    peer, _ = listener.accept()
+    listener.close()
+    yield transport, peer
+    transport.close()
+    peer.close()
+
+def drain(peer: socket.socket, size: int, received: bytearray) -> None:
+    while len(received) < size:
+        data = peer.recv(65536)
+        if not data:
+            return
+        received += data
+
+def test_refused_connections_are_errors():
+    listener = socket.create_server(("127.0.0.1", 0))
+    address = listener.getsockname()
+    listener.close()
+    with pytest.raises(ZappyError):
+        Transport().connect(*address)
+
+def test_writing_needs_a_connection():
+    with pytest.raises(ZappyError):
+        Transport().write("Forward")
+
+def test_lines_are_sent_together_on_receive(connection):
+    transport, peer = connection
+    transport.write("Forward")
+    transport.write("Look")
+    peer.sendall(b"ok\n")
+    assert transport.receive(1.0) == ["ok"]
+    assert peer.recv(64) == b"Forward\nLook\n"
+
+def test_lines_split_across_reads_are_joined(connection):
+    transport, peer = connection
+    peer.sendall(b"WEL")
+    with pytest.raises(ConnectionLost):
+        transport.receive(TIMEOUT)
+    peer.sendall(b"COME\n10 10\n")
+    assert transport.receive(1.0) == ["WELCOME", "10 10"]
+
+def test_a_silent_server_misses_the_deadline(connection):
+    transport, _ = connection
+    with pytest.raises(ConnectionLost) as error:
+        transport.receive(TIMEOUT)
+    assert not isinstance(error.value, ConnectionClosed)
+
+def test_a_closed_connection_is_reported(connection):
+    transport, peer = connection
+    peer.close()
+    with pytest.raises(ConnectionClosed):
+        transport.receive(1.0)
+
+def test_partial_writes_keep_the_rest_for_the_next_flush(connection):
+    transport, peer = connection
+    payload = b"x" * (1 << 23)
+    transport.write(payload.decode())
+    # The server does not read: the socket buffers fill up before the deadline
+    with pytest.raises(ConnectionLost):
+        transport.flush(TIMEOUT)
+    assert 0 < len(transport._outgoing) <= len(payload)
+    received = bytearray()
+    reader = threading.Thread(target=drain, args=(peer, len(payload) + 1, received))
+    reader.start()
+    transport.flush(5.0)
+    reader.join()
+    assert received == payload + b"\n"
+    assert not transport._outgoing
+
+class OfflineAI(ZappyAI):
+    """
+    A ZappyAI without a socket, whose first attempts to join the game fail.
+    """
+    __slots__ = ("failures",)
+
+    def __init__(self, failures: int) -> None:
+        ZappyAI.__init__(self, host="", port=0, team_name=TEAM_NAME)
+        self.failures = failures
+
+    def send_command_immediately(self, command: str) -> None:
+        pass
+
+    def join_game(self) -> None:
+        if self.failures > 0:
+            self.failures -= 1
+            raise ZappyError("connect_to_server", "Connection denied.")
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    delays = []
+    monkeypatch.setattr(ai.time, "sleep", delays.append)
+    return delays
+
+def test_reconnect_backs_off_up_to_a_ceiling(sleeps):
+    agent = OfflineAI(failures=10)
+    agent.max_reconnects = 6
+    assert not agent.reconnect()
+    expected = [min(RECONNECT_DELAY * 2 ** attempt, MAX_RECONNECT_DELAY) for attempt in range(6)]
+    assert sleeps == expected
+    assert sleeps[-1] == MAX_RECONNECT_DELAY
+
+def test_reconnect_stops_once_joined(sleeps):
+    agent = OfflineAI(failures=2)
+    agent.send_command("Forward")
+    assert agent.reconnect()
+    assert sleeps == [RECONNECT_DELAY, 2 * RECONNECT_DELAY, 4 * RECONNECT_DELAY]
+    # The new player starts from scratch
+    assert not agent.scheduler
@@ -0,0 +1,90 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## test_world_map
+##
+
+from zappy.vision import Vision
+from zappy.world_map import WorldMap, MAX_FRAME_SIDE, STALE_HALF_LIFE
+
+NORTH, EAST, SOUTH, WEST = range(4)
+
+def test_walking_wraps_around_the_torus():
+    world_map = WorldMap(10, 10)
+    world_map.forward()
+    assert (world_map.x, world_map.y) == (0, 9)
+    world_map.turn_right()
+    for _ in range(11):
+        world_map.forward()
+    assert (world_map.x, world_map.y, world_map.orientation) == (1, 9, EAST)
+    world_map.turn_left()
+    world_map.turn_left()
+    assert world_map.orientation == WEST
+
+def test_offsets_take_the_short_way_round():
+    world_map = WorldMap(10, 10)
+    assert world_map.relative(0, 9) == (0, 1)
+    assert world_map.relative(6, 0) == (-4, 0)
+    assert world_map.distance(9, 9) == 2
+    assert world_map.absolute(-1, 1) == (9, 9)
+    world_map.orientation = SOUTH
+    assert world_map.relative(0, 9) == (0, -1)
+    assert world_map.absolute(0, 2) == (0, 2)
+
+def test_frame_and_agent_offsets_are_inverse():
+    world_map = WorldMap(10, 10)
+    for orientation in range(4):
+        world_map.orientation = orientation
+        for offset in ((0, 1), (2, -3), (-1, 0)):
+            assert world_map.from_frame(*world_map.to_frame(*offset)) == offset
+
+def test_non_square_worlds_use_a_common_multiple():
+    # Our axes may be swapped with the server's, a 12x12 frame fits both ways
+    world_map = WorldMap(6, 4)
+    assert (world_map.width, world_map.height) == (12, 12)
+    for _ in range(4):
+        world_map.forward()
+    # Four steps north wrap a 4-high world, the frame keeps them apart
+    assert (world_map.x, world_map.y) == (0, 8)
+    assert (WorldMap(5, 5).width, WorldMap(5, 5).height) == (5, 5)
+
+def test_frames_too_large_disable_the_map():
+    world_map = WorldMap(MAX_FRAME_SIDE - 1, MAX_FRAME_SIDE)
+    assert not world_map
+    world_map.forward()
+    assert (world_map.x, world_map.y) == (0, 0)
+    assert world_map.nearest(["food"]) is None
+
+def test_resizing_keeps_the_pose_in_the_frame():
+    world_map = WorldMap(10, 10)
+    world_map.forward()
+    world_map.resize(4, 4)
+    assert (world_map.x, world_map.y) == (0, 1)
+
+def test_looks_are_folded_across_the_edges():
+    world_map = WorldMap(10, 10)
+    world_map.fold_vision(Vision.parse("[player, food, linemate, sibur sibur]"))
+    assert world_map.count(9, 9, "food") == 1
+    assert world_map.count(0, 9, "linemate") == 1
+    assert world_map.count(1, 9, "sibur") == 2
+    assert world_map.age(0, 9) == 0 and world_map.age(5, 5) is None
+
+def test_takes_and_failures_update_our_cell():
+    world_map = WorldMap(10, 10)
+    world_map.fold_vision(Vision.parse("[food food, , , ]"))
+    world_map.took("food")
+    assert world_map.count(0, 0, "food") == 1
+    world_map.missing("food")
+    assert world_map.count(0, 0, "food") == 0
+    world_map.dropped("linemate")
+    assert world_map.nearest(["linemate"]) == ("linemate", 0, 0)
+
+def test_nearest_forgets_stale_cells():
+    world_map = WorldMap(10, 10)
+    world_map.fold_vision(Vision.parse("[, food, , ]"))
+    assert world_map.nearest(["food"]) == ("food", 9, 9)
+    world_map.tick(STALE_HALF_LIFE)
+    assert world_map.confidence(9, 9) == 0.5
+    world_map.tick(STALE_HALF_LIFE + 1)
+    assert world_map.nearest(["food"]) is None
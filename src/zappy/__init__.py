@@ -21,11 +21,25 @@ ELEVATION_REQUIREMENTS = {
     7: (6, {"linemate": 2, "deraumere": 2, "sibur": 2, "mendiane": 2, "phiras": 2, "thystame": 1}),
 }
 
-ACTION_SPEED = [
-    ["inventory"],
-    ["forward", "right", "left", "look", "broadcast", "eject", "take", "set"],
-    ["fork"],
-    ["incantation"]
-]
+# Duration of every command, in time units
+ACTION_SPEED = {
+    "Inventory": 1,
+    "Forward": 7,
+    "Right": 7,
+    "Left": 7,
+    "Look": 7,
+    "Broadcast": 7,
+    "Eject": 7,
+    "Take": 7,
+    "Set": 7,
+    "Fork": 42,
+    "Incantation": 300,
+    "Connect_nbr": 0,
+}
+
+FOOD_UNITS = 126 # time units of life given by one food
+
+# North, East, South, West. North is towards y - 1 like the reference server.
+ORIENTATIONS = ((0, -1), (1, 0), (0, 1), (-1, 0))
 
-FOOD_SURVIVAL_THRESHOLD = 8 * 126 # 1 food = 126 time units, 20 food is the minimum to survive
+FOOD_SURVIVAL_THRESHOLD = 8 * FOOD_UNITS # 20 food is the minimum to survive
@@ -5,12 +5,110 @@
 ## AI
 ##
 
+import time
+from typing import Callable
 from . import logger
-from .decision_engine import DecisionEngine
+from .exception import ZappyError, ConnectionLost, ConnectionClosed
+from .decision_engine import DecisionEngine, Tuning
+
+DEFAULT_RECONNECTS = 5
+RECONNECT_DELAY = 0.5      # seconds, doubled after every failed attempt
+MAX_RECONNECT_DELAY = 8.0
+# Commands in flight leaving our pose alone and answering nothing the next
+# decision waits for: it can be taken before they are answered
+DECIDE_AHEAD_OF = frozenset(("Take", "Set", "Broadcast", "Connect_nbr", "Fork"))
 
 class ZappyAI(DecisionEngine):
-    def __init__(self, host: str, port: int, team_name: str) -> None:
-        DecisionEngine.__init__(self, host=host, port=port, team_name=team_name)
+    __slots__ = ("max_reconnects",)
+
+    def __init__(self, host: str, port: int, team_name: str, team_key: str | None = None,
+                 tuning: Tuning | None = None) -> None:
+        DecisionEngine.__init__(self, host=host, port=port, team_name=team_name, team_key=team_key, tuning=tuning)
+        self.max_reconnects = DEFAULT_RECONNECTS
+
+    def wants_decision(self) -> bool:
+        """
+        Whether the plan ran dry while the window has room and every
+        command in flight leaves the state the decision reads as it is:
+        the next commands are queued behind them instead of a round trip later.
+        """
+        if self.action_plan or self.scheduler.is_full():
+            return False
+        return all(pending.name in DECIDE_AHEAD_OF for pending in self.scheduler.pending)
+
+    def poll_inventory(self) -> None:
+        if self.clock.should_poll_inventory(self.food_thresholds()):
+            self.send_command("Inventory")
+
+    def timed_decision(self, decide: Callable[..., None], *args) -> None:
+        started = time.perf_counter()
+        decide(*args)
+        self.metrics.decision_time.labels().observe(time.perf_counter() - started)
+        self.metrics.decisions.labels().inc()
+
+    def push_action_plan(self) -> None:
+        """
+        Keep the server's command window full with the action plan.
+        """
+        while self.action_plan and not self.scheduler.is_full():
+            self.send_command(self.action_plan.pop(0))
+
+    def fill_command_queue(self) -> None:
+        """
+        Decide once the plan ran dry and push the action plan into the scheduler window.
+        """
+        if self.wants_decision():
+            self.poll_inventory()
+            self.timed_decision(self.make_decision)
+        self.push_action_plan()
+
+    def process_message(self, message: str) -> None:
+        """
+        Handle one line received from the server and advance the timers.
+        """
+        logger.debug("Server -> Me: %s", message)
+        self.handle_server_message(message, self)
+        if (self.timer_fork > 0):
+            self.timer_fork = self.timer_fork - 1
+
+    def process_messages(self, messages: list[str]) -> None:
+        """
+        Handle every line received together before deciding again, so the
+        plan is not rebuilt between answers that arrived at once.
+        """
+        for message in messages:
+            self.process_message(message)
+            if not self.is_alive:
+                return
+
+    def join_game(self) -> None:
+        """
+        Connect, join the team and ask for our inventory.
+        """
+        self.connect_to_server()
+        width, heigth = self.initial_connection(self.team_name)
+        self.set_world_size(width, heigth)
+        self.send_command("Inventory")
+
+    def reconnect(self) -> bool:
+        """
+        Join the game again with a new player, waiting longer after every failed attempt.
+        """
+        delay = RECONNECT_DELAY
+        for attempt in range(1, self.max_reconnects + 1):
+            self.transport.close()
+            logger.info("Reconnecting in %.1fs (attempt %s/%s).", delay, attempt, self.max_reconnects)
+            time.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+            self.scheduler.clear()
+            self.report_in_flight(0)
+            self.respawn()
+            try:
+                self.join_game()
+                return True
+            except ZappyError as e:
+                logger.warning("Reconnection failed at: %s: %s", e.where, e.what)
+        return False
 
     def run(self) -> bool:
         """
@@ -18,28 +116,18 @@ class ZappyAI(DecisionEngine):
         """
         ret = False
         try:
-            self.connect_to_server()
-            width, heigth = self.initial_connection(self.team_name)
-            self.set_world_size(width, heigth)
-            self.send_command("Inventory")
-
+            self.join_game()
             while self.is_alive:
-                if not self.command_queue and not self.action_plan:
-                        self.send_command("Inventory")
-                        self.make_decision()
-
-                while self.action_plan and len(self.command_queue) < 10:
-                    if not self.can_send_action_plan_command(self.action_plan[0]):
+                try:
+                    self.fill_command_queue()
+                    # Waiting for server answers, all of them are handled before deciding again
+                    self.process_messages(self.read_lines_from_server())
+                except ConnectionLost as e:
+                    logger.warning("Connection lost at: %s: %s", e.where, e.what)
+                    if not self.reconnect():
+                        # The game is over when the server is gone for good
+                        ret = isinstance(e, ConnectionClosed)
                         break
-                    next_action = self.action_plan.pop(0)
-                    self.send_command(next_action)
-
-                # Waiting for server answers
-                message = self.read_from_server()
-                logger.debug(f"Server -> Me: {message}")
-                self.handle_server_message(message, self)
-                if (self.timer_fork > 0):
-                    self.timer_fork = self.timer_fork - 1
         except KeyboardInterrupt:
             logger.info("User interruption. Closing connection.")
             ret = True
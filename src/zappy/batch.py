@@ -0,0 +1,88 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## batch
+##
+
+from array import array
+from .ai import ZappyAI
+from .inventory import Resource
+from .decision_engine import DecisionEngine
+from . import FOOD_UNITS
+
+ITEMS = len(Resource)
+FOOD = int(Resource.FOOD)
+STONES = slice(int(Resource.LINEMATE), ITEMS) # offsets of the stones in a row of counts
+# Elevation needs shared between agents, forgotten past this many inventories
+MAX_SHARED_NEEDS = 4096
+
+class AgentBatch:
+    """
+    One decision step for every idle agent hosted by the process.
+    Their levels, resource counts, fork timers and survival thresholds are
+    copied into flat arrays, one row per agent, then the facts every rule
+    asks for are derived for the whole batch: who is starving, who may fork
+    and the stones missing for the next elevation. The elevation needs only
+    depend on the level and the stones held, agents in the same situation
+    share one computation, within the step and across steps.
+    Each agent then runs its rules with these facts in hand.
+    """
+    __slots__ = ("levels", "counts", "fork_timers", "thresholds", "_needs")
+
+    def __init__(self) -> None:
+        self.levels = array('B')
+        self.counts = array('I')
+        self.fork_timers = array('i')
+        self.thresholds = array('i')
+        # (level, stones held) -> (elevation needs, missing stones), never modified once stored
+        self._needs: dict[tuple[int, bytes], tuple[dict, dict[str, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def _load(self, agents: list[ZappyAI]) -> None:
+        """
+        Copy the state the batched facts are derived from, one row per agent.
+        """
+        levels, counts, fork_timers, thresholds = self.levels, self.counts, self.fork_timers, self.thresholds
+        del levels[:], counts[:], fork_timers[:], thresholds[:]
+        for agent in agents:
+            levels.append(agent.level)
+            counts.extend(agent.inventory.counts)
+            fork_timers.append(agent.timer_fork)
+            thresholds.append(agent.tuning.food_survival)
+
+    def _elevation_needs(self, row: int, agent: ZappyAI) -> tuple[dict, dict[str, int]]:
+        level = self.levels[row]
+        base = row * ITEMS
+        key = (level, self.counts[base + STONES.start:base + STONES.stop].tobytes())
+        needs = self._needs.get(key)
+        if needs is None:
+            if len(self._needs) >= MAX_SHARED_NEEDS:
+                self._needs.clear()
+            elevation = DecisionEngine._check_elevation_requirements(level, agent.inventory)
+            missing = {stone: count for stone, count in elevation.items() if stone != "status"}
+            needs = self._needs[key] = (elevation, missing)
+        return needs
+
+    def decide(self, agents: list[ZappyAI]) -> None:
+        """
+        Decide for the idle agents among agents, then push every agent's
+        plan into its scheduler window, as fill_command_queue does for one.
+        """
+        ready = [agent for agent in agents if agent.wants_decision()]
+        if ready:
+            for agent in ready:
+                agent.poll_inventory()
+                agent.predict_food()
+            self._load(ready)
+            starving = [food * FOOD_UNITS < threshold
+                        for food, threshold in zip(self.counts[FOOD::ITEMS], self.thresholds)]
+            fork_ready = [not starves and level >= 2 and timer == 0
+                          for starves, level, timer in zip(starving, self.levels, self.fork_timers)]
+            for row, agent in enumerate(ready):
+                agent.facts.assume_elevation_needs(*self._elevation_needs(row, agent))
+                agent.timed_decision(agent.decide, starving[row], fork_ready[row])
+        for agent in agents:
+            agent.push_action_plan()
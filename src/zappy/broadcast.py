@@ -0,0 +1,145 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## broadcast
+##
+
+import hmac
+import base64
+import random
+import struct
+import hashlib
+import binascii
+from .clock import ServerClock
+from .vision import VISION_ITEMS
+
+VERSION = 1
+TAG_SIZE = 5 # bytes of blake2s tag, 40 bits are plenty against forgery during one game
+SEQ_MODULO = 1 << 16
+
+STONES = VISION_ITEMS[2:]
+MAX_STONE_COUNT = 15 # one nibble per stone
+
+# Kinds of team messages
+KIND_INCANTATION = 1 # come to me, I have the stones for the next level (leader's beacon)
+KIND_JOIN = 2        # on my way to your rendezvous
+KIND_DISBAND = 3     # the rendezvous is called off
+
+# version, sender, seq, kind, level, players missing, x, y, stones, rendezvous
+PACKET = struct.Struct(">BIHBBBHH3sH")
+
+# Token bucket of the sender, in server time units
+BURST = 2
+REFILL_UNITS = 49 # one Broadcast every 7 actions once the burst is spent
+
+class TeamMessage:
+    """
+    Decoded team broadcast. Positions are in the sender's own world map frame.
+    """
+    __slots__ = ("kind", "level", "players", "x", "y", "stones", "rendezvous", "sender", "seq")
+
+    def __init__(self, kind: int, level: int, players: int = 0, x: int = 0, y: int = 0,
+                 stones: dict[str, int] | None = None, rendezvous: int = 0,
+                 sender: int = 0, seq: int = 0) -> None:
+        self.kind = kind
+        self.level = level
+        self.players = players
+        self.x = x
+        self.y = y
+        self.stones = stones or {}
+        self.rendezvous = rendezvous
+        self.sender = sender
+        self.seq = seq
+
+    def __repr__(self) -> str:
+        return (f"TeamMessage(kind={self.kind}, level={self.level}, players={self.players}, "
+                f"pos=({self.x}, {self.y}), stones={self.stones}, rendezvous={self.rendezvous}, "
+                f"sender={self.sender:08x}, seq={self.seq})")
+
+def _pack_stones(stones: dict[str, int]) -> bytes:
+    packed = 0
+    for index, stone in enumerate(STONES):
+        packed |= min(stones.get(stone, 0), MAX_STONE_COUNT) << (4 * index)
+    return packed.to_bytes(3, "big")
+
+def _unpack_stones(data: bytes) -> dict[str, int]:
+    packed = int.from_bytes(data, "big")
+    stones = {}
+    for index, stone in enumerate(STONES):
+        count = (packed >> (4 * index)) & MAX_STONE_COUNT
+        if count:
+            stones[stone] = count
+    return stones
+
+class BroadcastChannel:
+    """
+    Encodes and authenticates the team's broadcasts.
+    A message is a fixed-size packet followed by a blake2s tag keyed with the
+    team key, sent as 32 url-safe base64 characters. Every sender numbers its
+    messages, receivers drop anything not newer than what they already got from
+    that sender, and sending is limited by a token bucket in server time.
+    """
+    __slots__ = ("key", "clock", "sender", "seq", "tokens", "_refilled_at", "last_seq")
+
+    def __init__(self, key: str, clock: ServerClock) -> None:
+        self.key = hashlib.blake2s(key.encode('utf-8')).digest()
+        self.clock = clock
+        self.sender = random.getrandbits(32)
+        self.seq = 0
+        self.tokens = float(BURST)
+        self._refilled_at = clock.now()
+        self.last_seq: dict[int, int] = {}
+
+    def _tag(self, packet: bytes) -> bytes:
+        return hashlib.blake2s(packet, digest_size=TAG_SIZE, key=self.key).digest()
+
+    def _refill(self) -> None:
+        now = self.clock.now()
+        self.tokens = min(BURST, self.tokens + (now - self._refilled_at) * self.clock.frequency / REFILL_UNITS)
+        self._refilled_at = now
+
+    def can_send(self) -> bool:
+        self._refill()
+        return self.tokens >= 1.0
+
+    def encode(self, message: TeamMessage) -> (str | None):
+        """
+        Text to broadcast for message, None when the rate limit is reached.
+        """
+        if not self.can_send():
+            return None
+        self.tokens -= 1.0
+        self.seq = (self.seq + 1) % SEQ_MODULO
+        packet = PACKET.pack(VERSION, self.sender, self.seq, message.kind, message.level,
+                             message.players, message.x, message.y, _pack_stones(message.stones),
+                             message.rendezvous)
+        return base64.urlsafe_b64encode(packet + self._tag(packet)).decode('ascii')
+
+    def _is_new(self, sender: int, seq: int) -> bool:
+        last = self.last_seq.get(sender)
+        # Serial number arithmetic, the sequence wraps around
+        return last is None or 0 < (seq - last) % SEQ_MODULO < SEQ_MODULO // 2
+
+    def decode(self, text: str) -> (TeamMessage | None):
+        """
+        Message carried by a broadcast text, None if it is not an authentic,
+        new message from a teammate.
+        """
+        if len(text) != 4 * ((PACKET.size + TAG_SIZE) // 3):
+            return None
+        try:
+            data = base64.urlsafe_b64decode(text)
+        except (binascii.Error, ValueError):
+            return None
+        # Characters outside the base64 alphabet are skipped, not rejected
+        if len(data) != PACKET.size + TAG_SIZE:
+            return None
+        packet, tag = data[:PACKET.size], data[PACKET.size:]
+        if data[0] != VERSION or not hmac.compare_digest(self._tag(packet), tag):
+            return None
+        _, sender, seq, kind, level, players, x, y, stones, rendezvous = PACKET.unpack(packet)
+        if sender == self.sender or not self._is_new(sender, seq):
+            return None
+        self.last_seq[sender] = seq
+        return TeamMessage(kind, level, players, x, y, _unpack_stones(stones), rendezvous, sender, seq)
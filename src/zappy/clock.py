@@ -0,0 +1,118 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## clock
+##
+
+import time
+from typing import Callable
+from . import ACTION_SPEED, FOOD_UNITS
+
+DEFAULT_FREQUENCY = 100.0 # the reference server's default
+MIN_SAMPLE_UNITS = 7      # shorter commands are dominated by the round-trip time
+SMOOTHING = 0.2           # weight of a new frequency sample
+MIN_REPLY_GAP = 0.0005    # seconds, closer replies were handled from one read, not paced by the server
+MAX_POLL_UNITS = 10 * FOOD_UNITS
+SETTLED_SAMPLES = 10
+UNSETTLED_ERROR = 0.25    # relative frequency error before enough samples
+SETTLED_ERROR = 0.05
+
+class ServerClock:
+    """
+    Model of the server's time, in time units.
+    The frequency is estimated from how long commands take to be answered,
+    counting from when the server could start them: after they were sent and
+    after the previous command was answered. Food is predicted between two
+    Inventory answers from that estimate, so Inventory only needs to be polled
+    when the prediction gets too uncertain or a threshold gets close.
+    """
+    __slots__ = ("now", "frequency", "samples", "units", "_last_reply_at", "_food_at_poll", "_poll_at", "_food_delta")
+
+    def __init__(self, now: Callable[[], float] = time.monotonic) -> None:
+        self.now = now
+        self.frequency = DEFAULT_FREQUENCY
+        self.samples = 0
+        self.units = 0 # server time taken by the commands answered so far
+        self._last_reply_at: float | None = None
+        self._food_at_poll: int | None = None
+        self._poll_at = 0.0
+        self._food_delta = 0
+
+    def duration(self, units: int) -> float:
+        """
+        Seconds the server takes for units time units, at the estimated frequency.
+        """
+        return units / self.frequency
+
+    @staticmethod
+    def command_time(command: str) -> int:
+        return ACTION_SPEED.get(command.split(' ', 1)[0], 0)
+
+    def on_reply(self, command: str, sent_at: float, success: bool) -> None:
+        """
+        Account for a command the server answered.
+        """
+        now = self.now()
+        started_at = sent_at if self._last_reply_at is None else max(sent_at, self._last_reply_at)
+        self._last_reply_at = now
+        units = self.command_time(command)
+        self.units += units
+        # A refused Incantation is answered right away, only a level tells how long it took
+        sampled = success or command != "Incantation"
+        if sampled and units >= MIN_SAMPLE_UNITS and now - started_at >= MIN_REPLY_GAP:
+            sample = units / (now - started_at)
+            if self.samples == 0:
+                self.frequency = sample
+            else:
+                self.frequency += SMOOTHING * (sample - self.frequency)
+            self.samples += 1
+        if success and command == "Take food":
+            self._food_delta += 1
+        elif success and command == "Set food":
+            self._food_delta -= 1
+
+    def on_inventory(self, food: int) -> None:
+        self._food_at_poll = food
+        self._poll_at = self.now()
+        self._food_delta = 0
+
+    def elapsed_units(self) -> float:
+        """
+        Server time elapsed since the last Inventory answer.
+        """
+        return (self.now() - self._poll_at) * self.frequency
+
+    def relative_error(self) -> float:
+        return SETTLED_ERROR if self.samples >= SETTLED_SAMPLES else UNSETTLED_ERROR
+
+    def predicted_life(self) -> float:
+        """
+        Time units we can still live, from the last known food and the time elapsed.
+        """
+        if self._food_at_poll is None:
+            return 0.0
+        return max(0.0, (self._food_at_poll + self._food_delta) * FOOD_UNITS - self.elapsed_units())
+
+    def predicted_food(self) -> (int | None):
+        if self._food_at_poll is None:
+            return None
+        return int(self.predicted_life() // FOOD_UNITS)
+
+    def uncertainty(self) -> float:
+        """
+        Error bound on predicted_life: where we were in the current food unit,
+        plus the frequency error accumulated since the last poll.
+        """
+        return FOOD_UNITS + self.elapsed_units() * self.relative_error()
+
+    def should_poll_inventory(self, thresholds: list[int]) -> bool:
+        """
+        Whether an Inventory is worth its slot: no baseline, a baseline too old,
+        or a food threshold within the prediction's error bound.
+        """
+        if self._food_at_poll is None or self.elapsed_units() >= MAX_POLL_UNITS:
+            return True
+        life = self.predicted_life()
+        margin = self.uncertainty()
+        return any(abs(life - threshold) <= margin for threshold in thresholds)
@@ -0,0 +1,257 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## collector
+##
+
+from . import ACTION_SPEED
+from .vision import Vision, TILE_INDEX, tile_offset
+from .planner import plan_route, MOVE_TIME
+from .inventory import TAKE
+
+TAKE_TIME = ACTION_SPEED["Take"]
+MAX_STOPS = 6 # candidate stops, the best ones by value/cost
+MAX_EXACT_STOPS = 4 # of which searched exhaustively, the others are inserted in the best route
+DEFAULT_BUDGET = 20 * MOVE_TIME
+DEFAULT_WEIGHTS = {"food": 0.5}
+
+class CollectionPlan:
+    def __init__(self, commands: list[str], value: float, time: int, taken: dict[str, int]) -> None:
+        self.commands = commands
+        self.value = value
+        self.time = time
+        self.taken = taken
+
+    def __bool__(self) -> bool:
+        return bool(self.taken)
+
+def _walk(position: tuple[int, int], orientation: int, route: tuple[str, ...]) -> tuple[list[tuple[int, int]], int]:
+    """
+    Follow route in the vision frame (x to the right, y backwards).
+    Returns the tiles entered and the final orientation.
+    """
+    x, y = position
+    visited = []
+    for command in route:
+        if command == "Left":
+            orientation = (orientation - 1) % 4
+        elif command == "Right":
+            orientation = (orientation + 1) % 4
+        else:
+            x += (0, 1, 0, -1)[orientation]
+            y += (-1, 0, 1, 0)[orientation]
+            visited.append((x, y))
+    return visited, orientation
+
+def _leg(position: tuple[int, int], orientation: int, target: tuple[int, int]) -> tuple[str, ...]:
+    return plan_route(target[0] - position[0], target[1] - position[1], orientation)
+
+def _tile_at(position: tuple[int, int]) -> int:
+    """
+    Vision tile index at a position of the vision frame, -1 if outside the cone.
+    """
+    return TILE_INDEX.get((position[0], -position[1]), -1)
+
+class _Collector:
+    def __init__(self, vision: Vision, wanted: dict[str, int], weights: dict[str, float]) -> None:
+        self.vision = vision
+        self.wanted = {item: count for item, count in wanted.items() if count > 0}
+        self.weights = weights
+
+    def gains(self, tile: int, needs: dict[str, int]) -> dict[str, int]:
+        gains = {}
+        for item, need in needs.items():
+            available = min(self.vision.count(tile, item), need)
+            if available > 0:
+                gains[item] = available
+        return gains
+
+    def value(self, gains: dict[str, int]) -> float:
+        return sum(self.weights.get(item, 1.0) * count for item, count in gains.items())
+
+    def candidates(self) -> list[tuple[int, int]]:
+        """
+        Tiles worth a stop, as vision-frame positions, best value per move first.
+        """
+        values = [0.0] * len(self.vision)
+        for item, need in self.wanted.items():
+            weight = self.weights.get(item, 1.0)
+            for tile, count in enumerate(self.vision.column(item)):
+                if count:
+                    values[tile] += weight * min(count, need)
+        scored = []
+        for tile, gain in enumerate(values):
+            if gain > 0:
+                dx, dy = tile_offset(tile)
+                cost = len(plan_route(dx, -dy, 0)) + 1
+                scored.append((-gain / cost, tile, (dx, -dy)))
+        scored.sort()
+        return [position for _, _, position in scored[:MAX_STOPS]]
+
+    def search(self, budget: int) -> list[tuple[int, int]]:
+        """
+        Orienteering: best ordered subset of stops reachable within budget.
+        Subsets of the MAX_EXACT_STOPS best candidates are tried in every
+        order, with the remaining needs and the time of the partial route
+        carried along the search. Two cuts keep the result of the exhaustive
+        search:
+        - a set of stops takes the same items whatever their order, so a
+          partial route ending where an earlier one did, on the same stops
+          and facing the same way, is only pursued when it is faster,
+        - a branch is dropped once what the stops left could bring can't
+          beat the best route found.
+        The other candidates are then inserted one by one where they add
+        the most value, at the lowest time, to the best route.
+        Stops are bits of a mask, needs a list following the wanted items
+        and every stop only lists the wanted items it holds.
+        """
+        stops = self.candidates()
+        items = list(self.wanted)
+        weights = [self.weights.get(item, 1.0) for item in items]
+        max_weight = max(weights)
+        available = []
+        for stop in stops:
+            tile = _tile_at(stop)
+            available.append([(index, count) for index, item in enumerate(items)
+                              if (count := self.vision.count(tile, item))])
+        legs: dict[tuple[int, int, int], tuple[int, int]] = {}
+        # (stops visited, last stop, orientation) -> fastest time it was reached in
+        arrivals: dict[tuple[int, int, int], int] = {}
+        best = ([], 0.0, 0)
+
+        def leg(origin, orientation, stop):
+            key = (origin, orientation, stop)
+            entry = legs.get(key)
+            if entry is None:
+                position = stops[origin] if origin >= 0 else (0, 0)
+                route = _leg(position, orientation, stops[stop])
+                entry = legs[key] = (len(route) * MOVE_TIME, _walk(position, orientation, route)[1])
+            return entry
+
+        def extend(route, visited, last, orientation, needs, value, time):
+            nonlocal best
+            if value > best[1] or (value == best[1] and time < best[2]):
+                best = (list(route), value, time)
+            options = []
+            # What the stops left could bring, item by item
+            reachable = [0] * len(items)
+            for stop in range(exact):
+                if visited >> stop & 1:
+                    continue
+                gains = [(index, min(count, needs[index])) for index, count in available[stop] if needs[index]]
+                if not gains:
+                    continue
+                move_time, next_orientation = leg(last, orientation, stop)
+                if time + move_time + TAKE_TIME > budget:
+                    continue
+                # Taking less later could fit: the stop still counts in the bound
+                taken = 0
+                for index, count in gains:
+                    reachable[index] += count
+                    taken += count
+                cost = move_time + taken * TAKE_TIME
+                if time + cost <= budget:
+                    options.append((stop, gains, cost, next_orientation))
+            if not options:
+                return
+            promised = sum(weight * min(total, need) for weight, total, need in zip(weights, reachable, needs))
+            bound = value + min(promised, (budget - time) // TAKE_TIME * max_weight)
+            # Time only grows along a route: a branch must promise strictly more value,
+            # or as much value while it is still faster than the best route
+            if bound < best[1] or (bound == best[1] and time >= best[2]):
+                return
+            for stop, gains, cost, next_orientation in options:
+                key = (visited | 1 << stop, stop, next_orientation)
+                arrived = arrivals.get(key)
+                if arrived is not None and arrived <= time + cost:
+                    continue
+                arrivals[key] = time + cost
+                remaining = list(needs)
+                gain = 0.0
+                for index, count in gains:
+                    remaining[index] -= count
+                    gain += weights[index] * count
+                route.append(stop)
+                extend(route, key[0], stop, next_orientation, remaining, value + gain, time + cost)
+                route.pop()
+
+        def evaluate(route):
+            needs = list(wanted)
+            value, time, last, orientation = 0.0, 0, -1, 0
+            for stop in route:
+                move_time, orientation = leg(last, orientation, stop)
+                time += move_time
+                for index, count in available[stop]:
+                    count = min(count, needs[index])
+                    needs[index] -= count
+                    value += weights[index] * count
+                    time += count * TAKE_TIME
+                last = stop
+            return value, time
+
+        wanted = [self.wanted[item] for item in items]
+        exact = min(len(stops), MAX_EXACT_STOPS)
+        extend([], 0, -1, 0, wanted, 0.0, 0)
+        route = best[0]
+        value, time = evaluate(route)
+        for stop in range(exact, len(stops)):
+            inserted = None
+            for at in range(len(route) + 1):
+                candidate = route[:at] + [stop] + route[at:]
+                gained, spent = evaluate(candidate)
+                if spent <= budget and (gained > value or (gained == value and spent < time)):
+                    inserted, value, time = candidate, gained, spent
+            if inserted is not None:
+                route = inserted
+        return [stops[stop] for stop in route]
+
+    def build(self, stops: list[tuple[int, int]]) -> CollectionPlan:
+        """
+        Turn the stops into commands, also taking what is needed on every tile walked over.
+        """
+        needs = dict(self.wanted)
+        taken: dict[str, int] = {}
+        commands: list[str] = []
+        position, orientation = (0, 0), 0
+        visited_tiles: set[int] = set()
+
+        def take_here(tile: int) -> None:
+            if tile < 0 or tile in visited_tiles:
+                return
+            visited_tiles.add(tile)
+            for item, count in self.gains(tile, needs).items():
+                commands.extend([TAKE[item]] * count)
+                needs[item] -= count
+                taken[item] = taken.get(item, 0) + count
+
+        take_here(_tile_at(position))
+        for stop in stops:
+            leg = _leg(position, orientation, stop)
+            visited, orientation = _walk(position, orientation, leg)
+            for command, step in zip(leg, _steps(leg, visited)):
+                commands.append(command)
+                if step is not None:
+                    take_here(_tile_at(step))
+            position = stop
+        moves = sum(1 for command in commands if not command.startswith("Take"))
+        time = moves * MOVE_TIME + sum(taken.values()) * TAKE_TIME
+        return CollectionPlan(commands, self.value(taken), time, taken)
+
+def _steps(leg: tuple[str, ...], visited: list[tuple[int, int]]) -> list[tuple[int, int] | None]:
+    """
+    Pair every command of leg with the tile it enters, None for turns.
+    """
+    entered = iter(visited)
+    return [next(entered) if command == "Forward" else None for command in leg]
+
+def plan_collection(vision: Vision, wanted: dict[str, int], budget: int = DEFAULT_BUDGET,
+                    weights: dict[str, float] | None = None) -> CollectionPlan:
+    """
+    Plan one pass over the vision cone collecting as much of wanted as the
+    time budget (in time units) allows.
+    """
+    collector = _Collector(vision, wanted, DEFAULT_WEIGHTS if weights is None else weights)
+    if not collector.wanted or not vision:
+        return CollectionPlan([], 0.0, 0, {})
+    return collector.build(collector.search(budget))
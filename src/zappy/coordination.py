@@ -0,0 +1,111 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## coordination
+##
+
+from .broadcast import TeamMessage, REFILL_UNITS
+
+ROLE_NONE = 0
+ROLE_LEADER = 1
+ROLE_FOLLOWER = 2
+
+# A leader streams a beacon as often as the rate limit lets it, about every
+# REFILL_UNITS: missing a few in a row means it died or gave up
+LEADER_TIMEOUT_UNITS = 4 * REFILL_UNITS
+# Hops walked along the last heading heard before waiting for the next beacon
+MAX_HOPS_PER_BEACON = 2
+
+class Gathering:
+    """
+    Our part in gathering players on one tile for an incantation.
+    The leader waits on the rendezvous tile with its stones already set and
+    streams beacons; followers keep walking along the heading of the last
+    beacon they heard, a few hops at most, until the sound comes from their
+    own tile. When several agents start leading at the same level, the
+    lowest (rendezvous, sender) key wins and the others follow it. Followers
+    drop a leader they stop hearing from, so a ready one can take over.
+    A leader leading again at the same level keeps its rendezvous, and its
+    rank with it.
+    """
+    __slots__ = ("role", "rendezvous", "leader", "level", "heading", "hops", "arrived", "heard_at",
+                 "followers", "joined", "led")
+
+    def __init__(self) -> None:
+        self.led = (0, 0) # (level, rendezvous) we led last, kept across resets
+        self.reset()
+
+    def reset(self) -> None:
+        self.role = ROLE_NONE
+        self.rendezvous = 0
+        self.leader = 0 # sender id of the leader
+        self.level = 0
+        self.heading: tuple[int, int] | None = None # towards the leader, in the world map's axes
+        self.hops = 0
+        self.arrived = False
+        self.heard_at = 0.0
+        self.followers: set[int] = set()
+        self.joined = False
+
+    @property
+    def leading(self) -> bool:
+        return self.role == ROLE_LEADER
+
+    @property
+    def following(self) -> bool:
+        return self.role == ROLE_FOLLOWER
+
+    def key(self) -> tuple[int, int]:
+        return self.rendezvous, self.leader
+
+    def lead(self, level: int, rendezvous: int, sender: int) -> None:
+        self.reset()
+        self.role = ROLE_LEADER
+        self.level = level
+        self.rendezvous = rendezvous
+        self.leader = sender
+        self.led = (level, rendezvous)
+
+    def last_led(self, level: int) -> int:
+        """
+        The rendezvous we led last at level, 0 if none.
+        """
+        led_level, rendezvous = self.led
+        return rendezvous if led_level == level else 0
+
+    def follow(self, message: TeamMessage, heading: tuple[int, int] | None, now: float) -> None:
+        if not self.is_from_leader(message):
+            self.reset()
+            self.role = ROLE_FOLLOWER
+            self.level = message.level
+            self.rendezvous = message.rendezvous
+            self.leader = message.sender
+        self.heard(heading, now)
+
+    def heard(self, heading: tuple[int, int] | None, now: float) -> None:
+        """
+        A beacon of our leader came from heading, None when from our own tile.
+        """
+        self.heading = heading
+        self.hops = 0
+        self.arrived = heading is None
+        self.heard_at = now
+
+    def next_hop(self) -> (tuple[int, int] | None):
+        """
+        Heading of the next hop, None when we should wait for a beacon.
+        """
+        if self.arrived or self.heading is None or self.hops >= MAX_HOPS_PER_BEACON:
+            return None
+        self.hops += 1
+        return self.heading
+
+    def is_from_leader(self, message: TeamMessage) -> bool:
+        return self.role != ROLE_NONE and (message.rendezvous, message.sender) == self.key()
+
+    def outranked_by(self, message: TeamMessage) -> bool:
+        return (message.rendezvous, message.sender) < self.key()
+
+    def leader_lost(self, now: float, frequency: float) -> bool:
+        return self.following and (now - self.heard_at) * frequency > LEADER_TIMEOUT_UNITS
@@ -6,67 +6,103 @@
 ##
 
 import random
+from typing import Callable
 from . import logger
-from .server import ZappyServer
-from .player import PlayerState
-from . import ELEVATION_REQUIREMENTS, FOOD_SURVIVAL_THRESHOLD
+from .server import ZappyServer, SERVER_SLOTS, DIRECTION_OFFSETS
+from .player import PlayerState, PLAYER_STATE_SLOTS
+from .planner import plan_relative
+from .facts import Facts
+from .inventory import TAKE, SET
+from .collector import CollectionPlan
+from .peephole import optimize
+from .broadcast import TeamMessage, KIND_INCANTATION, KIND_JOIN, KIND_DISBAND
+from .vision import Vision, tile_offset
+from . import ELEVATION_REQUIREMENTS, FOOD_SURVIVAL_THRESHOLD, FOOD_UNITS
 
 FORK_TIMER = 40
+INCANTATION_FOOD = 300 + (2 * FOOD_UNITS) # 300 time units for incantation + 2 food for the next level
+
+# Utility of every goal, the best applicable one is pursued first
+UTILITY_RITUAL = 100    # a ritual we take part in fails if we leave its tile
+UTILITY_RECALL = 90
+UTILITY_LOOK = 80
+UTILITY_SURVIVE = 60     # up to 60 + UTILITY_STARVING when out of food
+UTILITY_STARVING = 20
+UTILITY_CONVERGE = 45
+UTILITY_ELEVATE = 40
+UTILITY_GATHER = 20      # up to 20 + UTILITY_GATHER_ALL when one pass collects every missing stone
+UTILITY_GATHER_ALL = 10
+UTILITY_REPRODUCE = 10
+UTILITY_EXPLORE = 1
+
+class Tuning:
+    """
+    Thresholds of the decisions, in time units of life, the module constants
+    by default. zappy.simulator sweeps them.
+    """
+    __slots__ = ("fork_timer", "food_survival", "incantation_food")
+
+    def __init__(self, fork_timer: int = FORK_TIMER, food_survival: int = FOOD_SURVIVAL_THRESHOLD,
+                 incantation_food: int = INCANTATION_FOOD) -> None:
+        self.fork_timer = fork_timer
+        self.food_survival = food_survival
+        self.incantation_food = incantation_food
+
+    @property
+    def food_comfort(self) -> int:
+        """
+        Food worth picking up on the way.
+        """
+        return 2 * self.food_survival // FOOD_UNITS
+
+    def __repr__(self) -> str:
+        return (f"Tuning(fork_timer={self.fork_timer}, food_survival={self.food_survival}, "
+                f"incantation_food={self.incantation_food})")
+
+DEFAULT_TUNING = Tuning()
 
 class DecisionEngine(ZappyServer, PlayerState):
-    def __init__(self, host: str, port: int, team_name: str) -> None:
-        ZappyServer.__init__(self, host, port)
+    __slots__ = SERVER_SLOTS + PLAYER_STATE_SLOTS + ("timer_fork", "facts", "_goals_key", "_goals",
+                                                     "level_units", "_level_started_units", "tuning")
+
+    def __init__(self, host: str, port: int, team_name: str, team_key: str | None = None,
+                 tuning: Tuning | None = None) -> None:
+        ZappyServer.__init__(self, host, port, team_key or team_name)
         PlayerState.__init__(self, team_name)
-        self.timer_fork = FORK_TIMER
+        self.tuning = tuning or DEFAULT_TUNING
+        self.timer_fork = self.tuning.fork_timer
+        self.facts = Facts(self, self._check_elevation_requirements)
+        self._goals_key: tuple | None = None
+        self._goals: list[tuple[float, Callable[[], bool]]] = []
+        # Server time units spent at every level we left
+        self.level_units: dict[int, int] = {}
+        self._level_started_units = 0
 
     @staticmethod
-    def _get_path_to_tile(tile_index: int) -> list:
+    def _get_path_to_tile(tile_index: int, orientation: int = 0, width: int = 0, height: int = 0) -> list:
         """
         Find the path to a tile and generate the sequence of commands to move to it.
         """
         if tile_index <= 0:
             return []
+        return list(plan_relative(*tile_offset(tile_index), orientation, width, height))
 
-        path = []
-        level = 0
-        tiles_in_level = 1
-        # Calculate the depth of the tile
-        while tile_index >= tiles_in_level:
-            tile_index -= tiles_in_level
-            level += 1
-            tiles_in_level = 2 * level + 1
-        # Now tile_index is the index in the current level
-
-        # 1. Move to the correct level
-        path.extend(["Forward"] * level)
-
-        # 2. Move to the correct tile in the level
-        center_of_level = level
-        if tile_index < center_of_level:
-            path.append("Left")
-            # Move to the left side of the level
-            path.extend(["Forward"] * (center_of_level - tile_index))
-        elif tile_index > center_of_level:
-            path.append("Right")
-            # Move to the right side of the level
-            path.extend(["Forward"] * (tile_index - center_of_level))
-        else:
-            # Already at the center of the level
-            pass
-        return path
+    def _path_to(self, dx: int, dy: int) -> list:
+        """
+        Shortest path to the tile dx to the right and dy forward, wrapping around the map.
+        """
+        return list(plan_relative(dx, dy, self.world_map.orientation, self.world_map.width, self.world_map.height))
+
+    def _path_to_tile(self, tile_index: int) -> list:
+        return self._path_to(*tile_offset(tile_index)) if tile_index > 0 else []
 
     @staticmethod
-    def _find_closest_ressource(vision: list[str], ressource_name: str) -> int:
+    def _find_closest_ressource(vision: Vision, ressource_name: str) -> int:
         """
         Find the closest tile in vision containing the specifies ressource.
         Returns the tile index, or -1 if not found.
         """
-        if not vision:
-            return -1
-        for i, tile_content in enumerate(vision):
-            if ressource_name in tile_content:
-                return i
-        return -1
+        return vision.closest(ressource_name)
 
     @staticmethod
     def _check_elevation_requirements(level: int, inventory: dict[str, int]) -> (dict[str, str] | dict):
@@ -84,12 +120,151 @@ class DecisionEngine(ZappyServer, PlayerState):
                 missing[stone] = required_count - inventory.get(stone, 0)
         return missing
 
-    def _respond_to_broadcast(self) -> bool:
-        if self.is_responding_to_broadcast and not self.action_plan:
-            self.is_responding_to_broadcast = False
+    def level_up(self) -> None:
+        """
+        Record the server time spent at the level we leave, counted in the
+        time units of the commands answered meanwhile.
+        """
+        units = self.clock.units - self._level_started_units
+        self.level_units[self.level] = units
+        self.metrics.level_time.labels(level=str(self.level)).observe(units)
+        logger.info("Level %s took %s time units.", self.level, units)
+        self._level_started_units = self.clock.units
+        PlayerState.level_up(self)
+
+    def optimize_action_plan(self) -> None:
+        """
+        Drop the planned commands that would not change anything, see zappy.peephole.
+        """
+        planned = len(self.action_plan)
+        self.action_plan = optimize(self.action_plan, self.world_map, self.level,
+                                    [pending.command for pending in self.scheduler.pending])
+        if len(self.action_plan) < planned:
+            logger.debug("Decision: Dropped %s useless commands from the plan.", planned - len(self.action_plan))
+            self.metrics.plan_commands_removed.labels().inc(planned - len(self.action_plan))
+
+    def plan_failed(self, command: str) -> None:
+        """
+        A refused Incantation means the tile is not what we saw. A Take
+        answered ko only spoils itself: the moves after it still lead
+        where they did. The rest of the plan is kept when it still collects
+        something else, without the Takes of what someone beat us to; anything
+        else cancels the plan.
+        """
+        if command == "Incantation":
+            # The tile is not what we saw: look again before another try
+            self.reset_vision()
+        elif command.startswith("Take "):
+            self.action_plan = [planned for planned in self.action_plan if planned != command]
+            if any(planned.startswith("Take ") for planned in self.action_plan):
+                self.optimize_action_plan()
+                return
+        PlayerState.plan_failed(self, command)
+
+    def respawn(self) -> None:
+        PlayerState.respawn(self)
+        self._level_started_units = self.clock.units
+
+    def on_team_message(self, message: TeamMessage, direction: int, state: PlayerState) -> None:
+        """
+        Follow the best leader gathering players for our level, count the
+        teammates on their way to our own rendezvous.
+        """
+        gathering = self.gathering
+        heading = self._heading(direction)
+        if heading is not None:
+            self.density.heard_teammate(heading, self.world_map.time)
+        if message.level != self.level:
+            return
+        if message.kind == KIND_INCANTATION:
+            if gathering.is_from_leader(message):
+                gathering.heard(heading, self.clock.now())
+            elif gathering.role and not gathering.outranked_by(message):
+                return
+            elif message.players == 0 or self.inventory["food"] * FOOD_UNITS < self.tuning.food_survival:
+                return # that leader has every player it needs, or we can't afford to help
+            else:
+                logger.info("Following rendezvous %s for level %s from direction %s.",
+                            message.rendezvous, message.level, direction)
+                # Our own followers are told to join the better rendezvous
+                self._leave_gathering()
+                gathering.follow(message, heading, self.clock.now())
+        elif message.kind == KIND_JOIN:
+            if gathering.leading and message.rendezvous == gathering.rendezvous:
+                gathering.followers.add(message.sender)
+        elif message.kind == KIND_DISBAND:
+            if gathering.following and gathering.is_from_leader(message):
+                logger.info("Rendezvous %s was called off.", message.rendezvous)
+                gathering.reset()
+
+    def _heading(self, direction: int) -> (tuple[int, int] | None):
+        """
+        Where a sound from direction comes from, in the world map's axes.
+        """
+        if direction not in DIRECTION_OFFSETS:
+            return None
+        return self.world_map.to_frame(*DIRECTION_OFFSETS[direction])
+
+    def _broadcast(self, message: TeamMessage) -> bool:
+        """
+        Send a team message, False when the rate limit is reached.
+        """
+        text = self.broadcasts.encode(message)
+        return text is not None and self.send_command(f"Broadcast {text}")
+
+    def _leave_gathering(self) -> None:
+        """
+        Stop leading or following, telling our followers when we led.
+        """
+        gathering = self.gathering
+        if gathering.leading:
+            logger.info("Calling off rendezvous %s.", gathering.rendezvous)
+            self._broadcast(TeamMessage(KIND_DISBAND, self.level, rendezvous=gathering.rendezvous))
+        gathering.reset()
+
+    def _converge(self) -> bool:
+        """
+        Walk towards the beacons of our leader, wait once its sound comes
+        from our own tile.
+        """
+        gathering = self.gathering
+        if not gathering.following:
+            return False
+        if gathering.leader_lost(self.clock.now(), self.clock.frequency):
+            logger.info("Lost the leader of rendezvous %s.", gathering.rendezvous)
+            gathering.reset()
+            return False
+        if not gathering.joined:
+            gathering.joined = self._broadcast(TeamMessage(KIND_JOIN, self.level, rendezvous=gathering.rendezvous))
+        heading = gathering.next_hop()
+        if heading is not None:
+            logger.debug("Decision: Converging to rendezvous %s, heading %s.", gathering.rendezvous, heading)
+            self.action_plan = self._path_to(*self.world_map.from_frame(*heading))
+            self.reset_vision()
+        else:
+            # On the leader's tile, or waiting for its next beacon
             self.send_command("Look")
-            return True
-        return False
+        return True
+
+    def _recall_world_map(self) -> bool:
+        """
+        Without a fresh Look, walk to a needed resource remembered by the world map.
+        Leaders stay on their rendezvous, followers walk by the beacons.
+        """
+        if self.vision or self.gathering.role:
+            return False
+        if self.inventory.get("food", 0) * FOOD_UNITS < self.tuning.food_survival:
+            wanted = ["food"]
+        else:
+            wanted = list(self.facts.missing_stones())
+        remembered = self.world_map.nearest(wanted) if wanted else None
+        if remembered is None:
+            return False
+        item, x, y = remembered
+        logger.debug("Decision: Remembering %s at (%s, %s), going there without looking.", item, x, y)
+        self.action_plan = self._path_to(*self.world_map.relative(x, y))
+        self.action_plan.append(TAKE[item])
+        return True
 
     def _update_vision(self) -> bool:
         if not self.vision:
@@ -97,116 +272,254 @@ class DecisionEngine(ZappyServer, PlayerState):
             return True
         return False
 
+    def _take_part(self) -> bool:
+        """
+        Stay on the tile, looking, until the ritual we take part in ends.
+        """
+        if not self.scheduler.elevations:
+            return False
+        logger.debug("Decision: Taking part in an elevation ritual, staying on the tile.")
+        self.send_command("Look")
+        self.reset_vision()
+        return True
+
+    def _fetch_food(self, life: int) -> None:
+        """
+        Go for the food bringing us to life time units.
+        """
+        food_wanted = life // FOOD_UNITS - self.inventory.get("food", 0) + 1
+        collection = self.facts.collection("food", {"food": food_wanted})
+        if collection:
+            # Pick up every visible food we need in a single pass
+            logger.debug("Decision: Collecting %s in %s time units.", collection.taken, collection.time)
+            self.action_plan = collection.commands
+        elif not self._head_for_density({"food": 1.0}):
+            # If no food is visible and the map can't tell, move randomly to find some.
+            self.send_command(random.choice(["Forward", "Left", "Right"]))
+        self.reset_vision()  # Vision would be invalid after moving
+
     def _survive(self) -> bool:
-        if self.inventory.get("food", 0) * 126 < FOOD_SURVIVAL_THRESHOLD:
+        if self.inventory.get("food", 0) * FOOD_UNITS < self.tuning.food_survival:
             logger.debug("Decision: Low on food, must find some to survive.")
-            self.is_responding_to_broadcast = False
-            food_tile_index = self._find_closest_ressource(self.vision, "food")
-
-            # If there is food on the current tile, take it.
-            if food_tile_index == 0:
-                self.send_command("Take food")
-            elif food_tile_index > 0:
-                # If food is visible on another tile, move towards it.
-                logger.debug(f"Decision: Found food on tile {food_tile_index}. Moving towards it.")
-                self.action_plan = self._get_path_to_tile(food_tile_index)
-                self.action_plan.append("Take food")
-            else:
-                # If no food is visible, move randomly to find some.
-                self.send_command(random.choice(["Forward", "Left", "Right"]))
-            self.vision = []  # Vision would be invalid after moving
+            self._leave_gathering()
+            self._fetch_food(self.tuning.food_survival)
             return True
         return False
 
     def _reproduct(self) -> bool:
         # Fork when we have enough food and are at a decent level
-        logger.debug(f"check value : {self.inventory.get('food', 0) * 126}")
-        logger.debug(f'Food attendue : {FOOD_SURVIVAL_THRESHOLD}')
-        if (self.inventory.get("food", 0) * 126 >= FOOD_SURVIVAL_THRESHOLD and
+        logger.debug("check value : %s", self.inventory.get('food', 0) * FOOD_UNITS)
+        logger.debug("Food attendue : %s", self.tuning.food_survival)
+        if (self.inventory.get("food", 0) * FOOD_UNITS >= self.tuning.food_survival and
             self.level >= 2 and
             self.timer_fork == 0):
             logger.debug("Decision: Conditions are good for reproduction. Forking...")
             self.send_command("Fork")
-            self.timer_fork = FORK_TIMER
+            self.timer_fork = self.tuning.fork_timer
             return True
         return False
 
+    def _tile_shortfall(self) -> tuple[list[str], bool]:
+        """
+        Set commands putting the stones missing on our tile from our inventory,
+        and whether some are missing from both.
+        """
+        commands = []
+        short = False
+        for stone, required in ELEVATION_REQUIREMENTS[self.level][1].items():
+            missing = required - self.vision.count(0, stone)
+            if missing > 0:
+                held = min(missing, self.inventory[stone])
+                commands.extend([SET[stone]] * held)
+                short = short or held < missing
+        return commands, short
+
     def _elevate(self) -> bool:
-        needed_for_elevation = self._check_elevation_requirements(self.level, self.inventory)
-        if not needed_for_elevation:
-            if self.inventory.get("food", 0) * 126 < 300 + (2 * 126): # 300 time units for incantation + 2 * 126 for the next level
-                logger.debug("Decision: Ready for elevation, but need food first to survive the ritual.")
-                self.send_command("Look")
-                return True
+        gathering = self.gathering
+        if self.facts.elevation_needs() and not gathering.leading:
+            return False
+        if self.inventory["food"] * FOOD_UNITS < self.tuning.incantation_food:
+            logger.debug("Decision: Ready for elevation, but need food first to survive the ritual.")
+            self.send_command("Look")
+            return True
+        stones, short = self._tile_shortfall()
+        if short:
+            # Someone took the stones we set on the rendezvous tile
+            self._leave_gathering()
+            return False
 
-            players_needed = ELEVATION_REQUIREMENTS[self.level][0]
-            players_on_tile = self.vision[0].count("player")
-
-            if players_on_tile >= players_needed:
-                logger.debug("Decision: I have all stones and enough players for the next level. Preparing for incantation.")
-                self.is_responding_to_broadcast = False
-                # Setting stones on the tile
-                requirements = ELEVATION_REQUIREMENTS[self.level][1]
-                for stone, count in requirements.items():
-                    if count > 0:
-                        for _ in range(count):
-                            self.action_plan.append(f"Set {stone}")
-                #Starting the Incantation
-                self.action_plan.append("Incantation")
-            else:
-                logger.debug(f"Decision: Waiting for {players_needed - players_on_tile} more players to start incantation.")
-                message = f"{self.team_name}:Incantation:{self.level}"
-                self.send_command(f"Broadcast {message}")
-                # Looking around while waiting for more players
-                self.send_command("Look")
+        players_needed = ELEVATION_REQUIREMENTS[self.level][0]
+        players_on_tile = self.facts.players_on_tile()
+        if players_on_tile >= players_needed:
+            logger.debug("Decision: I have all stones and enough players for the next level. Preparing for incantation.")
+            self.action_plan.extend(stones)
+            self.action_plan.append("Incantation")
             return True
-        return False
+
+        if not gathering.leading:
+            # Enough food to wait for teammates without starving into calling it off
+            lead_food = self.tuning.food_survival + self.tuning.incantation_food
+            if self.inventory["food"] * FOOD_UNITS < lead_food:
+                logger.debug("Decision: Stocking up food before leading a rendezvous.")
+                self._fetch_food(lead_food)
+                return True
+            rendezvous = gathering.last_led(self.level) or random.getrandbits(16) or 1
+            gathering.lead(self.level, rendezvous, self.broadcasts.sender)
+            logger.info("Leading rendezvous %s for level %s.", gathering.rendezvous, self.level)
+        if stones and gathering.followers:
+            # Teammates are on their way, the stones will be on the tile when they arrive
+            logger.debug("Decision: Setting %s stones ahead of the rendezvous.", len(stones))
+            self.action_plan.extend(stones)
+            return True
+        # Teammates on their way are counted as arrived
+        players_missing = players_needed - max(players_on_tile, 1 + len(gathering.followers))
+        logger.debug("Decision: Waiting for %s more players to start incantation.", players_needed - players_on_tile)
+        self._call_for_incantation(players_missing)
+        # Looking around while waiting for more players
+        self.send_command("Look")
+        return True
+
+    def _call_for_incantation(self, players_missing: int) -> bool:
+        """
+        Stream a beacon of our rendezvous, unless one is still in flight or the rate limit is reached.
+        """
+        if self.scheduler.is_pending("Broadcast"):
+            return False
+        message = TeamMessage(KIND_INCANTATION, self.level, max(players_missing, 0),
+                              self.world_map.x, self.world_map.y, rendezvous=self.gathering.rendezvous)
+        return self._broadcast(message)
+
+    def _gather_collection(self) -> (CollectionPlan | None):
+        """
+        One pass collecting missing stones, and some food on the way.
+        """
+        wanted = dict(self.facts.missing_stones())
+        if not wanted:
+            return None
+        # Grab some food on the way, stones are worth more
+        wanted["food"] = max(0, self.tuning.food_comfort - self.inventory.get("food", 0))
+        return self.facts.collection("gather", wanted)
 
     def _gather(self) -> bool:
-        needed_for_elevation = self._check_elevation_requirements(self.level, self.inventory)
-        closest_stone = {"stone": None, "tile_index": -1}
-        for stone in needed_for_elevation:
-            tile_index = self._find_closest_ressource(self.vision, stone)
-            if tile_index != -1:
-                # First stone found or closest one
-                if closest_stone["tile_index"] == -1 or tile_index < closest_stone["tile_index"]:
-                    closest_stone["stone"] = stone
-                    closest_stone["tile_index"] = tile_index
-
-        if closest_stone["stone"]:
-            stone_to_get = closest_stone["stone"]
-            tile_to_go = closest_stone["tile_index"]
-            logger.debug(f"Decision: Found {stone_to_get} on tile {tile_to_go}. Moving towards it.")
-            if tile_to_go == 0:
-                self.send_command(f"Take {stone_to_get}")
-            else:
-                self.action_plan = self._get_path_to_tile(tile_to_go)
-                self.action_plan.append(f"Take {stone_to_get}")
+        collection = self._gather_collection()
+        missing = self.facts.missing_stones()
+        if not collection or not any(item in missing for item in collection.taken):
+            return False
 
-            self.vision = []  # Vision would be invalid after moving
-            return True
-        return False
+        logger.debug("Decision: Collecting %s in %s time units.", collection.taken, collection.time)
+        self.action_plan = collection.commands
+        self.reset_vision()  # Vision would be invalid after moving
+        return True
+
+    def _head_for_density(self, wanted: dict[str, float]) -> bool:
+        """
+        Take one step towards the region where we expect to find the most of
+        wanted per time unit. A Look after every step shows the most new
+        tiles per time unit: a whole row of the cone for two commands.
+        """
+        target = self.density.target(self.world_map, wanted)
+        if target is None:
+            return False
+        hop = []
+        for command in self._path_to(*self.world_map.relative(*target)):
+            hop.append(command)
+            if command == "Forward":
+                break
+        logger.debug("Decision: Heading for the region around %s, %s.", target, hop)
+        self.action_plan = hop
+        return True
+
+    def _exploration_wants(self) -> dict[str, float]:
+        """
+        Weight of every item exploring should look for: the stones we miss,
+        and food, more of it the further we are from comfort.
+        """
+        wanted: dict[str, float] = dict(self.facts.missing_stones())
+        wanted["food"] = max(self.tuning.food_comfort - self.inventory.get("food", 0), 1)
+        return wanted
 
     def _explore(self) -> bool:
         logger.debug("Decision: Exploring the world to find resources.")
-        self.send_command("Forward")
-        # A bit of random to not go only forward
-        if random.randint(0, 5) == 0:
-            self.send_command(random.choice(["Left", "Right"]))
-        self.vision = []
+        if not self._head_for_density(self._exploration_wants()):
+            self.send_command("Forward")
+            # A bit of random to not go only forward
+            if random.randint(0, 5) == 0:
+                self.send_command(random.choice(["Left", "Right"]))
+        self.reset_vision()
         return True
 
+    def food_thresholds(self) -> list[int]:
+        """
+        Life (in time units) at which the decisions change, the clock polls Inventory around them.
+        """
+        return [self.tuning.food_survival, self.tuning.incantation_food]
+
+    def _score_goals(self, starving: bool, fork_ready: bool) -> list[tuple[float, Callable[[], bool]]]:
+        """
+        Utility of every goal worth pursuing in the current state, best first.
+        """
+        food_life = self.inventory.get("food", 0) * FOOD_UNITS
+        food_survival = self.tuning.food_survival
+        gathering = self.gathering
+        goals = [(UTILITY_EXPLORE, self._explore)]
+        if self.scheduler.elevations:
+            goals.append((UTILITY_RITUAL, self._take_part))
+        # Followers find their way by the beacons, not by looking
+        if not self.vision and not gathering.following:
+            if not gathering.leading:
+                goals.append((UTILITY_RECALL, self._recall_world_map))
+            goals.append((UTILITY_LOOK, self._update_vision))
+        if starving:
+            goals.append((UTILITY_SURVIVE + UTILITY_STARVING * (1 - food_life / food_survival), self._survive))
+        if gathering.following:
+            goals.append((UTILITY_CONVERGE, self._converge))
+        elif gathering.leading or not self.facts.elevation_needs():
+            goals.append((UTILITY_ELEVATE, self._elevate))
+        # The goals above gathering always act when they apply, only plan a
+        # collection when it can actually be chosen
+        best = max(utility for utility, _ in goals)
+        collection = self._gather_collection() if self.vision and best < UTILITY_GATHER else None
+        if collection:
+            missing = self.facts.missing_stones()
+            # Worth more when a single pass brings most of what we miss
+            collected = sum(1 for item in collection.taken if item in missing)
+            goals.append((UTILITY_GATHER + UTILITY_GATHER_ALL * collected / sum(missing.values()), self._gather))
+        if fork_ready:
+            goals.append((UTILITY_REPRODUCE, self._reproduct))
+        goals.sort(key=lambda goal: goal[0], reverse=True)
+        return goals
+
+    def predict_food(self) -> None:
+        """
+        Count the food the clock says we ate since the last Inventory.
+        """
+        predicted_food = self.clock.predicted_food()
+        if predicted_food is not None:
+            self.set_food(predicted_food)
+
     def make_decision(self):
         """
-        Make decisions based on the current state of the AI.
-        This method should be implemented with the AI's logic.
+        Pursue the goal with the best utility, falling back on the next ones
+        when it turns out it can't be acted upon. Utilities are only scored
+        again when a fact they depend on changed. The plan is cleaned of the
+        commands that would not change anything before it is sent.
+        """
+        self.predict_food()
+        starving = self.inventory["food"] * FOOD_UNITS < self.tuning.food_survival
+        self.decide(starving, not starving and self.level >= 2 and self.timer_fork == 0)
+
+    def decide(self, starving: bool, fork_ready: bool) -> None:
+        """
+        make_decision once the food is counted: starving when under the
+        survival threshold, fork_ready when a Fork is allowed.
         """
-        actions = [self._update_vision,
-                   self._survive,
-                   self._elevate,
-                   self._respond_to_broadcast,
-                   self._gather,
-                   self._reproduct,
-                   self._explore]
+        key = (self.vision_revision, self.inventory_revision, self.level,
+               self.gathering.role, bool(self.action_plan), fork_ready,
+               bool(self.scheduler.elevations))
+        if key != self._goals_key:
+            self._goals_key = key
+            self._goals = self._score_goals(starving, fork_ready)
 
-        any(action() for action in actions)
+        any(action() for _, action in self._goals)
+        if self.action_plan:
+            self.optimize_action_plan()
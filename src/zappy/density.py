@@ -0,0 +1,214 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## density
+##
+
+import math
+from array import array
+from collections import deque
+from . import ACTION_SPEED
+from .planner import plan_relative, route_time
+from .vision import Vision
+from .world_map import WorldMap, RESOURCE_ITEMS, RESOURCE_INDEX, STALE_HALF_LIFE, NEVER_SEEN as CELL_NEVER_SEEN
+
+REGION_SIDE = 4 # tiles
+SMOOTHING = 0.5 # weight of a new Look in a region's estimate
+# Items per tile the reference server keeps on the map, what unseen ground holds
+PRIOR_DENSITY = {"food": 0.5, "linemate": 0.3, "deraumere": 0.15, "sibur": 0.1,
+                 "mendiane": 0.1, "phiras": 0.08, "thystame": 0.05}
+NEVER_SEEN = -1
+# Teammates heard recently sweep the ground in their direction
+TEAMMATE_MEMORY = 2 * STALE_HALF_LIFE # in answered commands
+TEAMMATE_PENALTY = 0.5
+MAX_TEAMMATES = 8
+# A region we head for is kept while worth this share of the best one, turning back and forth wastes moves
+GOAL_HYSTERESIS = 0.7
+LOOK_TIME = ACTION_SPEED["Look"]
+# Sight weights are powers of two of the time since an epoch, moved forward before they grow too large
+REBASE_AGE = 32 * STALE_HALF_LIFE
+
+class DensityMap:
+    """
+    How many resources of every kind each region of the world map holds per
+    tile, estimated from every Look, and when we last saw it.
+    Exploration heads for the region where we expect to discover the most
+    of what we want per time unit spent reaching it: ground seen recently
+    has nothing new to show and unseen ground holds what the server spawns.
+    Regions in the direction of teammates heard recently are worth less,
+    they are probably sweeping them already.
+    """
+    __slots__ = ("width", "height", "columns", "rows", "estimates", "seen_at", "teammates", "goal",
+                 "region_of", "region_tiles", "sight", "epoch")
+
+    def __init__(self) -> None:
+        self.width = 0
+        self.height = 0
+        self.columns = 0
+        self.rows = 0
+        self.estimates = array('f')
+        self.seen_at = array('i')
+        # (x, y) heading of a teammate in the world map's axes, answered commands when heard
+        self.teammates: deque[tuple[int, int, int]] = deque(maxlen=MAX_TEAMMATES)
+        self.goal: int | None = None # region we are heading for
+        self.region_of = array('H') # region of every cell of the world map
+        self.region_tiles = array('H')
+        # Sum over the seen cells of every region of 2 ** ((seen - epoch) / STALE_HALF_LIFE):
+        # times 2 ** ((epoch - now) / STALE_HALF_LIFE), the sum of their world map confidences
+        self.sight = array('d')
+        self.epoch = 0
+
+    def resize(self, width: int, height: int) -> None:
+        """
+        Cover a width x height world map frame, forgetting every estimate.
+        """
+        self.width = width
+        self.height = height
+        self.columns = -(-width // REGION_SIDE)
+        self.rows = -(-height // REGION_SIDE)
+        regions = self.columns * self.rows
+        self.estimates = array('f', bytes(4 * regions * len(RESOURCE_ITEMS)))
+        self.seen_at = array('i', [NEVER_SEEN]) * regions
+        self.goal = None
+        self.region_of = array('H', [self._region(x, y) for y in range(height) for x in range(width)])
+        self.region_tiles = array('H', bytes(2 * regions))
+        for region in self.region_of:
+            self.region_tiles[region] += 1
+        self.sight = array('d', bytes(8 * regions))
+        self.epoch = 0
+
+    def __bool__(self) -> bool:
+        return self.columns > 0
+
+    def _region(self, x: int, y: int) -> int:
+        return (y // REGION_SIDE) * self.columns + x // REGION_SIDE
+
+    def observe(self, world_map: WorldMap, vision: Vision) -> None:
+        """
+        Blend a Look answer, seen from the world map's pose, into the regions
+        it covers. Called before the world map folds it: the cells it shows
+        are no longer unknown, their previous sight is replaced.
+        """
+        if not self or not world_map:
+            return
+        now = world_map.time
+        self._rebase(now)
+        cells = world_map.cone_cells(len(vision))
+        region_of = self.region_of
+        sight = self.sight
+        last_seen = world_map.last_seen
+        fresh = 2.0 ** ((now - self.epoch) / STALE_HALF_LIFE)
+        # A small world shows some cells twice
+        for cell in dict.fromkeys(cells):
+            region = region_of[cell]
+            seen = last_seen[cell]
+            if seen != CELL_NEVER_SEEN:
+                sight[region] -= 2.0 ** ((seen - self.epoch) / STALE_HALF_LIFE)
+            sight[region] += fresh
+
+        regions = [region_of[cell] for cell in cells]
+        tiles: dict[int, int] = {}
+        for region in regions:
+            tiles[region] = tiles.get(region, 0) + 1
+        items = len(RESOURCE_ITEMS)
+        found = {region: [0] * items for region in tiles}
+        for index, item in enumerate(RESOURCE_ITEMS):
+            for region, count in zip(regions, vision.column(item)):
+                if count:
+                    found[region][index] += count
+        estimates = self.estimates
+        for region, counts in found.items():
+            base = region * items
+            seen = self.seen_at[region] != NEVER_SEEN
+            for index, count in enumerate(counts):
+                observed = count / tiles[region]
+                estimates[base + index] += SMOOTHING * (observed - estimates[base + index]) if seen else observed
+            self.seen_at[region] = now
+
+    def _rebase(self, now: int) -> None:
+        if now - self.epoch < REBASE_AGE:
+            return
+        scale = 2.0 ** ((self.epoch - now) / STALE_HALF_LIFE)
+        sight = self.sight
+        for region in range(len(sight)):
+            sight[region] *= scale
+        self.epoch = now
+
+    def heard_teammate(self, heading: tuple[int, int], now: int) -> None:
+        self.teammates.append((heading[0], heading[1], now))
+
+    def _confidence(self, region: int, now: int) -> float:
+        seen_at = self.seen_at[region]
+        return 0.0 if seen_at == NEVER_SEEN else 0.5 ** ((now - seen_at) / STALE_HALF_LIFE)
+
+    def _unknown_tiles(self, now: int) -> list[float]:
+        """
+        Tiles of every region whose content the world map can't vouch for anymore.
+        """
+        self._rebase(now)
+        decay = 2.0 ** ((self.epoch - now) / STALE_HALF_LIFE)
+        return [max(tiles - sight * decay, 0.0) for tiles, sight in zip(self.region_tiles, self.sight)]
+
+    def _crowding(self, dx: int, dy: int, now: int) -> float:
+        """
+        Share of a region's worth left once the teammates heading its way took theirs.
+        """
+        length = math.hypot(dx, dy)
+        factor = 1.0
+        for hx, hy, heard_at in self.teammates:
+            age = now - heard_at
+            if age >= TEAMMATE_MEMORY or length == 0:
+                continue
+            alignment = (dx * hx + dy * hy) / (length * math.hypot(hx, hy))
+            factor *= 1.0 - TEAMMATE_PENALTY * max(alignment, 0.0) * (1.0 - age / TEAMMATE_MEMORY)
+        return factor
+
+    def expected_yield(self, region: int, wanted: dict[str, float], now: int, unknown: float) -> float:
+        """
+        Wanted items we expect to discover on the unknown tiles of a region:
+        as dense as we saw it, drifting back to the server's densities as
+        the sight gets old.
+        """
+        confidence = self._confidence(region, now)
+        base = region * len(RESOURCE_ITEMS)
+        worth = 0.0
+        for item, weight in wanted.items():
+            prior = PRIOR_DENSITY.get(item, 0.0)
+            estimate = self.estimates[base + RESOURCE_INDEX[item]] if confidence else prior
+            worth += weight * (prior + (estimate - prior) * confidence)
+        return worth * unknown
+
+    def _center(self, region: int) -> tuple[int, int]:
+        x = min((region % self.columns) * REGION_SIDE + REGION_SIDE // 2, self.width - 1)
+        y = min((region // self.columns) * REGION_SIDE + REGION_SIDE // 2, self.height - 1)
+        return x, y
+
+    def target(self, world_map: WorldMap, wanted: dict[str, float]) -> (tuple[int, int] | None):
+        """
+        Center of the region with the best expected yield per time unit, None
+        when the map is disabled or nothing is worth the trip. The region we
+        were heading for is kept unless another one is much better.
+        """
+        if not self or not world_map or not wanted:
+            return None
+        now = world_map.time
+        unknown = self._unknown_tiles(now)
+        rates: dict[int, float] = {}
+        for region in range(self.columns * self.rows):
+            right, forward = world_map.relative(*self._center(region))
+            if right == 0 and forward == 0:
+                continue
+            worth = self.expected_yield(region, wanted, now, unknown[region])
+            if worth <= 0.0:
+                continue
+            route = plan_relative(right, forward, world_map.orientation, world_map.width, world_map.height)
+            frame_dx, frame_dy = world_map.to_frame(right, forward)
+            rates[region] = worth * self._crowding(frame_dx, frame_dy, now) / (route_time(route) + LOOK_TIME)
+        if not rates:
+            self.goal = None
+            return None
+        best = max(rates, key=rates.__getitem__)
+        if self.goal not in rates or rates[self.goal] < GOAL_HYSTERESIS * rates[best]:
+            self.goal = best
+        return self._center(self.goal)
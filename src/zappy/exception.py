@@ -10,3 +10,13 @@ class ZappyError(Exception):
         self.where = where
         self.what = what
         super().__init__(f"An error happened at {where}: {what}")
+
+class ConnectionLost(ZappyError):
+    """
+    The connection to the server broke or the server stopped answering.
+    """
+
+class ConnectionClosed(ConnectionLost):
+    """
+    The server closed the connection.
+    """
@@ -0,0 +1,66 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## facts
+##
+
+from typing import Any, Callable
+from .player import PlayerState
+from .collector import CollectionPlan, plan_collection
+
+class Facts:
+    """
+    Facts shared by the decision rules, derived from the parsed state.
+    Each fact is cached with the revisions of the inputs it was derived from
+    and only recomputed once one of them changed.
+    """
+    __slots__ = ("state", "_requirements", "_cache")
+
+    def __init__(self, state: PlayerState,
+                 requirements: Callable[[int, dict[str, int]], dict]) -> None:
+        self.state = state
+        self._requirements = requirements
+        self._cache: dict[Any, tuple[tuple, Any]] = {}
+
+    def _get(self, name: Any, key: tuple, compute: Callable[[], Any]) -> Any:
+        entry = self._cache.get(name)
+        if entry is None or entry[0] != key:
+            entry = self._cache[name] = (key, compute())
+        return entry[1]
+
+    def elevation_needs(self) -> dict:
+        """
+        Stones missing for the next elevation, as _check_elevation_requirements returns them.
+        """
+        state = self.state
+        return self._get("needs", (state.inventory_revision, state.level),
+                         lambda: self._requirements(state.level, state.inventory))
+
+    def missing_stones(self) -> dict[str, int]:
+        state = self.state
+        return self._get("missing", (state.inventory_revision, state.level),
+                         lambda: {stone: count for stone, count in self.elevation_needs().items() if stone != "status"})
+
+    def assume_elevation_needs(self, needs: dict, missing: dict[str, int]) -> None:
+        """
+        Take the elevation needs of the current inventory and level as computed
+        elsewhere (see AgentBatch). Both dicts may be shared, they are never modified.
+        """
+        state = self.state
+        key = (state.inventory_revision, state.level)
+        self._cache["needs"] = (key, needs)
+        self._cache["missing"] = (key, missing)
+
+    def players_on_tile(self) -> int:
+        state = self.state
+        return self._get("players", (state.vision_revision,),
+                         lambda: state.vision.count(0, "player") if state.vision else 0)
+
+    def collection(self, name: str, wanted: dict[str, int]) -> CollectionPlan:
+        """
+        Collection plan for wanted over the current vision, shared by the rules asking for the same thing.
+        """
+        state = self.state
+        key = (state.vision_revision, tuple(sorted(wanted.items())))
+        return self._get(("collection", name), key, lambda: plan_collection(state.vision, wanted))
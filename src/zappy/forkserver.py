@@ -0,0 +1,258 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## forkserver
+##
+
+import os
+import sys
+import time
+import socket
+import argparse
+import selectors
+from . import logger
+from .ai import ZappyAI, DEFAULT_RECONNECTS
+from .exception import ZappyError
+from .runtime import DEFAULT_MAX_AGENTS
+from .logger import configure_logging, stop_logging, DEFAULT_LOG_LEVEL, LOG_LEVELS
+
+DEFAULT_SOCKET = "/tmp/zappy-forkserver.sock"
+REAP_INTERVAL = 0.5
+
+AGENT_SUCCESS = 0
+AGENT_ERROR = 84
+
+def _request(path: str, line: str) -> socket.socket:
+    """
+    Send one request line to the forkserver, the socket is left open for the answers.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(path)
+    sock.sendall(f"{line}\n".encode('utf-8'))
+    sock.shutdown(socket.SHUT_WR)
+    return sock
+
+class ForkedAgent(ZappyAI):
+    """
+    A ZappyAI forked from the forkserver. It reports how long it took from the
+    spawn request to its first command, and asks the forkserver for new agents
+    when the server reports free slots or when it lays an egg.
+    """
+    __slots__ = ("socket_path", "requested_at", "requester")
+
+    def __init__(self, settings: argparse.Namespace, requested_at: float, requester: socket.socket | None) -> None:
+        ZappyAI.__init__(self, host=settings.host, port=settings.port, team_name=settings.name,
+                         team_key=settings.team_key)
+        self.max_reconnects = settings.reconnects
+        self.socket_path = settings.socket
+        self.requested_at: float | None = requested_at
+        self.requester = requester
+
+    def _notify(self, line: str) -> None:
+        try:
+            _request(self.socket_path, line).close()
+        except OSError as e:
+            logger.warning("Could not reach the forkserver: %s", e)
+
+    def _report_ready(self) -> None:
+        elapsed = (time.monotonic() - self.requested_at) * 1000
+        self.requested_at = None
+        logger.info("First command sent %.2f ms after the spawn request.", elapsed)
+        if self.requester is not None:
+            try:
+                self.requester.sendall(f"ready {os.getpid()} {elapsed:.3f}\n".encode('utf-8'))
+            except OSError:
+                pass # requested by an agent that did not wait for the answer
+            self.requester.close()
+            self.requester = None
+
+    def _receive_lines(self) -> None:
+        # The team name only leaves the transport's buffer on this flush
+        if self.requested_at is not None and self.transport.buffered:
+            self.transport.flush(self._receive_timeout())
+            self._report_ready()
+        ZappyAI._receive_lines(self)
+
+    def initial_connection(self, team_name: str) -> tuple[int, int]:
+        world_size = ZappyAI.initial_connection(self, team_name)
+        self._notify(f"connected {os.getpid()}")
+        return world_size
+
+    def on_free_slots(self, slots: int) -> None:
+        self._notify(f"spawn {slots} {os.getpid()}")
+
+    def on_egg_laid(self) -> None:
+        self._notify(f"spawn 1 {os.getpid()}")
+
+class ForkServer:
+    """
+    Resident process with the zappy package already imported, forking a
+    ready-to-connect agent for every slot it is asked to fill.
+    Requests are lines on a unix socket:
+        spawn COUNT [PID]  fork up to COUNT agents, PID is the requesting agent
+        connected PID      the agent PID finished its handshake
+    Every forked agent answers "ready PID MS" on the request's connection once
+    it sent its first command, "full" is answered for agents over the limit.
+    """
+    def __init__(self, settings: argparse.Namespace, max_agents: int = DEFAULT_MAX_AGENTS) -> None:
+        self.settings = settings
+        self.max_agents = max_agents
+        self.children: set[int] = set()
+        self.connecting: set[int] = set()
+        self.results: list[bool] = []
+        self.selector = selectors.DefaultSelector()
+        self.listener: socket.socket | None = None
+
+    def _fork_agent(self, requested_at: float, requester: socket.socket | None) -> int:
+        pid = os.fork()
+        if pid == 0:
+            self._run_child(requested_at, requester)
+        self.children.add(pid)
+        self.connecting.add(pid)
+        return pid
+
+    def _run_child(self, requested_at: float, requester: socket.socket | None) -> None:
+        """
+        Body of a forked agent, never returns.
+        """
+        code = AGENT_ERROR
+        try:
+            self.selector.close()
+            self.listener.close()
+            # The log writer thread did not survive the fork
+            configure_logging(self.settings.log_level)
+            agent = ForkedAgent(self.settings, requested_at, requester)
+            code = AGENT_SUCCESS if agent.run() else AGENT_ERROR
+        except ZappyError as e:
+            logger.error("An error occurred at: %s: %s", e.where, e.what)
+        finally:
+            stop_logging()
+            os._exit(code)
+
+    def _spawn(self, count: int, requester_pid: int | None, conn: socket.socket | None) -> None:
+        requested_at = time.monotonic()
+        if requester_pid is not None:
+            # Slots reported by an agent, minus the agents already on their way
+            self.connecting.discard(requester_pid)
+            count = max(count - len(self.connecting), 0)
+        allowed = min(count, self.max_agents - len(self.children))
+        for _ in range(allowed):
+            self._fork_agent(requested_at, conn)
+        if allowed < count and conn is not None:
+            try:
+                conn.sendall(b"full\n" * (count - allowed))
+            except OSError:
+                pass
+        logger.info("Forked %s agent(s), %s running.", allowed, len(self.children))
+
+    def _handle_request(self, conn: socket.socket) -> None:
+        conn.settimeout(1.0)
+        try:
+            # Not through makefile: the forked agents must be able to really close conn
+            data = b""
+            while b"\n" not in data:
+                chunk = conn.recv(256)
+                if not chunk:
+                    break
+                data += chunk
+            words = data.decode('utf-8').split()
+            match words:
+                case ["spawn", count, *pid]:
+                    self._spawn(int(count), int(pid[0]) if pid else None, conn)
+                case ["connected", pid]:
+                    self.connecting.discard(int(pid))
+                case _:
+                    conn.sendall(b"error unknown request\n")
+        except (OSError, ValueError) as e:
+            logger.warning("Bad forkserver request: %s", e)
+        finally:
+            conn.close()
+
+    def _reap(self) -> None:
+        while self.children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                return
+            self.children.discard(pid)
+            self.connecting.discard(pid)
+            self.results.append(os.waitstatus_to_exitcode(status) == AGENT_SUCCESS)
+
+    def serve(self) -> bool:
+        """
+        Serve spawn requests until interrupted.
+        """
+        path = self.settings.socket
+        if os.path.exists(path):
+            os.unlink(path)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(path)
+        self.listener.listen()
+        self.selector.register(self.listener, selectors.EVENT_READ)
+        logger.info("Forkserver for team %s ready on %s.", self.settings.name, path)
+        try:
+            if self.settings.agents:
+                self._spawn(self.settings.agents, None, None)
+            while True:
+                for _ in self.selector.select(REAP_INTERVAL):
+                    conn, _ = self.listener.accept()
+                    self._handle_request(conn)
+                self._reap()
+        except KeyboardInterrupt:
+            logger.info("Forkserver stopped, waiting for %s agent(s).", len(self.children))
+            for pid in list(self.children):
+                os.waitpid(pid, 0)
+        finally:
+            self.selector.close()
+            self.listener.close()
+            os.unlink(path)
+        return bool(self.results) and all(self.results)
+
+def spawn(path: str, count: int) -> list[float]:
+    """
+    Ask the forkserver for count agents and wait for them to send their first
+    command. Returns the time-to-first-command of every agent, in milliseconds.
+    """
+    timings = []
+    with _request(path, f"spawn {count}") as sock:
+        for line in sock.makefile('r'):
+            words = line.split()
+            if words and words[0] == "ready":
+                timings.append(float(words[2]))
+            elif words:
+                logger.warning("Forkserver answered: %s", line.strip())
+    return timings
+
+def main() -> None:
+    """
+    Run the forkserver, or ask a running one for agents.
+    """
+    parser = argparse.ArgumentParser(description="Zappy AI forkserver", add_help=False)
+    parser.add_argument('command', choices=("serve", "spawn"), help='Run the forkserver or ask it for agents')
+    parser.add_argument('-s', '--socket', type=str, default=DEFAULT_SOCKET, help='Unix socket of the forkserver')
+    parser.add_argument('-c', '--count', type=int, default=1, help='Agents to spawn (spawn)')
+    parser.add_argument('-p', '--port', type=int, default=4242, help='Port to connect to the Zappy server (serve)')
+    parser.add_argument('-n', '--name', type=str, default="team1", help='Name of the team to join (serve)')
+    parser.add_argument('-h', '--host', type=str, default='localhost', help='Host to connect to the Zappy server (serve)')
+    parser.add_argument('-k', '--team-key', type=str, default=None, help='Secret shared by the team to sign broadcasts (serve)')
+    parser.add_argument('-r', '--reconnects', type=int, default=DEFAULT_RECONNECTS, help='Reconnection attempts of an agent that lost the server (serve)')
+    parser.add_argument('-a', '--agents', type=int, default=0, help='Agents to spawn at start (serve)')
+    parser.add_argument('-m', '--max-agents', type=int, default=DEFAULT_MAX_AGENTS, help='Maximum number of running agents (serve)')
+    parser.add_argument('-l', '--log-level', type=str.upper, choices=LOG_LEVELS, default=DEFAULT_LOG_LEVEL, help='Minimum level of the messages to log')
+    args = parser.parse_args()
+    configure_logging(args.log_level)
+
+    if args.command == "serve":
+        sys.exit(AGENT_SUCCESS if ForkServer(args, args.max_agents).serve() else AGENT_ERROR)
+    try:
+        timings = sorted(spawn(args.socket, args.count))
+    except OSError as e:
+        logger.error("Could not reach the forkserver on %s: %s", args.socket, e)
+        sys.exit(AGENT_ERROR)
+    if timings:
+        logger.info("%s agent(s) sent their first command after %.2f ms (median), %.2f ms (max).",
+                    len(timings), timings[len(timings) // 2], timings[-1])
+    sys.exit(AGENT_SUCCESS if len(timings) == args.count else AGENT_ERROR)
+
+if __name__ == "__main__":
+    main()
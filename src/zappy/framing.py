@@ -0,0 +1,86 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## framing
+##
+
+import socket
+
+DEFAULT_CAPACITY = 64 * 1024
+
+class LineFramer:
+    """
+    Splits a byte stream into newline-terminated lines.
+    Data is received straight into a preallocated bytearray, newlines are only
+    searched in the bytes that were not scanned yet and every line is decoded
+    once, directly from a memoryview of the buffer.
+    """
+    __slots__ = ("_buffer", "_view", "_start", "_scan", "_end")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._start = 0 # first byte not handed out yet
+        self._scan = 0  # first byte not searched for a newline yet
+        self._end = 0   # end of the received data
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def _make_room(self) -> None:
+        """
+        Ensure there is free space after the data, compacting or growing the buffer.
+        """
+        if self._end < len(self._buffer):
+            return
+        size = self._end - self._start
+        if self._start > 0:
+            self._buffer[0:size] = self._buffer[self._start:self._end]
+        else:
+            # A single line fills the whole buffer, double it
+            self._view.release()
+            self._buffer.extend(bytes(len(self._buffer)))
+            self._view = memoryview(self._buffer)
+        self._scan -= self._start
+        self._start = 0
+        self._end = size
+
+    def _split(self) -> list[str]:
+        lines = []
+        buffer = self._buffer
+        view = self._view
+        while True:
+            index = buffer.find(b"\n", self._scan, self._end)
+            if index == -1:
+                self._scan = self._end
+                break
+            lines.append(str(view[self._start:index], 'utf-8'))
+            self._start = self._scan = index + 1
+        if self._start == self._end:
+            self._start = self._scan = self._end = 0
+        return lines
+
+    def recv_from(self, sock: socket.socket) -> (list[str] | None):
+        """
+        Receive once from sock and return every complete line, None when the peer closed.
+        """
+        self._make_room()
+        received = sock.recv_into(self._view[self._end:])
+        if not received:
+            return None
+        self._end += received
+        return self._split()
+
+    def feed(self, data: bytes) -> list[str]:
+        """
+        Append already received bytes and return every complete line.
+        """
+        offset = 0
+        while offset < len(data):
+            self._make_room()
+            chunk = min(len(data) - offset, len(self._buffer) - self._end)
+            self._view[self._end:self._end + chunk] = data[offset:offset + chunk]
+            self._end += chunk
+            offset += chunk
+        return self._split()
@@ -0,0 +1,302 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## game
+##
+
+import math
+import random
+from array import array
+from . import ACTION_SPEED, ELEVATION_REQUIREMENTS, FOOD_UNITS, ORIENTATIONS
+
+RESOURCES = ("food", "linemate", "deraumere", "sibur", "mendiane", "phiras", "thystame")
+DENSITIES = (0.5, 0.3, 0.15, 0.1, 0.1, 0.08, 0.05)
+STONES = RESOURCES[1:]
+RESPAWN_PERIOD = 20
+KINDS = len(RESOURCES)
+
+class Player:
+    def __init__(self, player_id: int, team: str, x: int, y: int, orientation: int, food: int) -> None:
+        self.id = player_id
+        self.team = team
+        self.x = x
+        self.y = y
+        self.orientation = orientation
+        self.level = 1
+        self.inventory = [0] * KINDS
+        self.inventory[0] = food
+        self.hunger = FOOD_UNITS
+        self.alive = True
+        self.incantation: "Incantation | None" = None
+
+class Incantation:
+    def __init__(self, leader: Player, participants: list[Player]) -> None:
+        self.leader = leader
+        self.level = leader.level
+        self.participants = participants
+
+class GameWorld:
+    """
+    Rules of the Zappy game, without any networking.
+    Time is counted in time units and only moves forward through advance().
+    Lines the server has to push on its own (broadcasts, ejections, deaths,
+    elevation notifications) are queued in outbox as (player_id, line).
+    The map is one flat array of KINDS counts per tile, with the total of
+    every resource kept alongside so respawning does not scan it.
+    """
+    def __init__(self, width: int, height: int, teams: list[str], slots: int,
+                 seed: int | None = None, start_food: int = 10) -> None:
+        self.width = width
+        self.height = height
+        self.random = random.Random(seed)
+        self.start_food = start_food
+        self.time = 0
+        self.grid = array('I', bytes(4 * KINDS * width * height))
+        self.totals = [0] * KINDS
+        self._cells = memoryview(self.grid)
+        self.players: dict[int, Player] = {}
+        self.slots = {team: slots for team in teams}
+        self.eggs: dict[str, list[tuple[int, int]]] = {team: [] for team in teams}
+        self.outbox: list[tuple[int, str]] = []
+        self._next_id = 0
+        self._spawn_resources()
+
+    def _tile(self, x: int, y: int) -> memoryview:
+        offset = ((y % self.height) * self.width + (x % self.width)) * KINDS
+        return self._cells[offset:offset + KINDS]
+
+    def _spawn_resources(self) -> None:
+        """
+        Top every resource back up to its target density.
+        """
+        area = self.width * self.height
+        for index, density in enumerate(DENSITIES):
+            target = max(1, int(area * density))
+            missing = max(0, target - self.totals[index])
+            for _ in range(missing):
+                self.grid[self.random.randrange(area) * KINDS + index] += 1
+            self.totals[index] += missing
+
+    def free_slots(self, team: str) -> int:
+        return self.slots.get(team, 0)
+
+    def join(self, team: str) -> (Player | None):
+        """
+        Connect a new player to a team, hatching an egg if there is one.
+        """
+        if self.slots.get(team, 0) <= 0:
+            return None
+        self.slots[team] -= 1
+        if self.eggs[team]:
+            x, y = self.eggs[team].pop(0)
+        else:
+            x, y = self.random.randrange(self.width), self.random.randrange(self.height)
+        player = Player(self._next_id, team, x, y, self.random.randrange(4), self.start_food)
+        self._next_id += 1
+        self.players[player.id] = player
+        return player
+
+    def leave(self, player: Player) -> None:
+        player.alive = False
+        self.players.pop(player.id, None)
+
+    def advance(self, units: int = 1) -> None:
+        """
+        Move time forward, feeding players and respawning resources.
+        Time jumps from one meal or respawn to the next, nothing else happens
+        in between.
+        """
+        while units > 0:
+            step = min(units, RESPAWN_PERIOD - self.time % RESPAWN_PERIOD,
+                       min((player.hunger for player in self.players.values()), default=units))
+            units -= step
+            self.time += step
+            for player in list(self.players.values()):
+                player.hunger -= step
+                if player.hunger > 0:
+                    continue
+                if player.inventory[0] > 0:
+                    player.inventory[0] -= 1
+                    player.hunger = FOOD_UNITS
+                else:
+                    self.outbox.append((player.id, "dead"))
+                    self.leave(player)
+            if self.time % RESPAWN_PERIOD == 0:
+                self._spawn_resources()
+
+    @staticmethod
+    def command_time(command: str) -> int:
+        return ACTION_SPEED.get(command.split(" ", 1)[0], 0)
+
+    def start_command(self, player: Player, command: str) -> (str | None):
+        """
+        Called when a command starts. Returns a line to send right away, if any.
+        """
+        if command == "Incantation":
+            return self._start_incantation(player)
+        return None
+
+    def finish_command(self, player: Player, command: str) -> str:
+        """
+        Called when a command is over. Returns the answer to send.
+        """
+        name, _, arg = command.partition(" ")
+        match name:
+            case "Forward":
+                dx, dy = ORIENTATIONS[player.orientation]
+                player.x = (player.x + dx) % self.width
+                player.y = (player.y + dy) % self.height
+                return "ok"
+            case "Right":
+                player.orientation = (player.orientation + 1) % 4
+                return "ok"
+            case "Left":
+                player.orientation = (player.orientation - 1) % 4
+                return "ok"
+            case "Look":
+                return self.look(player)
+            case "Inventory":
+                return "[" + ", ".join(f"{name} {count}" for name, count in zip(RESOURCES, player.inventory)) + "]"
+            case "Broadcast":
+                self._broadcast(player, arg)
+                return "ok"
+            case "Connect_nbr":
+                return str(self.free_slots(player.team))
+            case "Fork":
+                self.eggs[player.team].append((player.x, player.y))
+                self.slots[player.team] += 1
+                return "ok"
+            case "Eject":
+                return self._eject(player)
+            case "Take" | "Set":
+                return self._move_object(player, arg, name == "Take")
+            case "Incantation":
+                return self._finish_incantation(player)
+        return "ko"
+
+    def _move_object(self, player: Player, name: str, take: bool) -> str:
+        if name not in RESOURCES:
+            return "ko"
+        index = RESOURCES.index(name)
+        source, target = (self._tile(player.x, player.y), player.inventory)
+        if not take:
+            source, target = target, source
+        if source[index] <= 0:
+            return "ko"
+        source[index] -= 1
+        target[index] += 1
+        self.totals[index] += -1 if take else 1
+        return "ok"
+
+    def _players_at(self, x: int, y: int) -> list[Player]:
+        return [p for p in self.players.values() if p.x == x and p.y == y]
+
+    def _tile_content(self, x: int, y: int) -> str:
+        items = ["player"] * len(self._players_at(x, y))
+        for name, count in zip(RESOURCES, self._tile(x, y)):
+            items.extend([name] * count)
+        return " ".join(items)
+
+    def look(self, player: Player) -> str:
+        fx, fy = ORIENTATIONS[player.orientation]
+        rx, ry = ORIENTATIONS[(player.orientation + 1) % 4]
+        tiles = []
+        for depth in range(player.level + 1):
+            for side in range(-depth, depth + 1):
+                x = (player.x + fx * depth + rx * side) % self.width
+                y = (player.y + fy * depth + ry * side) % self.height
+                tiles.append(self._tile_content(x, y))
+        return "[" + ",".join(tiles) + "]"
+
+    def _shortest(self, delta: int, size: int) -> int:
+        delta %= size
+        return delta - size if delta > size // 2 else delta
+
+    def direction(self, receiver: Player, x: int, y: int) -> int:
+        """
+        Direction (0..8) from which a sound emitted at (x, y) reaches receiver.
+        """
+        dx = self._shortest(x - receiver.x, self.width)
+        dy = self._shortest(y - receiver.y, self.height)
+        if dx == 0 and dy == 0:
+            return 0
+        fx, fy = ORIENTATIONS[receiver.orientation]
+        rx, ry = ORIENTATIONS[(receiver.orientation + 1) % 4]
+        forward = dx * fx + dy * fy
+        right = dx * rx + dy * ry
+        angle = math.degrees(math.atan2(-right, forward)) % 360
+        return int(round(angle / 45)) % 8 + 1
+
+    def _broadcast(self, emitter: Player, text: str) -> None:
+        for player in self.players.values():
+            if player is not emitter:
+                direction = self.direction(player, emitter.x, emitter.y)
+                self.outbox.append((player.id, f"message {direction}, {text}"))
+
+    def _eject(self, player: Player) -> str:
+        dx, dy = ORIENTATIONS[player.orientation]
+        ejected = False
+        for other in self._players_at(player.x, player.y):
+            if other is player:
+                continue
+            other.x = (other.x + dx) % self.width
+            other.y = (other.y + dy) % self.height
+            self.outbox.append((other.id, f"eject: {self.direction(other, player.x, player.y)}"))
+            ejected = True
+        for team in self.eggs:
+            before = len(self.eggs[team])
+            self.eggs[team] = [egg for egg in self.eggs[team] if egg != (player.x, player.y)]
+            self.slots[team] -= before - len(self.eggs[team])
+            ejected = ejected or before != len(self.eggs[team])
+        return "ok" if ejected else "ko"
+
+    def _can_elevate(self, player: Player) -> (list[Player] | None):
+        if player.level >= 8 or player.incantation is not None:
+            return None
+        players_needed, stones = ELEVATION_REQUIREMENTS[player.level]
+        # Players inside another ritual can't take part in this one
+        participants = [p for p in self._players_at(player.x, player.y)
+                        if p.level == player.level and p.incantation is None]
+        if len(participants) < players_needed:
+            return None
+        tile = self._tile(player.x, player.y)
+        for index, name in enumerate(RESOURCES):
+            if name in stones and tile[index] < stones[name]:
+                return None
+        return participants
+
+    def _start_incantation(self, player: Player) -> str:
+        participants = self._can_elevate(player)
+        if participants is None:
+            return "ko"
+        incantation = Incantation(player, participants)
+        for participant in participants:
+            participant.incantation = incantation
+            if participant is not player:
+                self.outbox.append((participant.id, "Elevation underway"))
+        return "Elevation underway"
+
+    def _finish_incantation(self, player: Player) -> str:
+        incantation = player.incantation
+        if incantation is None or incantation.leader is not player:
+            return "ko"
+        for participant in incantation.participants:
+            if participant.incantation is incantation:
+                participant.incantation = None
+        if self._can_elevate(player) is None:
+            for participant in incantation.participants:
+                if participant is not player and participant.alive:
+                    self.outbox.append((participant.id, "ko"))
+            return "ko"
+        tile = self._tile(player.x, player.y)
+        for index, name in enumerate(RESOURCES):
+            used = ELEVATION_REQUIREMENTS[incantation.level][1].get(name, 0)
+            tile[index] -= used
+            self.totals[index] -= used
+        for participant in incantation.participants:
+            if participant.alive:
+                participant.level += 1
+                if participant is not player:
+                    self.outbox.append((participant.id, f"Current level: {participant.level}"))
+        return f"Current level: {player.level}"
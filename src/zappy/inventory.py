@@ -0,0 +1,86 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## inventory
+##
+
+import sys
+from array import array
+from enum import IntEnum
+from typing import Iterable, Iterator
+
+class Resource(IntEnum):
+    FOOD = 0
+    LINEMATE = 1
+    DERAUMERE = 2
+    SIBUR = 3
+    MENDIANE = 4
+    PHIRAS = 5
+    THYSTAME = 6
+
+RESOURCE_NAMES = tuple(resource.name.lower() for resource in Resource)
+# Plain ints: indexing the array with them is cheaper than with the enum members
+RESOURCE_INDEX = {name: index for index, name in enumerate(RESOURCE_NAMES)}
+EMPTY_COUNTS = array('I', bytes(4 * len(Resource)))
+
+# Every agent shares the same command strings instead of formatting its own
+TAKE = {name: sys.intern(f"Take {name}") for name in RESOURCE_NAMES}
+SET = {name: sys.intern(f"Set {name}") for name in RESOURCE_NAMES}
+
+class Inventory:
+    """
+    Resource counts in a fixed-size array indexed by Resource, updated in
+    place. Reads follow the dict interface the decision code was written
+    against, keyed by resource name; unknown names count as zero.
+    """
+    __slots__ = ("counts",)
+
+    def __init__(self, counts: dict[str, int] | None = None) -> None:
+        self.counts = array('I', EMPTY_COUNTS)
+        if counts:
+            self.assign(counts.items())
+
+    def assign(self, items: Iterable[tuple[str, int]]) -> None:
+        """
+        Replace every count, the resources not listed drop to zero.
+        """
+        counts = self.counts
+        counts[:] = EMPTY_COUNTS
+        for name, count in items:
+            index = RESOURCE_INDEX.get(name)
+            if index is not None:
+                counts[index] = max(count, 0)
+
+    def get(self, name: str, default: int = 0) -> int:
+        index = RESOURCE_INDEX.get(name)
+        return default if index is None else self.counts[index]
+
+    def __getitem__(self, name: str) -> int:
+        return self.counts[RESOURCE_INDEX[name]]
+
+    def __setitem__(self, name: str, count: int) -> None:
+        self.counts[RESOURCE_INDEX[name]] = max(count, 0)
+
+    def __contains__(self, name: object) -> bool:
+        return name in RESOURCE_INDEX
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(RESOURCE_NAMES)
+
+    def __len__(self) -> int:
+        return len(RESOURCE_NAMES)
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        return zip(RESOURCE_NAMES, self.counts)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Inventory):
+            return self.counts == other.counts
+        if isinstance(other, dict):
+            return all(self.get(name) == count for name, count in other.items()) and \
+                all(other.get(name, 0) == count for name, count in self.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Inventory({dict(self.items())})"
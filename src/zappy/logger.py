@@ -5,7 +5,13 @@
 ## color_formatter
 ##
 
+import json
+import time
+import queue
+import atexit
+import random
 import logging
+import logging.handlers
 
 RESET = "\x1b[0m"
 BLUE = "\x1b[34m"
@@ -22,17 +28,113 @@ COLORS = {
     'CRITICAL': BOLD_RED
 }
 
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+DEFAULT_LOG_LEVEL = "INFO"
+TRACE_LOGGER_NAME = "zappy.trace"
+TRACE_DISABLED = logging.CRITICAL + 1
+
+_listener: logging.handlers.QueueListener | None = None
+# Looked up once, trace() runs for every protocol line
+_trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
+
 class ColorFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         log_message = super().format(record)
         color = COLORS.get(record.levelname, RESET)
         return f"{color}{log_message}{RESET}"
 
+class JsonLinesFormatter(logging.Formatter):
+    """
+    One JSON object per trace record: time, event and the record's fields.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {"t": record.created, "event": record.msg}
+        entry.update(getattr(record, "fields", {}))
+        return json.dumps(entry, separators=(',', ':'))
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps a random fraction of the records.
+    """
+    def __init__(self, rate: float) -> None:
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return self.rate >= 1.0 or random.random() < self.rate
+
+def _is_not_trace(record: logging.LogRecord) -> bool:
+    return record.name != TRACE_LOGGER_NAME
+
+def _console_handler() -> logging.Handler:
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(ColorFormatter('\r%(asctime)s - %(levelname)s - %(message)s'))
+    return console_handler
+
 def init_logger() -> logging.Logger:
+    """
+    Create the package logger with a plain console handler.
+    Cheap on purpose, it runs when the package is imported; configure_logging
+    moves the output to a background thread once the CLI is parsed.
+    """
     logger = logging.getLogger(__name__)
-    logger.setLevel(logging.DEBUG)
-    console_handler = logging.StreamHandler()
-    formatter = ColorFormatter('\r%(asctime)s - %(levelname)s - %(message)s')
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    logger.setLevel(DEFAULT_LOG_LEVEL)
+    logger.addHandler(_console_handler())
+    _trace_logger.setLevel(TRACE_DISABLED)
     return logger
+
+def configure_logging(level: str = DEFAULT_LOG_LEVEL, trace_path: str | None = None,
+                      trace_sample: float = 1.0) -> None:
+    """
+    Set the log level and hand every record to a QueueListener thread, so the
+    agent's loop only pays for putting records in a queue. With trace_path,
+    a sampled JSON-lines trace of the protocol is written as well.
+    """
+    global _listener
+    logger = logging.getLogger(__name__)
+    stop_logging()
+
+    # Every call starts from fresh handlers, a reconfigured (or forked) agent
+    # does not pile filters or handlers on the previous ones
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    handlers: list[logging.Handler] = [_console_handler()]
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    logger.setLevel(level)
+
+    _trace_logger.propagate = False
+    _trace_logger.setLevel(TRACE_DISABLED)
+    _trace_logger.handlers.clear()
+    if trace_path is not None:
+        trace_handler = logging.FileHandler(trace_path, mode="w")
+        trace_handler.setFormatter(JsonLinesFormatter())
+        trace_handler.addFilter(SamplingFilter(trace_sample))
+        trace_handler.addFilter(lambda record: record.name == TRACE_LOGGER_NAME)
+        handlers[0].addFilter(_is_not_trace)
+        handlers.append(trace_handler)
+        _trace_logger.addHandler(logging.handlers.QueueHandler(records))
+        _trace_logger.setLevel(logging.INFO)
+
+    _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+
+def stop_logging() -> None:
+    """
+    Flush the queued records and stop the background writer.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+atexit.register(stop_logging)
+
+def trace(event: str, **fields) -> None:
+    """
+    Record a protocol event in the trace, a no-op unless a trace file is configured.
+    """
+    if _trace_logger.isEnabledFor(logging.INFO):
+        _trace_logger.info(event, extra={"fields": {"mono": time.monotonic(), **fields}})
@@ -0,0 +1,191 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## metrics
+##
+
+import os
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from . import logger
+
+# Upper bounds of the latency buckets, in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# make_decision runs from tens of microseconds (cached goals) to milliseconds (collection planning)
+DECISION_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                    0.025, 0.05, 0.1)
+LEVEL_BUCKETS = (500, 1000, 2000, 4000, 8000, 16000, 32000, 64000) # server time units
+DEFAULT_STATS_INTERVAL = 5.0
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in sorted(labels.items())) + "}"
+
+class Counter:
+    def __init__(self) -> None:
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+class Gauge:
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1) # last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+class MetricFamily:
+    def __init__(self, name: str, kind: str, help_text: str, factory) -> None:
+        self.name = name
+        self.kind = kind
+        self.help_text = help_text
+        self.factory = factory
+        self.children: dict[tuple, Counter | Gauge | Histogram] = {}
+
+    def labels(self, **labels: str):
+        key = tuple(sorted(labels.items()))
+        child = self.children.get(key)
+        if child is None:
+            child = self.children[key] = self.factory()
+        return child
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        for key, child in list(self.children.items()):
+            labels = dict(key)
+            if isinstance(child, Histogram):
+                cumulative = 0
+                for bound, count in zip(child.buckets + (float("inf"),), child.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"{self.name}_bucket{_labels({**labels, 'le': le})} {cumulative}")
+                lines.append(f"{self.name}_sum{_labels(labels)} {child.sum}")
+                lines.append(f"{self.name}_count{_labels(labels)} {child.count}")
+            else:
+                lines.append(f"{self.name}{_labels(labels)} {child.value}")
+        return lines
+
+class Metrics:
+    """
+    Client metrics, shared by every agent of the process.
+    """
+    def __init__(self) -> None:
+        self.families: list[MetricFamily] = []
+        self.commands_sent = self._family("zappy_commands_sent_total", "counter", "Commands sent to the server.", Counter)
+        self.command_failures = self._family("zappy_command_failures_total", "counter", "Commands answered ko.", Counter)
+        self.command_latency = self._family("zappy_command_latency_seconds", "histogram", "Time from sending a command to its answer.", Histogram)
+        self.queue_full = self._family("zappy_command_queue_full_total", "counter", "Commands refused because 10 were already in flight.", Counter)
+        self.in_flight = self._family("zappy_commands_in_flight", "gauge", "Commands sent and not answered yet, summed over the agents.", Gauge)
+        self.events = self._family("zappy_server_events_total", "counter", "Lines sent by the server on its own.", Counter)
+        self.plan_commands_removed = self._family("zappy_plan_commands_removed_total", "counter",
+                                                  "Planned commands dropped by the peephole pass.", Counter)
+        self.decisions = self._family("zappy_decisions_total", "counter", "Calls to make_decision.", Counter)
+        self.decision_time = self._family("zappy_decision_seconds", "histogram", "Time spent in make_decision.",
+                                          lambda: Histogram(DECISION_BUCKETS))
+        self.level_time = self._family("zappy_level_time_units", "histogram", "Server time units spent at a level before leaving it.",
+                                       lambda: Histogram(LEVEL_BUCKETS))
+
+    def _family(self, name: str, kind: str, help_text: str, factory) -> MetricFamily:
+        family = MetricFamily(name, kind, help_text, factory)
+        self.families.append(family)
+        return family
+
+    def render(self) -> str:
+        """
+        Every metric in the Prometheus text exposition format.
+        """
+        lines = []
+        for family in self.families:
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+METRICS = Metrics()
+
+class PrometheusExporter:
+    """
+    Serves the metrics on http://host:port/metrics from a daemon thread.
+    """
+    def __init__(self, metrics: Metrics, port: int, host: str = "127.0.0.1") -> None:
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+        logger.info("Metrics served on http://%s:%s/metrics", *self.server.server_address[:2])
+
+    def stop(self) -> None:
+        self.server.shutdown()
+
+class StatsFileExporter:
+    """
+    Rewrites a stats file (Prometheus text format) every interval seconds.
+    The file is replaced atomically so readers never see a partial write.
+    """
+    def __init__(self, metrics: Metrics, path: str, interval: float = DEFAULT_STATS_INTERVAL) -> None:
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def write(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as file:
+            file.write(self.metrics.render())
+        os.replace(tmp_path, self.path)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self.write()
+
+def start_exporters(port: int | None = None, path: str | None = None,
+                    interval: float = DEFAULT_STATS_INTERVAL, metrics: Metrics = METRICS) -> list:
+    """
+    Start the exporters asked for on the command line.
+    """
+    exporters = []
+    if port is not None:
+        exporters.append(PrometheusExporter(metrics, port))
+    if path is not None:
+        exporters.append(StatsFileExporter(metrics, path, interval))
+    for exporter in exporters:
+        exporter.start()
+    return exporters
@@ -0,0 +1,212 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## mock_server
+##
+
+import time
+import asyncio
+import argparse
+from collections import deque
+from . import logger
+from .game import GameWorld, Player
+
+MAX_PENDING_COMMANDS = 10
+
+class ClientStats:
+    """
+    Timings collected by the mock server for one connected client.
+    """
+    def __init__(self, team: str) -> None:
+        self.team = team
+        self.commands = 0
+        self.dropped = 0
+        self.response_latencies: list[float] = []
+        self.reaction_latencies: list[float] = []
+        self.idle_since: float | None = None
+
+class MockClient:
+    def __init__(self, writer: asyncio.StreamWriter, player: Player, stats: ClientStats) -> None:
+        self.writer = writer
+        self.player = player
+        self.stats = stats
+        self.queue: deque[tuple[str, float]] = deque()
+        self.current: tuple[str, float] | None = None
+        self.ends_at = 0
+
+    def send(self, line: str) -> None:
+        if not self.writer.is_closing():
+            self.writer.write(f"{line}\n".encode('utf-8'))
+
+class MockServer:
+    """
+    Local stand-in for the Zappy server, speaking the same line protocol.
+    The world advances by tick_units time units every tick_units / freq seconds.
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, width: int = 10, height: int = 10,
+                 teams: list[str] | None = None, slots: int = 6, freq: int = 100,
+                 tick_units: int = 1, seed: int | None = None, start_food: int = 10) -> None:
+        self.host = host
+        self.port = port
+        self.freq = freq
+        self.tick_units = tick_units
+        self.world = GameWorld(width, height, teams or ["team1", "team2"], slots, seed, start_food)
+        self.clients: dict[int, MockClient] = {}
+        self.stats: list[ClientStats] = []
+        self._server: asyncio.AbstractServer | None = None
+        self._ticker: asyncio.Task | None = None
+
+    async def start(self) -> int:
+        """
+        Start listening and ticking. Returns the port actually bound.
+        """
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ticker = asyncio.get_running_loop().create_task(self._tick_loop())
+        logger.info("Mock server listening on %s:%s (f=%s).", self.host, self.port, self.freq)
+        return self.port
+
+    async def stop(self) -> None:
+        if self._ticker is not None:
+            self._ticker.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for client in list(self.clients.values()):
+            client.writer.close()
+
+    async def _handshake(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> (MockClient | None):
+        writer.write(b"WELCOME\n")
+        team = (await reader.readline()).decode('utf-8').strip()
+        player = self.world.join(team)
+        if player is None:
+            writer.write(b"ko\n")
+            await writer.drain()
+            return None
+        writer.write(f"{self.world.free_slots(team)}\n{self.world.width} {self.world.height}\n".encode('utf-8'))
+        stats = ClientStats(team)
+        self.stats.append(stats)
+        client = MockClient(writer, player, stats)
+        self.clients[player.id] = client
+        stats.idle_since = time.perf_counter()
+        return client
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        client = None
+        try:
+            client = await self._handshake(reader, writer)
+            while client is not None and client.player.alive:
+                data = await reader.readline()
+                if not data:
+                    break
+                now = time.perf_counter()
+                stats = client.stats
+                if len(client.queue) + (client.current is not None) >= MAX_PENDING_COMMANDS:
+                    stats.dropped += 1
+                    continue
+                if stats.idle_since is not None:
+                    stats.reaction_latencies.append(now - stats.idle_since)
+                    stats.idle_since = None
+                stats.commands += 1
+                client.queue.append((data.decode('utf-8').strip(), now))
+        except ConnectionError:
+            pass
+        finally:
+            if client is not None:
+                self.clients.pop(client.player.id, None)
+                self.world.leave(client.player)
+            writer.close()
+
+    def _start_next(self, client: MockClient) -> None:
+        """
+        Start queued commands until one of them takes time.
+        """
+        while client.current is None and client.queue and client.player.alive:
+            command, received_at = client.queue.popleft()
+            line = self.world.start_command(client.player, command)
+            if line is not None:
+                client.send(line)
+            if line == "ko":
+                self._finished(client, received_at)
+                continue
+            client.current = (command, received_at)
+            client.ends_at = self.world.time + self.world.command_time(command)
+            if client.ends_at <= self.world.time:
+                self._finish_current(client)
+
+    def _finish_current(self, client: MockClient) -> None:
+        command, received_at = client.current
+        client.current = None
+        client.send(self.world.finish_command(client.player, command))
+        self._finished(client, received_at)
+
+    def _finished(self, client: MockClient, received_at: float) -> None:
+        now = time.perf_counter()
+        client.stats.response_latencies.append(now - received_at)
+        if not client.queue:
+            client.stats.idle_since = now
+
+    def _flush_outbox(self) -> None:
+        for player_id, line in self.world.outbox:
+            client = self.clients.get(player_id)
+            if client is not None:
+                client.send(line)
+        self.world.outbox.clear()
+
+    def step(self) -> None:
+        """
+        Advance the world by one tick and run everything that became due.
+        """
+        for _ in range(self.tick_units):
+            self.world.advance(1)
+            for client in list(self.clients.values()):
+                if client.current is not None and client.ends_at <= self.world.time:
+                    self._finish_current(client)
+                self._start_next(client)
+            self._flush_outbox()
+        for client in list(self.clients.values()):
+            if not client.player.alive:
+                client.writer.close()
+                self.clients.pop(client.player.id, None)
+
+    async def _tick_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        period = self.tick_units / self.freq
+        deadline = loop.time()
+        while True:
+            self.step()
+            deadline += period
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+
+async def _serve(args: argparse.Namespace) -> None:
+    server = MockServer(port=args.port, width=args.width, height=args.height, teams=args.names,
+                        slots=args.clients, freq=args.freq, tick_units=args.tick_units,
+                        seed=args.seed, start_food=args.start_food)
+    await server.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+def main() -> None:
+    """
+    Run the mock server standalone, with the reference server's flags.
+    """
+    parser = argparse.ArgumentParser(description="Local mock Zappy server")
+    parser.add_argument('-p', '--port', type=int, default=4242, help='Port to listen on')
+    parser.add_argument('-x', '--width', type=int, default=10, help='World width')
+    parser.add_argument('-y', '--height', type=int, default=10, help='World height')
+    parser.add_argument('-n', '--names', nargs='+', default=["team1", "team2"], help='Team names')
+    parser.add_argument('-c', '--clients', type=int, default=6, help='Slots per team')
+    parser.add_argument('-f', '--freq', type=int, default=100, help='Time units per second')
+    parser.add_argument('--tick-units', type=int, default=1, help='Time units advanced per tick')
+    parser.add_argument('--seed', type=int, default=None, help='Seed for the world generation')
+    parser.add_argument('--start-food', type=int, default=10, help='Food given to new players')
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        logger.info("Mock server stopped.")
+
+if __name__ == "__main__":
+    main()
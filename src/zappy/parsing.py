@@ -5,7 +5,9 @@
 ## parsing
 ##
 
+import logging
 from . import logger
+from .vision import Vision
 from .player import PlayerState
 
 def parse_inventory(message: str, state: PlayerState) -> None:
@@ -13,26 +15,25 @@ def parse_inventory(message: str, state: PlayerState) -> None:
     Update the inventory from the server's answer.
     """
     message = message.strip('[] \n')
-    new_inventory = {}
     if not message:
-        state.inventory = new_inventory # Empty inventory case
+        state.update_inventory(()) # Empty inventory case
         return
     try:
-        items = message.split(',')
-        for item in items:
-            name, quantity = item.strip().split()
-            new_inventory[name] = int(quantity)
-        # Assign the new inventory
-        state.inventory = new_inventory
-        logger.debug(f"Inventory updated: {state.inventory}")
+        items = []
+        for item in message.split(','):
+            name, quantity = item.split()
+            items.append((name, int(quantity)))
+        # Counts are only replaced once the whole answer parsed
+        state.update_inventory(items)
+        logger.debug("Inventory updated: %s", state.inventory)
     except ValueError:
-        logger.warning(f"Could not parse inventory: {message}")
+        logger.warning("Could not parse inventory: %s", message)
 
 def parse_look(message: str, state: PlayerState) -> None:
     """
     Update the vision from the server's answer.
     """
-    message = message.strip('[] \n')
-    state.vision = [tile.strip() for tile in message.split(',')]
-    logger.debug(f"Vision updated. Seeing {len(state.vision)} tiles.")
-    logger.debug(f"On my tile (0): {state.vision[0] if state.vision else 'nothing'}")
+    state.update_vision(Vision.parse(message))
+    logger.debug("Vision updated. Seeing %s tiles.", len(state.vision))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("On my tile (0): %s", state.vision.tile_items(0) if state.vision else 'nothing')
@@ -0,0 +1,113 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## peephole
+##
+
+from typing import Iterable
+from . import ELEVATION_REQUIREMENTS, ORIENTATIONS
+from .planner import TURNS
+from .world_map import WorldMap, RESOURCE_INDEX, STALE_HALF_LIFE
+
+# Quarter turns to the right made by a turn command
+TURN_QUARTERS = {"Right": 1, "Left": -1}
+# Commands leaving our pose and our surroundings as they were: a Look sent
+# before them answers what a Look sent after them would
+KEEPS_VIEW = frozenset(("Look", "Inventory", "Broadcast", "Connect_nbr"))
+# Answered commands after which a cell of the world map is too old to drop a command on its word
+MAX_TRUSTED_AGE = STALE_HALF_LIFE
+
+def fold_turns(plan: Iterable[str]) -> list[str]:
+    """
+    Replace every run of Left/Right by the shortest run turning as much:
+    Right, Left vanishes and Left, Left, Left becomes Right.
+    """
+    folded = []
+    quarters = 0
+    for command in plan:
+        turn = TURN_QUARTERS.get(command)
+        if turn is not None:
+            quarters += turn
+            continue
+        if quarters:
+            folded.extend(TURNS[quarters % 4])
+            quarters = 0
+        folded.append(command)
+    folded.extend(TURNS[quarters % 4])
+    return folded
+
+class PlanWalker:
+    """
+    Our pose and the content of the cells we go through while a plan runs,
+    dead-reckoned from the world map without changing it.
+    """
+    __slots__ = ("world_map", "x", "y", "orientation", "changes")
+
+    def __init__(self, world_map: WorldMap) -> None:
+        self.world_map = world_map
+        self.x = world_map.x
+        self.y = world_map.y
+        self.orientation = world_map.orientation
+        self.changes: dict[tuple[int, int, str], int] = {}
+
+    def trusted(self) -> bool:
+        """
+        Whether the world map saw our cell recently enough to tell what it holds.
+        """
+        if not self.world_map:
+            return False
+        age = self.world_map.age(self.x, self.y)
+        return age is not None and age <= MAX_TRUSTED_AGE
+
+    def count(self, item: str) -> int:
+        return self.world_map.count(self.x, self.y, item) + self.changes.get((self.x, self.y, item), 0)
+
+    def step(self, command: str) -> None:
+        name, _, arg = command.partition(' ')
+        match name:
+            case "Forward" if self.world_map:
+                dx, dy = ORIENTATIONS[self.orientation]
+                self.x = (self.x + dx) % self.world_map.width
+                self.y = (self.y + dy) % self.world_map.height
+            case "Right" | "Left":
+                self.orientation = (self.orientation + TURN_QUARTERS[name]) % 4
+            case "Take" | "Set" if arg in RESOURCE_INDEX:
+                key = (self.x, self.y, arg)
+                self.changes[key] = self.changes.get(key, 0) + (-1 if name == "Take" else 1)
+
+def optimize(plan: list[str], world_map: WorldMap, level: int, pending: Iterable[str] = ()) -> list[str]:
+    """
+    Drop the commands of a plan that would not change anything, starting
+    from where the commands still pending leave us:
+    - runs of turns are folded,
+    - a Look is dropped when the previous one, pending or planned, still holds,
+    - a Take is dropped when the world map recently saw none left on the cell
+      (it would be answered ko and cancel the rest of the plan),
+    - a Set is dropped when the cell already holds the stones our level needs.
+    The plan after an Incantation is for another level, only its turns are folded.
+    """
+    walker = PlanWalker(world_map)
+    look_holds = False
+    for command in pending:
+        walker.step(command)
+        look_holds = command == "Look" or (look_holds and command in KEEPS_VIEW)
+
+    required = ELEVATION_REQUIREMENTS[level][1] if level in ELEVATION_REQUIREMENTS else {}
+    optimized = []
+    plan = fold_turns(plan)
+    for index, command in enumerate(plan):
+        name, _, arg = command.partition(' ')
+        if name == "Incantation":
+            optimized.extend(plan[index:])
+            break
+        if name == "Look" and look_holds:
+            continue
+        if name == "Take" and walker.trusted() and walker.count(arg) <= 0:
+            continue
+        if name == "Set" and arg in required and walker.trusted() and walker.count(arg) >= required[arg]:
+            continue
+        walker.step(command)
+        look_holds = name == "Look" or (look_holds and name in KEEPS_VIEW)
+        optimized.append(command)
+    return optimized
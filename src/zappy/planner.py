@@ -0,0 +1,73 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## planner
+##
+
+from functools import lru_cache
+from . import ACTION_SPEED, ORIENTATIONS
+
+ROUTE_CACHE_SIZE = 4096
+MOVE_TIME = ACTION_SPEED["Forward"] # Forward, Left and Right all take the same time
+
+# Heading to take to walk along an axis, by sign of the delta
+X_HEADINGS = {1: 1, -1: 3} # East, West
+Y_HEADINGS = {1: 2, -1: 0} # South, North
+
+TURNS = {
+    0: (),
+    1: ("Right",),
+    2: ("Left", "Left"),
+    3: ("Left",),
+}
+
+def _axis_candidates(delta: int, size: int) -> tuple[int, ...]:
+    """
+    Ways of covering delta on an axis: straight, or around the torus if its size is known.
+    """
+    if size <= 0:
+        return (delta,)
+    delta %= size
+    return (delta,) if delta == 0 else (delta, delta - size)
+
+def _segments_route(orientation: int, segments: list[tuple[int, int]]) -> list[str]:
+    route = []
+    for heading, length in segments:
+        if length == 0:
+            continue
+        route.extend(TURNS[(heading - orientation) % 4])
+        route.extend(["Forward"] * length)
+        orientation = heading
+    return route
+
+@lru_cache(maxsize=ROUTE_CACHE_SIZE)
+def plan_route(dx: int, dy: int, orientation: int, width: int = 0, height: int = 0) -> tuple[str, ...]:
+    """
+    Shortest command sequence to move by (dx, dy) on the map axes (y grows
+    southwards) when facing orientation (0: N, 1: E, 2: S, 3: W).
+    Every command costs the same time, so the shortest route is the one with
+    the fewest commands, over both wrap-arounds of each axis and both axis orders.
+    """
+    best = None
+    for cx in _axis_candidates(dx, width):
+        for cy in _axis_candidates(dy, height):
+            x_segment = (X_HEADINGS.get((cx > 0) - (cx < 0), orientation), abs(cx))
+            y_segment = (Y_HEADINGS.get((cy > 0) - (cy < 0), orientation), abs(cy))
+            for segments in ([x_segment, y_segment], [y_segment, x_segment]):
+                route = _segments_route(orientation, segments)
+                if best is None or len(route) < len(best):
+                    best = route
+    return tuple(best)
+
+def plan_relative(right: int, forward: int, orientation: int = 0, width: int = 0, height: int = 0) -> tuple[str, ...]:
+    """
+    Shortest command sequence to the tile right steps to the right and forward
+    steps ahead of an agent facing orientation.
+    """
+    fx, fy = ORIENTATIONS[orientation]
+    rx, ry = ORIENTATIONS[(orientation + 1) % 4]
+    return plan_route(fx * forward + rx * right, fy * forward + ry * right, orientation, width, height)
+
+def route_time(route: tuple[str, ...] | list[str]) -> int:
+    return len(route) * MOVE_TIME
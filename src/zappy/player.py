@@ -5,33 +5,114 @@
 ## player
 ##
 
+from typing import Iterable
+from .vision import Vision
+from .world_map import WorldMap
+from .inventory import Inventory
+from .coordination import Gathering
+from .density import DensityMap
+
+# PlayerState and ZappyServer are mixed together, only the class combining
+# them may lay out slots: it lists these along with its own
+PLAYER_STATE_SLOTS = (
+    "level", "vision", "inventory", "is_alive", "world_width", "world_height", "action_plan",
+    "world_map", "density", "team_name", "gathering",
+    "inventory_revision", "vision_revision",
+)
+
 class PlayerState:
+    __slots__ = ()
+
     def __init__(self, team_name: str) -> None:
         self.level = 1
-        self.vision = []
-        self.inventory = {}
+        self.vision = Vision()
+        self.inventory = Inventory()
         self.is_alive = True
         self.world_width = 0
         self.world_height = 0
         self.action_plan = []
+        self.world_map = WorldMap()
+        self.density = DensityMap() # where exploring should find the most
         self.team_name = team_name
-        self.is_responding_to_broadcast = False
+        self.gathering = Gathering() # incantation we are leading or converging to
+        # Bumped whenever the inventory or the vision change, derived facts are cached on them
+        self.inventory_revision = 0
+        self.vision_revision = 0
 
     def reset_vision(self) -> None:
-        self.vision = []
+        self.vision = Vision()
+        self.vision_revision += 1
 
     def reset_action_plan(self) -> None:
         self.action_plan = []
 
-    def update_inventory(self, inventory: dict) -> None:
-        self.inventory = inventory
+    def plan_failed(self, command: str) -> None:
+        """
+        A command was answered ko: the rest of the plan relied on it.
+        """
+        self.reset_action_plan()
+
+    def update_inventory(self, items: Iterable[tuple[str, int]]) -> None:
+        self.inventory.assign(items)
+        self.inventory_revision += 1
+
+    def set_food(self, food: int) -> None:
+        if self.inventory["food"] != food:
+            self.inventory["food"] = food
+            self.inventory_revision += 1
 
-    def update_vision(self, vision: list) -> None:
+    def update_vision(self, vision: Vision) -> None:
         self.vision = vision
+        self.vision_revision += 1
+        self.density.observe(self.world_map, vision)
+        self.world_map.fold_vision(vision)
+
+    def apply_command(self, command: str, success: bool) -> None:
+        """
+        Keep the world map and the inventory in sync with a command the server answered.
+        """
+        self.world_map.tick()
+        name, _, arg = command.partition(' ')
+        match name:
+            case "Forward":
+                self.world_map.forward()
+            case "Left":
+                self.world_map.turn_left()
+            case "Right":
+                self.world_map.turn_right()
+            case "Take" if success:
+                self.world_map.took(arg)
+                self.inventory[arg] = self.inventory[arg] + 1
+                self.inventory_revision += 1
+            case "Take":
+                self.world_map.missing(arg)
+            case "Set" if success:
+                self.world_map.dropped(arg)
+                self.inventory[arg] = self.inventory[arg] - 1
+                self.inventory_revision += 1
+                # Stones are only set right after a Look, tile 0 is still ours
+                if self.vision:
+                    self.vision.add(0, arg)
+                    self.vision_revision += 1
 
     def set_world_size(self, width: int, height: int) -> None:
         self.world_width = width
         self.world_height = height
+        self.world_map.resize(width, height)
+        self.density.resize(self.world_map.width, self.world_map.height)
+
+    def respawn(self) -> None:
+        """
+        Forget everything about the previous player after a reconnection:
+        the server gave us a brand new one.
+        """
+        self.level = 1
+        self.reset_vision()
+        self.update_inventory(())
+        self.reset_action_plan()
+        self.world_map = WorldMap()
+        self.density = DensityMap()
+        self.gathering.reset()
 
     def die(self) -> None:
         self.is_alive = False
@@ -39,7 +120,7 @@ class PlayerState:
     def level_up(self) -> None:
         self.level += 1
         self.reset_vision()
-        self.is_responding_to_broadcast = False
+        self.gathering.reset()
         self.reset_action_plan()
 
     def get_team_name(self) -> str:
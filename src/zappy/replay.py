@@ -0,0 +1,150 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## replay
+##
+
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+from . import logger
+from .ai import ZappyAI
+from .exception import ZappyError
+from .logger import configure_logging, LOG_LEVELS
+from .transcript import read_transcript, TX
+
+DEFAULT_SEED = 42
+HANDSHAKE_LINES = 3 # WELCOME, free slots, world size
+
+class ReplayAgent(ZappyAI):
+    """
+    A ZappyAI fed from a transcript instead of a socket.
+    The recorded commands drive the scheduler, so every recorded answer is
+    matched as it was live; make_decision runs wherever the recorded agent
+    could decide, its commands are collected instead of being sent.
+    """
+    __slots__ = ("replay_time", "decided", "decisions")
+
+    def __init__(self, team_name: str, team_key: str | None = None) -> None:
+        ZappyAI.__init__(self, host="", port=0, team_name=team_name, team_key=team_key)
+        self.replay_time = 0.0
+        self.clock.now = self.scheduler.now = lambda: self.replay_time
+        self.decided: list[str] = []
+        self.decisions = 0
+
+    def send_command_immediately(self, command: str) -> None:
+        pass
+
+    def send_command(self, command: str) -> bool:
+        self.decided.append(command)
+        return True
+
+    def _decide(self) -> None:
+        self.make_decision()
+        self.decisions += 1
+        self.decided.extend(self.action_plan)
+        # The transcript tells what was actually sent next
+        self.reset_action_plan()
+
+    def _handle_batch(self, batch: list[str]) -> None:
+        if not batch:
+            return
+        self.process_messages(batch)
+        batch.clear()
+        if self.is_alive and not self.scheduler:
+            self._decide()
+
+    def replay(self, records: list[tuple[float, int, str]]) -> int:
+        """
+        Feed the records through handle_server_message and make_decision.
+        The lines received between two commands are handled as one batch,
+        as the live agent handles everything one read returned.
+        Returns the number of lines received.
+        """
+        received = 0
+        batch: list[str] = []
+        for timestamp, direction, line in records:
+            if not self.is_alive:
+                break
+            if direction == TX:
+                self._handle_batch(batch)
+                self.replay_time = timestamp
+                if received >= HANDSHAKE_LINES - 1:
+                    self.scheduler.push(line)
+                continue
+            self.replay_time = timestamp
+            received += 1
+            if received < HANDSHAKE_LINES:
+                continue
+            if received == HANDSHAKE_LINES:
+                self.set_world_size(*map(int, line.split()))
+                continue
+            batch.append(line)
+        if self.is_alive:
+            self._handle_batch(batch)
+        return received
+
+def replay(path: str, team_name: str = "team1", team_key: str | None = None, seed: int = DEFAULT_SEED) -> dict:
+    """
+    Replay a transcript at full speed with the random module seeded, so two
+    replays of the same transcript take the same decisions.
+    """
+    records = list(read_transcript(path))
+    random.seed(seed)
+    agent = ReplayAgent(team_name, team_key)
+    started = time.perf_counter()
+    received = agent.replay(records)
+    elapsed = time.perf_counter() - started
+    return {
+        "transcript": path,
+        "seed": seed,
+        "records": len(records),
+        "received": received,
+        "sent": sum(1 for record in records if record[1] == TX),
+        "decisions": agent.decisions,
+        "seconds": elapsed,
+        "lines_per_sec": received / elapsed if elapsed else 0.0,
+        "decisions_per_sec": agent.decisions / elapsed if elapsed else 0.0,
+        "level": agent.level,
+        "level_units": agent.level_units,
+        "digest": hashlib.blake2s("\n".join(agent.decided).encode('utf-8'), digest_size=8).hexdigest(),
+    }
+
+def main() -> None:
+    """
+    Replay transcripts recorded with main.py --record.
+    """
+    parser = argparse.ArgumentParser(description="Replay a Zappy AI transcript")
+    parser.add_argument('transcripts', nargs='+', help='Transcripts recorded with --record')
+    parser.add_argument('-n', '--name', type=str, default="team1", help='Team name the transcript was recorded with')
+    parser.add_argument('-k', '--team-key', type=str, default=None, help='Team key the transcript was recorded with')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Seed of the random module')
+    parser.add_argument('--repeat', type=int, default=1, help='Replays of every transcript, the fastest is kept')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    parser.add_argument('-l', '--log-level', type=str.upper, choices=LOG_LEVELS, default="ERROR", help='Minimum level of the messages to log')
+    args = parser.parse_args()
+    configure_logging(args.log_level)
+
+    results = []
+    try:
+        for path in args.transcripts:
+            runs = [replay(path, args.name, args.team_key, args.seed) for _ in range(max(args.repeat, 1))]
+            results.append(min(runs, key=lambda run: run["seconds"]))
+    except (OSError, ValueError, ZappyError) as e:
+        logger.error("Could not replay: %s", e)
+        sys.exit(84)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for result in results:
+        print(f"{result['transcript']}: {result['received']} lines, {result['decisions']} decisions "
+              f"in {result['seconds'] * 1000:.1f} ms ({result['lines_per_sec']:.0f} lines/s, "
+              f"{result['decisions_per_sec']:.0f} decisions/s), level {result['level']}, "
+              f"digest {result['digest']}")
+
+if __name__ == "__main__":
+    main()
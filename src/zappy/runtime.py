@@ -0,0 +1,248 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## runtime
+##
+
+import asyncio
+from . import logger
+from .ai import ZappyAI
+from .batch import AgentBatch
+from .framing import LineFramer
+from .exception import ZappyError
+
+DEFAULT_MAX_AGENTS = 64
+READ_CHUNK = 4096
+
+class AsyncAgent(ZappyAI):
+    """
+    A ZappyAI driven by an asyncio stream pair instead of a blocking socket.
+    """
+    __slots__ = ("runtime", "agent_id", "reader", "writer", "framer")
+
+    def __init__(self, runtime: "TeamRuntime", agent_id: int) -> None:
+        ZappyAI.__init__(self, host=runtime.host, port=runtime.port, team_name=runtime.team_name,
+                         team_key=runtime.team_key)
+        self.runtime = runtime
+        self.agent_id = agent_id
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+        self.framer: LineFramer | None = None
+
+    async def _readlines(self) -> (list[str] | None):
+        """
+        Reads every complete line available from the server, None when the connection is closed.
+        """
+        if self.reader is None:
+            raise ZappyError("_readlines", "Socket is not connected.")
+        while not self.pending_lines:
+            data = await self.reader.read(READ_CHUNK)
+            if not data:
+                logger.info("[agent %s] Connection closed by the server.", self.agent_id)
+                return None
+            self.pending_lines.extend(self.framer.feed(data))
+        lines = list(self.pending_lines)
+        self.pending_lines.clear()
+        return lines
+
+    async def _readline(self) -> (str | None):
+        """
+        Reads one line from the server, None when the connection is closed.
+        """
+        if not self.pending_lines:
+            lines = await self._readlines()
+            if lines is None:
+                return None
+            self.pending_lines.extend(lines)
+        return self.pending_lines.popleft()
+
+    async def _initial_connection(self) -> (tuple[int, int] | None):
+        """
+        Asynchronous counterpart of ZappyServer.initial_connection.
+        """
+        welcome_message = await self._readline()
+        if welcome_message is None:
+            return None
+        if welcome_message != "WELCOME":
+            raise ZappyError("_initial_connection", f"Expected 'WELCOME' from server, but got '{welcome_message}'.")
+        self.send_command_immediately(self.team_name)
+
+        client_num_str = await self._readline()
+        if client_num_str is None:
+            return None
+        if client_num_str == "ko":
+            raise ZappyError("_initial_connection", "Team can't have more members")
+
+        world_size_str = await self._readline()
+        if world_size_str is None:
+            return None
+        width, heigth = map(int, world_size_str.split())
+        logger.info("[agent %s] Joined team %s on a %sx%s world.", self.agent_id, self.team_name, width, heigth)
+        # Reported after the world size so spawned agents queue behind us
+        self._report_free_slots(client_num_str)
+        return width, heigth
+
+    def send_command_immediately(self, command: str) -> None:
+        """
+        Buffer a command on the stream writer, flushed by the run loop.
+        """
+        if self.writer is None:
+            raise ZappyError("send_command_immediately", "Socket is not connected.")
+        self.writer.write(f"{command}\n".encode('utf-8'))
+
+    def close_sock(self) -> None:
+        self.report_in_flight(0)
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+            logger.info("[agent %s] Socket closed.", self.agent_id)
+
+    def on_free_slots(self, slots: int) -> None:
+        self.runtime.request_agents(slots)
+
+    def on_egg_laid(self) -> None:
+        self.runtime.request_agents(1)
+
+    async def run_async(self) -> bool:
+        """
+        Main loop for one agent of the team, mirrors ZappyAI.run.
+        """
+        ret = False
+        connected = False
+        try:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+            self.framer = LineFramer(READ_CHUNK)
+            world_size = await self._initial_connection()
+            self.runtime.agent_connected(self)
+            connected = True
+            if world_size is None:
+                return ret
+            self.set_world_size(*world_size)
+            self.send_command("Inventory")
+
+            while self.is_alive:
+                if self.runtime.batch is None:
+                    self.fill_command_queue()
+                else:
+                    await self.runtime.decide_batched(self)
+                await self.writer.drain()
+                messages = await self._readlines()
+                if messages is None:
+                    break
+                self.process_messages(messages)
+        except (ConnectionError, OSError) as e:
+            logger.error("[agent %s] Connection error: %s", self.agent_id, e)
+        except ZappyError as e:
+            logger.error("[agent %s] An error occurred at: %s: %s", self.agent_id, e.where, e.what)
+        except asyncio.CancelledError:
+            logger.info("[agent %s] Cancelled. Closing connection.", self.agent_id)
+            ret = True
+        finally:
+            if not connected:
+                self.runtime.agent_connected(self)
+            self.close_sock()
+        return ret
+
+class TeamRuntime:
+    """
+    Hosts every agent of a team on a single asyncio event loop.
+    New agents are attached when the server reports free slots for the team,
+    either on connection, on a Connect_nbr answer or after a successful Fork.
+    When batched, the agents answered during the same loop iteration decide
+    together in a single AgentBatch step.
+    """
+    def __init__(self, host: str, port: int, team_name: str,
+                 initial_agents: int = 1, max_agents: int = DEFAULT_MAX_AGENTS,
+                 team_key: str | None = None, batched: bool = False) -> None:
+        self.host = host
+        self.port = port
+        self.team_name = team_name
+        self.team_key = team_key
+        self.initial_agents = initial_agents
+        self.max_agents = max_agents
+        self.agents: dict[int, AsyncAgent] = {}
+        self.results: list[bool] = []
+        self._tasks: set[asyncio.Task] = set()
+        self._connecting = 0
+        self._next_id = 0
+        self.batch = AgentBatch() if batched else None
+        # Agents waiting for the next batched step, resolved once it decided for them
+        self._deciding: dict[AsyncAgent, asyncio.Future] = {}
+
+    def _spawn_agent(self) -> AsyncAgent:
+        agent = AsyncAgent(self, self._next_id)
+        self._next_id += 1
+        self._connecting += 1
+        self.agents[agent.agent_id] = agent
+        task = asyncio.get_running_loop().create_task(self._run_agent(agent))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        logger.debug("Spawned agent %s (%s running).", agent.agent_id, len(self.agents))
+        return agent
+
+    async def _run_agent(self, agent: AsyncAgent) -> None:
+        self.results.append(await agent.run_async())
+        del self.agents[agent.agent_id]
+
+    def agent_connected(self, agent: AsyncAgent) -> None:
+        """
+        Called once per agent when its handshake is over, whatever its outcome.
+        """
+        self._connecting -= 1
+
+    def request_agents(self, count: int) -> int:
+        """
+        Attach up to count new agents, minus the ones already connecting.
+        Returns the number of agents spawned.
+        """
+        count = min(count - self._connecting, self.max_agents - len(self.agents))
+        for _ in range(max(count, 0)):
+            self._spawn_agent()
+        return max(count, 0)
+
+    async def decide_batched(self, agent: AsyncAgent) -> None:
+        """
+        Wait for the next batched step to decide for agent and fill its window.
+        """
+        loop = asyncio.get_running_loop()
+        if not self._deciding:
+            # Runs after every task woken during this iteration queued itself
+            loop.call_soon(self._batch_step)
+        decided = loop.create_future()
+        self._deciding[agent] = decided
+        await decided
+
+    def _batch_step(self) -> None:
+        deciding, self._deciding = self._deciding, {}
+        agents = [agent for agent, decided in deciding.items() if not decided.done()]
+        error: ZappyError | None = None
+        try:
+            self.batch.decide(agents)
+        except ZappyError as e:
+            error = e
+        finally:
+            for decided in deciding.values():
+                if decided.done():
+                    continue
+                if error is None:
+                    decided.set_result(None)
+                else:
+                    decided.set_exception(error)
+        logger.debug("Batched decision step for %s agent(s).", len(agents))
+
+    async def run(self) -> bool:
+        """
+        Run the team until every agent is gone.
+        """
+        logger.info("Starting team %s with %s agent(s) on %s:%s.", self.team_name, self.initial_agents, self.host, self.port)
+        for _ in range(min(self.initial_agents, self.max_agents)):
+            self._spawn_agent()
+        try:
+            while self._tasks:
+                await asyncio.wait(set(self._tasks))
+        finally:
+            for task in self._tasks:
+                task.cancel()
+        logger.info("All agents of team %s are gone.", self.team_name)
+        return bool(self.results) and all(self.results)
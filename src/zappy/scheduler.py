@@ -0,0 +1,158 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## scheduler
+##
+
+import sys
+import time
+from typing import Callable
+from collections import deque
+from . import ACTION_SPEED
+from .clock import DEFAULT_FREQUENCY
+
+MAX_IN_FLIGHT = 10 # the server buffers at most 10 commands per client
+ELEVATION_UNITS = ACTION_SPEED["Incantation"]
+# A ritual ends ELEVATION_UNITS after its start: a ko sooner than this answers a command instead
+MIN_ELEVATION_UNITS = ELEVATION_UNITS // 2
+# An elevation start still without its end after this long is forgotten
+MAX_ELEVATION_UNITS = 2 * ELEVATION_UNITS
+
+# Kinds of answer a command can get
+REPLY_OK = "ok"
+REPLY_LOOK = "look"
+REPLY_INVENTORY = "inventory"
+REPLY_SLOTS = "slots"
+REPLY_ELEVATION = "elevation"
+
+COMMAND_REPLIES = {
+    "Forward": REPLY_OK,
+    "Right": REPLY_OK,
+    "Left": REPLY_OK,
+    "Look": REPLY_LOOK,
+    "Inventory": REPLY_INVENTORY,
+    "Broadcast": REPLY_OK,
+    "Connect_nbr": REPLY_SLOTS,
+    "Fork": REPLY_OK,
+    "Eject": REPLY_OK,
+    "Take": REPLY_OK,
+    "Set": REPLY_OK,
+    "Incantation": REPLY_ELEVATION,
+}
+
+# Commands the server can answer with ko, a ko at the head of any other ends a ritual
+REFUSABLE = frozenset(("Take", "Set", "Eject", "Incantation"))
+
+# Prefixes of the lines the server sends on its own
+EVENT_PREFIXES = ("message ", "eject:")
+
+class PendingCommand:
+    __slots__ = ("command", "name", "reply", "sent_at", "underway", "underway_at")
+
+    def __init__(self, command: str, sent_at: float) -> None:
+        self.command = command
+        self.name = sys.intern(command.partition(' ')[0])
+        self.reply = COMMAND_REPLIES.get(self.name, REPLY_OK)
+        self.sent_at = sent_at
+        self.underway = False # set once an Incantation got "Elevation underway"
+        self.underway_at = 0.0
+
+class CommandScheduler:
+    """
+    Tracks the commands in flight and matches every server line with the
+    command it answers. The server answers commands in order, so the oldest
+    pending command is always the one being answered, unless the line is an
+    event the server sends on its own.
+    Elevations are the exception: every ritual we take part in, ours or a
+    teammate's, starts with "Elevation underway" and ends ELEVATION_UNITS
+    later with a level or a ko. The starts still waiting for their end are
+    kept: an end answers our Incantation once it is underway and is an event
+    otherwise, and a ko only ends a ritual when the command it would answer
+    can't be refused or once the ritual could have ended, so a start or an
+    end of someone else's ritual never takes the place of an answer.
+    """
+    __slots__ = ("window", "now", "duration", "pending", "elevations", "elevation_ended")
+
+    def __init__(self, window: int = MAX_IN_FLIGHT, now: Callable[[], float] = time.monotonic,
+                 duration: Callable[[int], float] = lambda units: units / DEFAULT_FREQUENCY) -> None:
+        self.window = window
+        self.now = now
+        self.duration = duration # seconds taken by server time units
+        self.pending: deque[PendingCommand] = deque()
+        self.elevations: deque[float] = deque() # when the rituals still underway started
+        self.elevation_ended = False # the last line matched ended someone else's ritual
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def free_slots(self) -> int:
+        return self.window - len(self.pending)
+
+    def is_full(self) -> bool:
+        return len(self.pending) >= self.window
+
+    def push(self, command: str) -> (PendingCommand | None):
+        """
+        Register a command sent to the server, None if the window is full.
+        """
+        if self.is_full():
+            return None
+        pending = PendingCommand(command, self.now())
+        self.pending.append(pending)
+        return pending
+
+    def is_pending(self, name: str) -> bool:
+        return any(pending.name == name for pending in self.pending)
+
+    def _forget_stale_elevations(self, now: float) -> None:
+        stale = self.duration(MAX_ELEVATION_UNITS)
+        while self.elevations and now - self.elevations[0] > stale:
+            self.elevations.popleft()
+
+    def match(self, message: str) -> (PendingCommand | None):
+        """
+        Return the command answered by message and retire it once fully answered.
+        None means message is an event not answering any of our commands.
+        """
+        self.elevation_ended = False
+        if message == "dead" or message.startswith(EVENT_PREFIXES):
+            return None
+
+        head = self.pending[0] if self.pending else None
+        is_own_elevation = head is not None and head.reply == REPLY_ELEVATION
+        now = self.now()
+        if message == "Elevation underway":
+            self._forget_stale_elevations(now)
+            self.elevations.append(now)
+            if is_own_elevation and not head.underway:
+                head.underway = True
+                head.underway_at = now
+                return head
+            return None
+        if message != "ko" and not message.startswith("Current level:"):
+            return None if head is None else self.pending.popleft()
+
+        self._forget_stale_elevations(now)
+        is_failure = message == "ko"
+        ended = now - self.duration(MIN_ELEVATION_UNITS)
+        if is_own_elevation and head.underway:
+            # Far too soon for a ritual to end: our Incantation was refused,
+            # the start we took for ours was a teammate's ritual, still underway
+            if not (is_failure and head.underway_at > ended) and self.elevations:
+                self.elevations.popleft()
+            return self.pending.popleft()
+        if self.elevations and (not is_failure or head is None or head.name not in REFUSABLE
+                                or self.elevations[0] <= ended):
+            self.elevations.popleft()
+            self.elevation_ended = True
+            return None
+        # A level without a ritual underway is an event, a ko answers the head
+        if not is_failure or head is None:
+            return None
+        return self.pending.popleft()
+
+    def clear(self) -> None:
+        self.pending.clear()
+        self.elevations.clear()
+        self.elevation_ended = False
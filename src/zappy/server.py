@@ -5,44 +5,67 @@
 ## server
 ##
 
-import sys
-import socket
+from collections import deque
 from .player import PlayerState
+from .logger import trace
+from .transport import Transport, CONNECT_TIMEOUT
+from .transcript import TranscriptWriter, RX, TX
 from .exception import ZappyError
-from . import logger, ACTION_SPEED
+from . import logger, scheduler
+from .clock import ServerClock
+from .broadcast import BroadcastChannel, TeamMessage
+from .metrics import METRICS
+from .planner import plan_relative
+from .scheduler import CommandScheduler, PendingCommand
 from .parsing import parse_inventory, parse_look
 
+READ_TIMEOUT = 10.0 # seconds of silence allowed on top of the commands in flight
+
+# Tile a sound comes from, as (right, forward), for every broadcast direction
+# 1: Forward, 3: Left, 5: Behind, 7: Right
+DIRECTION_OFFSETS = {
+    1: (0, 1),
+    2: (-1, 1),
+    3: (-1, 0),
+    4: (-1, -1),
+    5: (0, -1),
+    6: (1, -1),
+    7: (1, 0),
+    8: (1, 1),
+}
+
+# See PLAYER_STATE_SLOTS
+SERVER_SLOTS = (
+    "host", "port", "transport", "connect_timeout", "read_timeout", "pending_lines",
+    "clock", "scheduler", "metrics", "broadcasts", "recorder", "reported_in_flight",
+)
+
 class ZappyServer:
-    def __init__(self, host: str, port: int) -> None:
+    __slots__ = ()
+
+    def __init__(self, host: str, port: int, team_key: str) -> None:
         self.host = host
         self.port = port
-        self.sock = None
-        self.buffer = ""
-        self.command_queue: list[str | None] = []
-        self.sent_commands: list[str | None] = []
+        self.transport = Transport()
+        self.connect_timeout = CONNECT_TIMEOUT
+        self.read_timeout = READ_TIMEOUT
+        self.pending_lines: deque[str] = deque()
+        self.clock = ServerClock()
+        self.scheduler = CommandScheduler(now=self.clock.now, duration=self.clock.duration)
+        self.metrics = METRICS
+        self.broadcasts = BroadcastChannel(team_key, self.clock)
+        self.recorder: TranscriptWriter | None = None
+        self.reported_in_flight = 0
 
     @staticmethod
-    def _get_path_from_direction(direction: int) -> (list | list[str]):
+    def _get_path_from_direction(direction: int, orientation: int = 0, width: int = 0, height: int = 0) -> (list | list[str]):
         """
         Generate a sequence of commands to move towards the source of a sound.
         The direction indicates the tile from which the sound is coming.
         """
-        if direction == 0: # Sound is coming from the current tile
+        if direction not in DIRECTION_OFFSETS: # 0: sound is coming from the current tile
             return []
-
-        # Mapping of directions to movement commands
-        # 1: Forward, 3: Left, 5: Behind, 7: Right
-        paths = {
-            1: ["Forward"],
-            2: ["Forward", "Left", "Forward"],
-            3: ["Left", "Forward"],
-            4: ["Left", "Forward", "Left", "Forward"],
-            5: ["Left", "Left", "Forward"],
-            6: ["Right", "Forward", "Right", "Forward"],
-            7: ["Right", "Forward"],
-            8: ["Forward", "Right", "Forward"],
-        }
-        return paths.get(direction, [])
+        return list(plan_relative(*DIRECTION_OFFSETS[direction], orientation, width, height))
 
     def initial_connection(self, team_name: str) -> tuple[int, int]:
         """
@@ -52,220 +75,271 @@ class ZappyServer:
         if welcome_message != "WELCOME":
             raise ZappyError("initial_connection", f"Expected 'WELCOME' from server, but got '{welcome_message}'.")
 
-        logger.debug(f"Server -> Me: {welcome_message}")
-        logger.debug(f"Me -> Server: {team_name}")
+        logger.debug("Server -> Me: %s", welcome_message)
+        logger.debug("Me -> Server: %s", team_name)
         self.send_command_immediately(f"{team_name}")
 
         client_num_str = self.read_from_server()
         if client_num_str == "ko":
             raise ZappyError("initial_connection", "Team can't have more members")
+        self._report_free_slots(client_num_str)
 
         world_size_str = self.read_from_server()
-        logger.debug(f"Server -> Me: {world_size_str}")
+        logger.debug("Server -> Me: %s", world_size_str)
         width, heigth = map(int, world_size_str.split())
-        logger.info(f"World size: {width}x{heigth}")
+        logger.info("World size: %sx%s", width, heigth)
         return width, heigth
 
+    def start_recording(self, path: str) -> None:
+        """
+        Record every line sent and received to a transcript, see zappy.replay.
+        """
+        self.recorder = TranscriptWriter(path)
+
     def connect_to_server(self) -> None:
         """
-        Create the socket(s) and connect to the Zappy server.
+        Connect to the Zappy server, see Transport.connect.
         """
-        logger.info(f"Trying to connect to Zappy server at {self.host}:{self.port}...")
-        try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.connect((self.host, self.port))
-            logger.info("Connection established with Zappy server.")
+        logger.info("Trying to connect to Zappy server at %s:%s...", self.host, self.port)
+        self.pending_lines.clear()
+        self.transport.connect(self.host, self.port, self.connect_timeout)
+        logger.info("Connection established with Zappy server.")
 
-        except ConnectionRefusedError:
-            raise ZappyError("connect_to_server", "Connection denied.")
-        except socket.timeout:
-            raise ZappyError("connect_to_server", "No response from the server (timeout).")
+    def _receive_timeout(self) -> float:
+        """
+        Seconds to wait for the server: the commands in flight may take that long.
+        """
+        units = sum(self.clock.command_time(pending.command) for pending in self.scheduler.pending)
+        return self.read_timeout + units / self.clock.frequency
+
+    def _receive_lines(self) -> None:
+        """
+        Sends the buffered commands, then waits for the server and queues every complete line.
+        Raises ConnectionLost when the connection breaks or the server stays silent.
+        """
+        lines = self.transport.receive(self._receive_timeout())
+        if self.recorder is not None:
+            for line in lines:
+                self.recorder.write(RX, line)
+        self.pending_lines.extend(lines)
 
     def read_from_server(self) -> str:
         """
-        Reads from the server buffer until a newline character is found.
+        Returns the next line from the server, reading the socket only when none is pending.
         """
-        while "\n" not in self.buffer:
-            if self.sock is None:
-                raise ZappyError("read_from_server", "Socket is not connected.")
-            data = self.sock.recv(1024).decode('utf-8')
-            if not data:
-                logger.info("Connection closed by the server.")
-                sys.exit(0)
-            self.buffer += data
+        while not self.pending_lines:
+            self._receive_lines()
+        return self.pending_lines.popleft()
 
-        line, self.buffer = self.buffer.split("\n", 1)
-        return line
+    def read_lines_from_server(self) -> list[str]:
+        """
+        Returns every line already received, reading the socket once if none is pending.
+        """
+        while not self.pending_lines:
+            self._receive_lines()
+        lines = list(self.pending_lines)
+        self.pending_lines.clear()
+        return lines
 
     def _handle_broadcast(self, message: str, state: PlayerState) -> None:
         """
         Parses and reacts to a broadcast message from another player.
-        Exemple de message du serveur: "message 2, NOM_EQUIPE:incantation:4"
+        Exemple de message du serveur: "message 2, <32 base64 characters>"
         """
-        logger.info(f"Broadcast received: {message}")
+        # Format: "message K, text"
+        direction_str, _, text = message[len("message "):].partition(", ")
         try:
-            # Format: "message K, text"
-            direction_str, content = message.replace("message ", "").split(",", 1)
             direction = int(direction_str)
-            content = content.strip()
         except ValueError:
-            logger.warning(f"Could not parse broadcast: {message}")
+            logger.warning("Could not parse broadcast: %s", message)
             return
-
-        # 1. Ignore the message if it comes from ourselves or if it is coming from the current tile (direction 0)
-        if direction == 0 or state.is_responding_to_broadcast:
+        team_message = self.broadcasts.decode(text)
+        if team_message is None:
+            logger.debug("Ignoring broadcast from direction %s: %s", direction, text)
             return
+        logger.info("Broadcast received from direction %s: %s", direction, team_message)
+        self.on_team_message(team_message, direction, state)
+
+    def _on_dead(self, message: str, state: PlayerState) -> None:
+        state.die()
+        logger.warning("--- I DIED ---")
+
+    def _on_elevation_nearby(self, message: str, state: PlayerState) -> None:
+        logger.info("An elevation ritual is underway on the tile.")
+
+    def _on_elevated(self, message: str, state: PlayerState) -> None:
+        # Elevated by an incantation started by someone else
+        state.level_up()
+        logger.info("--- LEVEL UP! Now level %s ---", state.get_level())
 
-        # 2. Parse the content of the message
-        # Format: TEAM_NAME:purpose:level
+    def _on_ejected(self, message: str, state: PlayerState) -> None:
+        logger.info("Ejected from our tile (%s).", message)
         try:
-            team_name, purpose, level_str = content.split(":")
-            required_level = int(level_str)
-        except (ValueError, IndexError):
-            # Ignore messages with invalid format
-            logger.warning(f"Could not parse broadcast: {message}")
+            state.world_map.ejected(int(message.split(":", 1)[1]))
+        except ValueError:
+            logger.warning("Could not parse ejection: %s", message)
+        state.reset_vision()
+
+    def _on_unmatched_ko(self, message: str, state: PlayerState) -> None:
+        if self.scheduler.elevation_ended:
+            logger.info("The incantation we took part in failed.")
+            return
+        # No command left to answer: we lost track of what the server is answering
+        logger.warning("Received unexpected 'ko' with no command pending.")
+        trace("unexpected", line=message, in_flight=len(self.scheduler))
+
+    # Lines the server sends on its own, by first word
+    _EVENT_HANDLERS = {
+        "message": _handle_broadcast,
+        "dead": _on_dead,
+        "Elevation": _on_elevation_nearby,
+        "Current": _on_elevated,
+        "eject:": _on_ejected,
+        "ko": _on_unmatched_ko,
+    }
+
+    def _handle_event(self, message: str, state: PlayerState) -> None:
+        """
+        Handle a line the server sent on its own, not answering any of our commands.
+        """
+        handler = self._EVENT_HANDLERS.get(message.partition(' ')[0])
+        if handler is None:
+            logger.warning("Received unexpected message '%s' with no command pending.", message)
             return
+        handler(self, message, state)
 
-        # 3. Check if the message is relevant to us
-        logger.debug(f"Check value Name :")
-        logger.debug(f"valueBase : {team_name} tested value : {state.team_name}")
-        logger.debug(f"Purpose : Incantation == {purpose}")
-        logger.debug(f"state level : {state.level} tested value : {required_level}")
-        if team_name == state.team_name and purpose == "Incantation" and state.level == required_level:
-            logger.debug(f"Decision: Responding to incantation call for level {required_level} from direction {direction}.")
-            state.is_responding_to_broadcast = True
-            state.action_plan = self._get_path_from_direction(direction)
-            # Look around to see if we can help
-            state.action_plan.append("Look")
+    def _on_ok(self, pending: PendingCommand, message: str, state: PlayerState) -> None:
+        if message != "ok":
+            self._on_unexpected(pending, message, state)
+        elif pending.name == "Fork":
+            logger.info("Successfully laid an egg!")
+            self.on_egg_laid()
 
-    @staticmethod
-    def find_action_index(action: str) -> int:
-        for index, val in enumerate(ACTION_SPEED):
-            if action in val:
-                return index
-        return -1
+    def _on_inventory(self, pending: PendingCommand, message: str, state: PlayerState) -> None:
+        parse_inventory(message, state)
+        self.clock.on_inventory(state.inventory["food"])
 
-    def can_send_action_plan_command(self, command: str) -> bool:
-        if not self.sent_commands:
-            return True
+    def _on_look(self, pending: PendingCommand, message: str, state: PlayerState) -> None:
+        parse_look(message, state)
 
-        last_index = self.find_action_index(self.sent_commands[len(self.sent_commands) - 1])
-        next_index = self.find_action_index(command.split(' ', 1)[0].lower())
+    def _on_slots(self, pending: PendingCommand, message: str, state: PlayerState) -> None:
+        logger.info("Available connection slots: %s", message)
+        self._report_free_slots(message)
 
-        if last_index == -1 or next_index == -1:
-            raise ZappyError("can_send_action_plan_command", "invalid action.")
+    def _on_elevation(self, pending: PendingCommand, message: str, state: PlayerState) -> None:
+        if message == "Elevation underway":
+            logger.info("Our elevation ritual is underway.")
+        elif message.startswith("Current level:"):
+            state.level_up()
+            logger.info("--- LEVEL UP! Now level %s ---", state.get_level())
+        else:
+            self._on_unexpected(pending, message, state)
 
-        return next_index <= last_index
+    def _on_unexpected(self, pending: PendingCommand, message: str, state: PlayerState) -> None:
+        # Weird case where we receive an unexpected answer for a known command. This should not happen.
+        logger.warning("Received unexpected answer '%s' for command '%s'.", message, pending.command)
 
+    # Answers to our commands, by the kind of reply the command expects
+    _REPLY_HANDLERS = {
+        scheduler.REPLY_OK: _on_ok,
+        scheduler.REPLY_INVENTORY: _on_inventory,
+        scheduler.REPLY_LOOK: _on_look,
+        scheduler.REPLY_SLOTS: _on_slots,
+        scheduler.REPLY_ELEVATION: _on_elevation,
+    }
 
     def handle_server_message(self, message: str, state: PlayerState) -> None:
         """
         Handle messages received from the server.
-        This method may be extended to handle different types of messages.
+        Events are dispatched on their first word, answers on the kind of
+        reply the command they answer expects.
         """
-        # Holding of every non-solicited messages
-        if message.startswith("message"):
-            if (self.sent_commands):
-                self.sent_commands.pop(0)
-            self._handle_broadcast(message, state)
-            return
-
-        # "Elevation underway" is a notification, we must ignore it
-        if message == "Elevation underway":
-            logger.info(f"An elevation ritual is underway on the tile.")
+        trace("rx", line=message)
+        pending = self.scheduler.match(message)
+        if pending is None:
+            self.metrics.events.labels().inc()
+            self._handle_event(message, state)
             return
-
-        # "Current level: n" is the result of an incantation.
-        if message.startswith("Current level:"):
-            self.pop_incantation()
-            state.level_up()
-            if (self.sent_commands):
-                self.sent_commands.pop(0)
-            logger.info(f"--- LEVEL UP! Now level {state.get_level()} ---")
-            return
-
-        # Fatal notification
-        if message == "dead":
-            state.die()
-            logger.warning("--- I DIED ---")
+        last_command = pending.command
+        if message != "Elevation underway":
+            state.apply_command(last_command, message != "ko")
+            self.clock.on_reply(last_command, pending.sent_at, message != "ko")
+            self.metrics.command_latency.labels(command=pending.name).observe(self.clock.now() - pending.sent_at)
+            self.report_in_flight(len(self.scheduler))
+
+        # If the command failed, cancel what depended on it in the action plan
+        if message == "ko":
+            self.metrics.command_failures.labels(command=pending.name).inc()
+            logger.warning("Command '%s' failed.", last_command)
+            state.plan_failed(last_command)
             return
+        self._REPLY_HANDLERS.get(pending.reply, ZappyServer._on_unexpected)(self, pending, message, state)
 
-        # Handling of answers to commands
-        if not self.command_queue:
+    def _report_free_slots(self, message: str) -> None:
+        try:
+            slots = int(message)
+        except ValueError:
+            logger.warning("Could not parse connection slots: %s", message)
             return
+        if slots > 0:
+            self.on_free_slots(slots)
 
-        last_command = self.pop_last_command()
-
-        # If the command failed, cancel the action plan
-        if message == "ko":
-            logger.warning(f"Command '{last_command}' failed.")
-            if (self.sent_commands):
-                self.sent_commands.pop(0)
-            state.reset_action_plan()
-            return
+    def on_free_slots(self, slots: int) -> None:
+        """
+        Called when the server reports free slots for our team.
+        Does nothing for a standalone client, multi-agent runtimes override it.
+        """
 
-        # If the command was successful, no need for a specific treatment
-        if message == "ok":
-            if (self.sent_commands):
-                self.sent_commands.pop(0)
-            return
+    def on_team_message(self, message: TeamMessage, direction: int, state: PlayerState) -> None:
+        """
+        Called for every authentic broadcast of a teammate, direction 0 being our own tile.
+        Does nothing here, the decision engine coordinates incantations with them.
+        """
 
-        # If the command was "Inventory" or "Look", we parse the message
-        match last_command:
-            case "Inventory":
-                if (self.sent_commands):
-                    self.sent_commands.pop(0)
-                parse_inventory(message, state)
-            case"Look":
-                if (self.sent_commands):
-                    self.sent_commands.pop(0)
-                parse_look(message, state)
-            case "Connect_nbr":
-                if (self.sent_commands):
-                    self.sent_commands.pop(0)
-                logger.info(f"Available connection slots: {message}")
-            case "Fork":
-                if (self.sent_commands):
-                    self.sent_commands.pop(0)
-                logger.info("Successfully laid an egg!")
-            case _: # Weird case where we receive an unexpected answer for a known command. This should not happen.
-                logger.warning(f"Received unexpected answer '{message}' for command '{last_command}'.")
+    def on_egg_laid(self) -> None:
+        """
+        Called when one of our Fork commands succeeded.
+        Does nothing for a standalone client, multi-agent runtimes override it.
+        """
 
     def send_command_immediately(self, command: str) -> None:
         """
         Send a command without using the command queue (for initial connection).
+        Commands are buffered and sent together right before reading the server.
         """
-        if self.sock is not None:
-            self.sock.sendall(f"{command}\n".encode('utf-8'))
-        else:
-            raise ZappyError("send_command_immediately", "Socket is not connected.")
+        self.transport.write(command)
+        if self.recorder is not None:
+            self.recorder.write(TX, command)
+
+    def report_in_flight(self, in_flight: int) -> None:
+        """
+        Move the in-flight gauge by our change since the last report: the
+        agents of a process share it, it sums their commands in flight.
+        """
+        self.metrics.in_flight.labels().inc(in_flight - self.reported_in_flight)
+        self.reported_in_flight = in_flight
 
     def close_sock(self) -> None:
-        if self.sock:
-            self.sock.close()
+        self.report_in_flight(0)
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+        if self.transport.connected:
+            self.transport.close()
             logger.info("Socket closed.")
 
     def send_command(self, command: str) -> bool:
         """
-        Add a command to the command queue and send it to the server.
+        Register a command in the scheduler and send it to the server.
         """
-        if len(self.command_queue) < 10:
-            logger.debug(f"Me -> Server: {command}")
-            self.send_command_immediately(command)
-            self.command_queue.append(command)
-            self.sent_commands.append(command.split(' ', 1)[0].lower())
-            return True
-        logger.warning("Command queue is full. Cannot send new command yet.")
-        return False
-
-    def pop_incantation(self) -> None:
-        try:
-            self.command_queue.remove("Incantation")
-        except ValueError:
-            pass  # In case "Incantation" is not in the queue, we ignore it
-
-    def pop_last_command(self) -> (str | None):
-        return self.command_queue.pop(0) if self.command_queue else ""
-
-    def get_last_command(self) -> (str | None):
-        return self.command_queue[0] if self.command_queue else ""
+        if self.scheduler.is_full():
+            self.metrics.queue_full.labels().inc()
+            logger.warning("Command queue is full. Cannot send new command yet.")
+            return False
+        logger.debug("Me -> Server: %s", command)
+        trace("tx", line=command, in_flight=len(self.scheduler))
+        self.send_command_immediately(command)
+        pending = self.scheduler.push(command)
+        self.metrics.commands_sent.labels(command=pending.name).inc()
+        self.report_in_flight(len(self.scheduler))
+        return True
@@ -0,0 +1,219 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## simulator
+##
+
+import random
+from collections import deque
+from .ai import ZappyAI
+from .game import GameWorld
+from .batch import AgentBatch
+from .decision_engine import Tuning
+from . import FOOD_UNITS
+
+TEAM_NAME = "team1"
+SIMULATED_FREQUENCY = 100 # time units per simulated second, what the agents' clocks see
+DEFAULT_WIDTH = 10
+DEFAULT_HEIGHT = 10
+DEFAULT_SLOTS = 6
+DEFAULT_AGENTS = 1
+DEFAULT_MAX_AGENTS = 12
+DEFAULT_MAX_UNITS = 20000
+
+class SimulatedAgent(ZappyAI):
+    """
+    A ZappyAI playing in a Simulation: its commands are collected instead of
+    being sent and its clock reads the world's time.
+    """
+    __slots__ = ("simulation", "player", "outgoing", "queue", "current", "ends_at", "joined_at")
+
+    def __init__(self, simulation: "Simulation", tuning: Tuning | None = None) -> None:
+        ZappyAI.__init__(self, host="", port=0, team_name=simulation.team, tuning=tuning)
+        self.clock.now = self.scheduler.now = simulation.now
+        self.simulation = simulation
+        self.player = None
+        self.outgoing: list[str] = []
+        # Commands received by the world, the first one being executed until ends_at
+        self.queue: deque[str] = deque()
+        self.current: str | None = None
+        self.ends_at = 0
+        self.joined_at = 0
+
+    def join_world(self, world: GameWorld) -> bool:
+        """
+        Mirrors join_game, the world answering the handshake.
+        """
+        self.player = world.join(self.team_name)
+        if self.player is None:
+            return False
+        self.joined_at = world.time
+        self.set_world_size(world.width, world.height)
+        self.send_command("Inventory")
+        self._report_free_slots(str(world.free_slots(self.team_name)))
+        return True
+
+    def send_command_immediately(self, command: str) -> None:
+        self.outgoing.append(command)
+
+    def on_free_slots(self, slots: int) -> None:
+        self.simulation.request_agents(slots)
+
+    def on_egg_laid(self) -> None:
+        self.simulation.request_agents(1)
+
+class Simulation:
+    """
+    A whole game of one team in a GameWorld, without sockets.
+    Agents are stepped like the mock server serves them: every command runs
+    for its duration, and an agent decides again once it handled everything
+    the world answered at that time. Time jumps from one answer to the next,
+    and a round trip takes at least one time unit: an agent answered ko
+    right away does not retry at the same instant forever.
+    New agents join on free slots and eggs, as with TeamRuntime, and the
+    agents answered at the same time decide in one AgentBatch step when batched.
+    """
+    def __init__(self, seed: int, tuning: Tuning | None = None, width: int = DEFAULT_WIDTH,
+                 height: int = DEFAULT_HEIGHT, slots: int = DEFAULT_SLOTS,
+                 agents: int = DEFAULT_AGENTS, max_agents: int = DEFAULT_MAX_AGENTS,
+                 batched: bool = False) -> None:
+        self.team = TEAM_NAME
+        self.world = GameWorld(width, height, [self.team], slots, seed=seed)
+        self.tuning = tuning
+        self.initial_agents = agents
+        self.max_agents = max_agents
+        self.agents: dict[int, SimulatedAgent] = {}
+        self.joined = 0
+        self.lifetimes: list[int] = []
+        self.levels: list[int] = []
+        self._requested = 0
+        self.batch = AgentBatch() if batched else None
+
+    def now(self) -> float:
+        return self.world.time / SIMULATED_FREQUENCY
+
+    def request_agents(self, count: int) -> None:
+        """
+        Join up to count new agents once the current step is over.
+        """
+        self._requested = max(self._requested, count)
+
+    def _join_requested(self) -> None:
+        while self._requested > 0 and len(self.agents) < self.max_agents:
+            self._requested -= 1
+            if not self._join():
+                break
+        self._requested = 0
+
+    def _join(self) -> bool:
+        agent = SimulatedAgent(self, self.tuning)
+        if not agent.join_world(self.world):
+            return False
+        self.agents[agent.player.id] = agent
+        self.joined += 1
+        self._take_commands(agent)
+        return True
+
+    def _take_commands(self, agent: SimulatedAgent) -> None:
+        agent.queue.extend(agent.outgoing)
+        agent.outgoing.clear()
+
+    def _start_next(self, agent: SimulatedAgent) -> None:
+        """
+        Start queued commands until one of them takes time.
+        """
+        world = self.world
+        while agent.current is None and agent.queue and agent.player.alive:
+            command = agent.queue.popleft()
+            line = world.start_command(agent.player, command)
+            if line is not None:
+                world.outbox.append((agent.player.id, line))
+            if line == "ko":
+                continue
+            agent.current = command
+            agent.ends_at = world.time + world.command_time(command)
+            if agent.ends_at <= world.time:
+                self._finish_current(agent)
+
+    def _finish_current(self, agent: SimulatedAgent) -> None:
+        command = agent.current
+        agent.current = None
+        self.world.outbox.append((agent.player.id, self.world.finish_command(agent.player, command)))
+
+    def _deliver(self) -> None:
+        """
+        Hand every line the world pushed to its agent, which then decides again.
+        """
+        inboxes: dict[int, list[str]] = {}
+        for player_id, line in self.world.outbox:
+            inboxes.setdefault(player_id, []).append(line)
+        self.world.outbox.clear()
+        answered = []
+        for player_id, lines in inboxes.items():
+            agent = self.agents.get(player_id)
+            if agent is None:
+                continue
+            agent.process_messages(lines)
+            if not agent.is_alive or not agent.player.alive:
+                self._retire(agent)
+                continue
+            if self.batch is None:
+                agent.fill_command_queue()
+            answered.append(agent)
+        if self.batch is not None:
+            self.batch.decide(answered)
+        for agent in answered:
+            self._take_commands(agent)
+
+    def _retire(self, agent: SimulatedAgent) -> None:
+        del self.agents[agent.player.id]
+        if agent.player.alive:
+            self.world.leave(agent.player)
+        self.lifetimes.append(self.world.time - agent.joined_at)
+        self.levels.append(agent.level)
+
+    def run(self, max_units: int = DEFAULT_MAX_UNITS) -> dict:
+        """
+        Play until the team is gone or max_units time units passed.
+        """
+        world = self.world
+        self.request_agents(self.initial_agents)
+        self._join_requested()
+        while self.agents and world.time < max_units:
+            for agent in self.agents.values():
+                self._start_next(agent)
+            # Incantations start and Connect_nbr answer right away
+            self._deliver()
+            due = world.time + FOOD_UNITS
+            for agent in self.agents.values():
+                if agent.current is not None:
+                    due = min(due, agent.ends_at)
+                elif agent.queue:
+                    due = world.time + 1
+            world.advance(min(due, max_units) - world.time)
+            for agent in list(self.agents.values()):
+                if agent.current is not None and agent.ends_at <= world.time and agent.player.alive:
+                    self._finish_current(agent)
+            self._deliver()
+            self._join_requested()
+        survived = world.time
+        for agent in list(self.agents.values()):
+            self._retire(agent)
+        return {
+            "survival": survived,
+            "lifetime": sum(self.lifetimes) / len(self.lifetimes) if self.lifetimes else 0.0,
+            "players": self.joined,
+            "max_level": max(self.levels, default=0),
+            "levels": self.levels,
+        }
+
+def simulate(seed: int, tuning: Tuning | None = None, max_units: int = DEFAULT_MAX_UNITS, **settings) -> dict:
+    """
+    One seeded game. The random module is seeded as well, the agents' choices
+    depend on it: the same seed and tuning always play the same game.
+    """
+    random.seed(seed)
+    result = Simulation(seed, tuning, **settings).run(max_units)
+    result["seed"] = seed
+    return result
@@ -0,0 +1,247 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## swarm
+##
+
+import os
+import sys
+import time
+import queue
+import signal
+import argparse
+import multiprocessing
+from . import logger
+from .ai import ZappyAI
+from .exception import ZappyError, ConnectionLost
+from .logger import configure_logging, stop_logging
+from .metrics import start_exporters
+
+DEFAULT_MAX_RESTARTS = 3
+RESTART_DELAY = 0.5 # seconds, doubled after every restart of the same worker
+POLL_INTERVAL = 0.2
+
+WORKER_SUCCESS = 0
+WORKER_ERROR = 84
+
+# Status sent by the workers to the supervisor, as (kind, worker id, value)
+MSG_CONNECTED = "connected"
+MSG_SLOTS = "slots"
+MSG_EGG = "egg"
+MSG_DONE = "done" # value: whether the worker is worth restarting
+
+class SwarmAgent(ZappyAI):
+    """
+    A ZappyAI running in a worker process, reporting to the swarm supervisor.
+    joined tells whether the server ever took us in, refused whether it
+    turned our last handshake down (no slot left, wrong team).
+    """
+    __slots__ = ("events", "worker_id", "joined", "refused")
+
+    def __init__(self, events: multiprocessing.Queue, worker_id: int, settings: argparse.Namespace) -> None:
+        ZappyAI.__init__(self, host=settings.host, port=settings.port, team_name=settings.name,
+                         team_key=settings.team_key)
+        self.events = events
+        self.worker_id = worker_id
+        self.max_reconnects = settings.reconnects
+        self.joined = False
+        self.refused = False
+
+    def initial_connection(self, team_name: str) -> tuple[int, int]:
+        try:
+            world_size = ZappyAI.initial_connection(self, team_name)
+        except ConnectionLost:
+            raise
+        except ZappyError:
+            self.refused = True
+            raise
+        self.joined = True
+        self.refused = False
+        self.events.put((MSG_CONNECTED, self.worker_id, None))
+        return world_size
+
+    def worth_restarting(self, success: bool) -> bool:
+        """
+        Whether a new worker could take over: only when an established
+        connection was lost while our player was alive. A refused handshake
+        would be refused again, a successful run means the game is over.
+        """
+        return self.joined and not self.refused and self.is_alive and not success
+
+    def on_free_slots(self, slots: int) -> None:
+        self.events.put((MSG_SLOTS, self.worker_id, slots))
+
+    def on_egg_laid(self) -> None:
+        self.events.put((MSG_EGG, self.worker_id, None))
+
+def _suffixed(path: str | None, worker_id: int) -> (str | None):
+    return None if path is None else f"{path}.{worker_id}"
+
+def _run_worker(events: multiprocessing.Queue, worker_id: int, core: int | None,
+                settings: argparse.Namespace) -> None:
+    """
+    Body of a worker process: one agent, pinned to core when given.
+    Exits with WORKER_SUCCESS or WORKER_ERROR, like main.py.
+    """
+    if core is not None:
+        os.sched_setaffinity(0, {core})
+    # Neither the log writer thread nor the exporters survive the fork
+    configure_logging(settings.log_level, _suffixed(settings.trace, worker_id), settings.trace_sample)
+    start_exporters(None, _suffixed(settings.metrics_file, worker_id), settings.metrics_interval)
+    agent = None
+    success = False
+    try:
+        agent = SwarmAgent(events, worker_id, settings)
+        success = agent.run()
+    except ZappyError as e:
+        logger.error("[worker %s] An error occurred at: %s: %s", worker_id, e.where, e.what)
+    finally:
+        events.put((MSG_DONE, worker_id, agent is not None and agent.worth_restarting(success)))
+        # Worker processes leave without running the atexit handlers
+        stop_logging()
+    sys.exit(WORKER_SUCCESS if success else WORKER_ERROR)
+
+class Worker:
+    def __init__(self, worker_id: int, process: multiprocessing.Process, core: int | None, restarts: int) -> None:
+        self.worker_id = worker_id
+        self.process = process
+        self.core = core
+        self.restarts = restarts
+
+class Swarm:
+    """
+    Runs one agent per worker process, spread over the CPU cores we may use.
+    Workers whose agent is still alive when they exit (lost connection, crash)
+    are restarted with a growing delay, unless the server closed the connection
+    for good or never let the agent join. New workers are started when an agent reports free slots or
+    lays an egg, and the exit codes are aggregated.
+    """
+    def __init__(self, settings: argparse.Namespace, workers: int, max_agents: int,
+                 max_restarts: int = DEFAULT_MAX_RESTARTS) -> None:
+        self.settings = settings
+        self.initial_workers = workers
+        self.max_agents = max_agents
+        self.max_restarts = max_restarts
+        self.events: multiprocessing.Queue = multiprocessing.Queue()
+        self.workers: dict[int, Worker] = {}
+        self.results: list[bool] = []
+        self.restarted = 0
+        self._connecting: set[int] = set()
+        self._restartable: dict[int, bool] = {}
+        self._restarts_due: list[tuple[float, int, int]] = [] # (when, worker id, restarts)
+        self._next_id = 0
+        self._stopping = False
+        cores = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+        self._core_load = {core: 0 for core in cores}
+
+    def _pick_core(self) -> (int | None):
+        """
+        The least loaded core, None when pinning is not supported.
+        """
+        if not self._core_load:
+            return None
+        core = min(self._core_load, key=self._core_load.__getitem__)
+        self._core_load[core] += 1
+        return core
+
+    def _spawn(self, worker_id: int | None = None, restarts: int = 0) -> Worker:
+        if worker_id is None:
+            worker_id = self._next_id
+            self._next_id += 1
+        core = self._pick_core()
+        process = multiprocessing.Process(target=_run_worker, name=f"zappy-worker-{worker_id}",
+                                          args=(self.events, worker_id, core, self.settings))
+        process.start()
+        worker = self.workers[worker_id] = Worker(worker_id, process, core, restarts)
+        self._connecting.add(worker_id)
+        logger.debug("Started worker %s (pid %s, core %s).", worker_id, process.pid, core)
+        return worker
+
+    def request_agents(self, count: int) -> int:
+        """
+        Start up to count new workers, minus the ones already connecting.
+        Returns the number of workers started.
+        """
+        count = min(count - len(self._connecting), self.max_agents - len(self.workers) - len(self._restarts_due))
+        for _ in range(max(count, 0)):
+            self._spawn()
+        return max(count, 0)
+
+    def _handle_event(self, kind: str, worker_id: int, value) -> None:
+        if kind == MSG_CONNECTED:
+            self._connecting.discard(worker_id)
+        elif kind == MSG_SLOTS:
+            self._connecting.discard(worker_id)
+            if not self._stopping:
+                self.request_agents(value)
+        elif kind == MSG_EGG:
+            if not self._stopping:
+                self.request_agents(1)
+        elif kind == MSG_DONE:
+            self._restartable[worker_id] = value
+
+    def _drain_events(self) -> None:
+        try:
+            self._handle_event(*self.events.get(timeout=POLL_INTERVAL))
+            while True:
+                self._handle_event(*self.events.get_nowait())
+        except queue.Empty:
+            pass
+
+    def _reap(self, worker: Worker) -> None:
+        worker.process.join()
+        del self.workers[worker.worker_id]
+        self._connecting.discard(worker.worker_id)
+        if worker.core is not None:
+            self._core_load[worker.core] -= 1
+        # No status at all means the worker crashed before its agent could report
+        restartable = self._restartable.pop(worker.worker_id, True)
+        if restartable and not self._stopping and worker.restarts < self.max_restarts:
+            delay = RESTART_DELAY * (2 ** worker.restarts)
+            logger.warning("Worker %s exited with code %s, restarting it in %.1fs.",
+                           worker.worker_id, worker.process.exitcode, delay)
+            self._restarts_due.append((time.monotonic() + delay, worker.worker_id, worker.restarts + 1))
+            return
+        logger.info("Worker %s exited with code %s.", worker.worker_id, worker.process.exitcode)
+        self.results.append(worker.process.exitcode == WORKER_SUCCESS)
+
+    def _restart_due(self) -> None:
+        now = time.monotonic()
+        due = [entry for entry in self._restarts_due if entry[0] <= now]
+        self._restarts_due = [entry for entry in self._restarts_due if entry[0] > now]
+        for _, worker_id, restarts in due:
+            self.restarted += 1
+            self._spawn(worker_id, restarts)
+
+    def run(self) -> bool:
+        """
+        Supervise the workers until every one of them is gone.
+        """
+        logger.info("Starting a swarm of %s worker(s) for team %s on %s core(s).",
+                    self.initial_workers, self.settings.name, len(self._core_load) or "any")
+        for _ in range(min(self.initial_workers, self.max_agents)):
+            self._spawn()
+        try:
+            while self.workers or self._restarts_due:
+                exited = [worker for worker in self.workers.values() if worker.process.exitcode is not None]
+                # Exited workers flushed their last status before exiting
+                self._drain_events()
+                for worker in exited:
+                    self._reap(worker)
+                self._restart_due()
+        except KeyboardInterrupt:
+            # The workers got the interruption as well, another one must not
+            # cut short the wait for them
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            self._stopping = True
+            logger.info("User interruption. Waiting for the workers.")
+            self._restarts_due.clear()
+            for worker in list(self.workers.values()):
+                self._reap(worker)
+        finally:
+            for worker in self.workers.values():
+                worker.process.terminate()
+        logger.info("Swarm of team %s is over: %s worker(s) finished, %s restart(s), %s failure(s).",
+                    self.settings.name, len(self.results), self.restarted, self.results.count(False))
+        return bool(self.results) and all(self.results)
@@ -0,0 +1,54 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## transcript
+##
+
+import time
+import struct
+from typing import Iterator
+
+MAGIC = b"ZAPT\x01"
+# Seconds since the start of the recording, direction, length of the line
+RECORD = struct.Struct(">dBI")
+
+RX = 0 # received from the server
+TX = 1 # sent to the server
+
+class TranscriptWriter:
+    """
+    Records every line exchanged with the server in a compact binary file:
+    a magic header then, for every line, a fixed-size record header followed
+    by the line's UTF-8 bytes.
+    """
+    def __init__(self, path: str) -> None:
+        self.file = open(path, "wb")
+        self.file.write(MAGIC)
+        self.started_at = time.monotonic()
+
+    def write(self, direction: int, line: str) -> None:
+        data = line.encode('utf-8')
+        self.file.write(RECORD.pack(time.monotonic() - self.started_at, direction, len(data)))
+        self.file.write(data)
+
+    def close(self) -> None:
+        self.file.close()
+
+def read_transcript(path: str) -> Iterator[tuple[float, int, str]]:
+    """
+    Yields (timestamp, direction, line) for every record of a transcript.
+    A record cut short (the agent was killed while writing) ends the transcript.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path} is not a Zappy transcript")
+    offset = len(MAGIC)
+    while offset + RECORD.size <= len(data):
+        timestamp, direction, length = RECORD.unpack_from(data, offset)
+        offset += RECORD.size
+        if offset + length > len(data):
+            return
+        yield timestamp, direction, str(data[offset:offset + length], 'utf-8')
+        offset += length
@@ -0,0 +1,132 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## transport
+##
+
+import time
+import socket
+import selectors
+from .framing import LineFramer
+from .exception import ZappyError, ConnectionLost, ConnectionClosed
+
+CONNECT_TIMEOUT = 5.0 # seconds
+
+class Transport:
+    """
+    Non-blocking connection to the server driven by a selector.
+    Commands written during a loop iteration are buffered and flushed with a
+    single sendall right before waiting for the server, and every wait has a
+    deadline: a silent server raises ConnectionLost instead of blocking forever.
+    """
+    __slots__ = ("sock", "selector", "framer", "_outgoing")
+
+    def __init__(self) -> None:
+        self.sock: socket.socket | None = None
+        self.selector: selectors.BaseSelector | None = None
+        self.framer: LineFramer | None = None # allocated on connection
+        self._outgoing = bytearray()
+
+    @property
+    def connected(self) -> bool:
+        return self.sock is not None
+
+    def connect(self, host: str, port: int, timeout: float = CONNECT_TIMEOUT) -> None:
+        """
+        Connect to host:port, giving up after timeout seconds.
+        """
+        try:
+            sock = socket.create_connection((host, port), timeout=timeout)
+        except ConnectionRefusedError:
+            raise ZappyError("connect_to_server", "Connection denied.")
+        except socket.timeout:
+            raise ZappyError("connect_to_server", "No response from the server (timeout).")
+        except OSError as e:
+            raise ZappyError("connect_to_server", str(e))
+        # Our commands are a few bytes long, do not let Nagle hold them back
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setblocking(False)
+        self.sock = sock
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(sock, selectors.EVENT_READ)
+        self.framer = LineFramer()
+        self._outgoing.clear()
+
+    @property
+    def buffered(self) -> int:
+        """
+        Bytes written and not flushed yet.
+        """
+        return len(self._outgoing)
+
+    def write(self, line: str) -> None:
+        """
+        Buffer a line, sent on the next flush.
+        """
+        if self.sock is None:
+            raise ZappyError("send_command_immediately", "Socket is not connected.")
+        self._outgoing += line.encode('utf-8')
+        self._outgoing += b"\n"
+
+    def flush(self, timeout: float) -> None:
+        """
+        Send every buffered line at once.
+        """
+        if not self._outgoing:
+            return
+        if self.sock is None:
+            raise ZappyError("flush", "Socket is not connected.")
+        view = memoryview(self._outgoing)
+        sent = 0
+        deadline = time.monotonic() + timeout
+        try:
+            while sent < len(view):
+                try:
+                    sent += self.sock.send(view[sent:])
+                except BlockingIOError:
+                    self._wait(selectors.EVENT_WRITE, deadline, "flush")
+        except OSError as e:
+            raise ConnectionLost("flush", str(e))
+        finally:
+            view.release()
+            del self._outgoing[:sent]
+
+    def _wait(self, events: int, deadline: float, where: str) -> None:
+        self.selector.modify(self.sock, events)
+        try:
+            if not self.selector.select(max(deadline - time.monotonic(), 0.0)):
+                raise ConnectionLost(where, "No data from the server (timeout).")
+        finally:
+            self.selector.modify(self.sock, selectors.EVENT_READ)
+
+    def receive(self, timeout: float) -> list[str]:
+        """
+        Flush the buffered lines, then wait up to timeout seconds for the server
+        and return every complete line received.
+        """
+        self.flush(timeout)
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.selector.select(remaining):
+                raise ConnectionLost("read_from_server", f"No data from the server for {timeout:.1f}s.")
+            try:
+                lines = self.framer.recv_from(self.sock)
+            except BlockingIOError:
+                continue
+            except OSError as e:
+                raise ConnectionLost("read_from_server", str(e))
+            if lines is None:
+                raise ConnectionClosed("read_from_server", "Connection closed by the server.")
+            if lines:
+                return lines
+
+    def close(self) -> None:
+        if self.selector is not None:
+            self.selector.close()
+            self.selector = None
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+        self._outgoing.clear()
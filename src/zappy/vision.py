@@ -0,0 +1,119 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## vision
+##
+
+from array import array
+
+VISION_ITEMS = ("player", "food", "linemate", "deraumere", "sibur", "mendiane", "phiras", "thystame")
+ITEM_INDEX = {name: index for index, name in enumerate(VISION_ITEMS)}
+MAX_LEVEL = 8
+
+def _build_tile_geometry(max_level: int) -> list[tuple[int, int, int]]:
+    """
+    Relative (dx, dy, cost) of every tile of the vision cone.
+    dx goes to the right, dy forward, cost is the number of moves to reach it.
+    """
+    geometry = []
+    for depth in range(max_level + 1):
+        for dx in range(-depth, depth + 1):
+            geometry.append((dx, depth, depth + (1 + abs(dx) if dx else 0)))
+    return geometry
+
+# Tile i has the same position at every level, a level only sees a longer prefix
+TILE_GEOMETRY = _build_tile_geometry(MAX_LEVEL)
+TILE_INDEX = {(dx, dy): index for index, (dx, dy, _) in enumerate(TILE_GEOMETRY)}
+VISION_TILES = {level: (level + 1) ** 2 for level in range(1, MAX_LEVEL + 1)}
+# Tile indices of each level's cone sorted by move cost, ties broken by index
+TILES_BY_COST = {
+    level: sorted(range(count), key=lambda index: (TILE_GEOMETRY[index][2], index))
+    for level, count in VISION_TILES.items()
+}
+
+def tile_offset(tile_index: int) -> tuple[int, int]:
+    dx, dy, _ = TILE_GEOMETRY[tile_index]
+    return dx, dy
+
+def tile_cost(tile_index: int) -> int:
+    return TILE_GEOMETRY[tile_index][2]
+
+def _level_for_tiles(tile_count: int) -> int:
+    for level, count in VISION_TILES.items():
+        if tile_count <= count:
+            return level
+    return MAX_LEVEL
+
+class Vision:
+    """
+    Result of a Look as a tiles x items count matrix.
+    Counts are stored item-major in an array so that every item is one
+    contiguous column of tile counts.
+    """
+    __slots__ = ("tile_count", "counts", "_order")
+
+    def __init__(self, tile_count: int = 0) -> None:
+        self.tile_count = tile_count
+        self.counts = array('H', bytes(2 * tile_count * len(VISION_ITEMS)))
+        self._order = [tile for tile in TILES_BY_COST[_level_for_tiles(tile_count)] if tile < tile_count]
+
+    @classmethod
+    def parse(cls, message: str) -> "Vision":
+        """
+        Build a Vision from the server's Look answer.
+        """
+        tiles = message.strip('[] \n').split(',')
+        vision = cls(len(tiles))
+        counts = vision.counts
+        for tile, content in enumerate(tiles):
+            for token in content.split():
+                item = ITEM_INDEX.get(token)
+                if item is not None:
+                    counts[item * vision.tile_count + tile] += 1
+        return vision
+
+    def __len__(self) -> int:
+        return self.tile_count
+
+    def column(self, item: str) -> array:
+        """
+        Count of item on every tile.
+        """
+        start = ITEM_INDEX[item] * self.tile_count
+        return self.counts[start:start + self.tile_count]
+
+    def count(self, tile_index: int, item: str) -> int:
+        if not 0 <= tile_index < self.tile_count:
+            return 0
+        return self.counts[ITEM_INDEX[item] * self.tile_count + tile_index]
+
+    def tiles_with(self, item: str) -> list[int]:
+        """
+        Every tile containing item, cheapest to reach first.
+        """
+        column = self.column(item)
+        return [tile for tile in self._order if column[tile]]
+
+    def closest(self, item: str) -> int:
+        """
+        Cheapest tile to reach containing item, -1 if none.
+        """
+        column = self.column(item)
+        for tile in self._order:
+            if column[tile]:
+                return tile
+        return -1
+
+    def tile_items(self, tile_index: int) -> dict[str, int]:
+        return {item: self.count(tile_index, item) for item in VISION_ITEMS if self.count(tile_index, item)}
+
+    def remove(self, tile_index: int, item: str, quantity: int = 1) -> None:
+        index = ITEM_INDEX[item] * self.tile_count + tile_index
+        self.counts[index] = max(0, self.counts[index] - quantity)
+
+    def add(self, tile_index: int, item: str, quantity: int = 1) -> None:
+        self.counts[ITEM_INDEX[item] * self.tile_count + tile_index] += quantity
+
+    def __repr__(self) -> str:
+        return f"Vision({[self.tile_items(tile) for tile in range(self.tile_count)]})"
@@ -0,0 +1,250 @@
+##
+## EPITECH PROJECT, 2025
+## Zappy-AI
+## File description:
+## world_map
+##
+
+import math
+from array import array
+from . import ORIENTATIONS
+from .vision import Vision, VISION_ITEMS, TILE_GEOMETRY
+
+RESOURCE_ITEMS = VISION_ITEMS[1:] # players move, only resources are remembered
+RESOURCE_INDEX = {name: index for index, name in enumerate(RESOURCE_ITEMS)}
+STALE_HALF_LIFE = 60 # in answered commands
+MAX_FRAME_SIDE = 128
+NEVER_SEEN = -1
+
+def _build_cone_offsets() -> tuple[tuple[tuple[int, int], ...], ...]:
+    """
+    Offset of every tile of the vision cone in the map's axes, for every orientation.
+    """
+    cones = []
+    for orientation in range(len(ORIENTATIONS)):
+        fx, fy = ORIENTATIONS[orientation]
+        rx, ry = ORIENTATIONS[(orientation + 1) % 4]
+        cones.append(tuple((fx * dy + rx * dx, fy * dy + ry * dx) for dx, dy, _ in TILE_GEOMETRY))
+    return tuple(cones)
+
+# Like TILE_GEOMETRY, a level's cone is a prefix of these
+CONE_OFFSETS = _build_cone_offsets()
+
+# Where "eject: K" pushed us, as (right, forward) steps: we leave the tile K points to
+EJECT_MOVES = {1: (0, -1), 3: (1, 0), 5: (0, 1), 7: (-1, 0)}
+
+class WorldMap:
+    """
+    Persistent knowledge of the torus, in the agent's own frame of reference.
+    The server never tells us where we are, so the agent starts at (0, 0)
+    facing north and its pose is dead-reckoned from the commands it sends.
+    Every Look is folded into the grid with the time it was seen at; time is
+    counted in answered commands.
+    """
+    __slots__ = ("width", "height", "x", "y", "orientation", "time", "counts", "last_seen", "_known",
+                 "_cone_pose", "_cone")
+
+    def __init__(self, width: int = 0, height: int = 0) -> None:
+        self.width = 0
+        self.height = 0
+        self.x = 0
+        self.y = 0
+        self.orientation = 0
+        self.time = 0
+        self.counts = array('B')
+        self.last_seen = array('i')
+        self._known: dict[str, set[int]] = {item: set() for item in RESOURCE_ITEMS}
+        # Cells of the last cone asked for and the pose it was seen from
+        self._cone_pose: tuple[int, int, int, int] | None = None
+        self._cone: list[int] = []
+        if width and height:
+            self.resize(width, height)
+
+    def resize(self, width: int, height: int) -> None:
+        """
+        Size the frame for a width x height world.
+        Our frame may be a quarter turn away from the server's, which swaps the
+        axes: a non-square world is mapped on a square frame whose side is a
+        multiple of both dimensions so that positions never alias. The map is
+        disabled when that frame would be too large.
+        """
+        if width != height:
+            side = math.lcm(width, height)
+            width = height = side if side <= MAX_FRAME_SIDE else 0
+        if not width:
+            self.width = self.height = 0
+            return
+        self.width = width
+        self.height = height
+        self.x %= width
+        self.y %= height
+        self.counts = array('B', bytes(width * height * len(RESOURCE_ITEMS)))
+        self.last_seen = array('i', [NEVER_SEEN]) * (width * height)
+        for cells in self._known.values():
+            cells.clear()
+        self._cone_pose = None
+
+    def __bool__(self) -> bool:
+        return self.width > 0 and self.height > 0
+
+    def _cell(self, x: int, y: int) -> int:
+        return (y % self.height) * self.width + (x % self.width)
+
+    def tick(self, units: int = 1) -> None:
+        self.time += units
+
+    def absolute(self, dx: int, dy: int) -> tuple[int, int]:
+        """
+        Cell at dx tiles to the right and dy tiles forward of the agent.
+        """
+        fx, fy = ORIENTATIONS[self.orientation]
+        rx, ry = ORIENTATIONS[(self.orientation + 1) % 4]
+        return (self.x + fx * dy + rx * dx) % self.width, (self.y + fy * dy + ry * dx) % self.height
+
+    def relative(self, x: int, y: int) -> tuple[int, int]:
+        """
+        Shortest (right, forward) offset from the agent to a cell.
+        """
+        dx = self._shortest(x - self.x, self.width)
+        dy = self._shortest(y - self.y, self.height)
+        fx, fy = ORIENTATIONS[self.orientation]
+        rx, ry = ORIENTATIONS[(self.orientation + 1) % 4]
+        return dx * rx + dy * ry, dx * fx + dy * fy
+
+    def to_frame(self, dx: int, dy: int) -> tuple[int, int]:
+        """
+        Offset dx tiles to the right and dy tiles forward, in the map's axes.
+        """
+        fx, fy = ORIENTATIONS[self.orientation]
+        rx, ry = ORIENTATIONS[(self.orientation + 1) % 4]
+        return fx * dy + rx * dx, fy * dy + ry * dx
+
+    def from_frame(self, x: int, y: int) -> tuple[int, int]:
+        """
+        (right, forward) offset of a vector in the map's axes.
+        """
+        fx, fy = ORIENTATIONS[self.orientation]
+        rx, ry = ORIENTATIONS[(self.orientation + 1) % 4]
+        return x * rx + y * ry, x * fx + y * fy
+
+    @staticmethod
+    def _shortest(delta: int, size: int) -> int:
+        delta %= size
+        return delta - size if delta > size // 2 else delta
+
+    def distance(self, x: int, y: int) -> int:
+        dx, dy = self.relative(x, y)
+        return abs(dx) + abs(dy)
+
+    def move(self, dx: int, dy: int) -> None:
+        if self:
+            self.x, self.y = self.absolute(dx, dy)
+
+    def forward(self) -> None:
+        self.move(0, 1)
+
+    def turn_left(self) -> None:
+        self.orientation = (self.orientation - 1) % 4
+
+    def turn_right(self) -> None:
+        self.orientation = (self.orientation + 1) % 4
+
+    def ejected(self, direction: int) -> None:
+        if direction in EJECT_MOVES:
+            self.move(*EJECT_MOVES[direction])
+
+    def _set_count(self, cell: int, item: str, value: int) -> None:
+        self.counts[RESOURCE_INDEX[item] * self.width * self.height + cell] = min(value, 255)
+        if value > 0:
+            self._known[item].add(cell)
+        else:
+            self._known[item].discard(cell)
+
+    def count(self, x: int, y: int, item: str) -> int:
+        return self.counts[RESOURCE_INDEX[item] * self.width * self.height + self._cell(x, y)]
+
+    def cone_cells(self, tile_count: int) -> list[int]:
+        """
+        Cell of every tile of a tile_count vision cone seen from the current
+        pose, computed once per pose: the Look folded into the map and the
+        density map share it.
+        """
+        pose = (self.x, self.y, self.orientation, tile_count)
+        if pose != self._cone_pose:
+            x, y, width, height = self.x, self.y, self.width, self.height
+            self._cone = [((y + oy) % height) * width + (x + ox) % width
+                          for ox, oy in CONE_OFFSETS[self.orientation][:tile_count]]
+            self._cone_pose = pose
+        return self._cone
+
+    def fold_vision(self, vision: Vision) -> None:
+        """
+        Record what a Look answer shows, seen from the current pose.
+        """
+        if not self:
+            return
+        cells = self.cone_cells(len(vision))
+        counts = self.counts
+        area = self.width * self.height
+        for index, item in enumerate(RESOURCE_ITEMS):
+            base = index * area
+            column = vision.column(item)
+            if max(column, default=0) > 255:
+                column = [min(count, 255) for count in column]
+            for cell, count in zip(cells, column):
+                counts[base + cell] = count
+            known = self._known[item]
+            known.difference_update(cells)
+            # A small world shows some cells twice, the last tile counts
+            known.update([cell for cell in cells if counts[base + cell]])
+        last_seen = self.last_seen
+        for cell in cells:
+            last_seen[cell] = self.time
+
+    def took(self, item: str) -> None:
+        if self and item in RESOURCE_INDEX:
+            cell = self._cell(self.x, self.y)
+            self._set_count(cell, item, max(0, self.count(self.x, self.y, item) - 1))
+
+    def dropped(self, item: str) -> None:
+        if self and item in RESOURCE_INDEX:
+            cell = self._cell(self.x, self.y)
+            self._set_count(cell, item, self.count(self.x, self.y, item) + 1)
+
+    def missing(self, item: str) -> None:
+        """
+        A Take failed: the item is not on our cell anymore.
+        """
+        if self and item in RESOURCE_INDEX:
+            self._set_count(self._cell(self.x, self.y), item, 0)
+
+    def age(self, x: int, y: int) -> (int | None):
+        seen = self.last_seen[self._cell(x, y)]
+        return None if seen == NEVER_SEEN else self.time - seen
+
+    def confidence(self, x: int, y: int) -> float:
+        """
+        How much an observation of the cell can still be trusted, halving every STALE_HALF_LIFE.
+        """
+        age = self.age(x, y)
+        return 0.0 if age is None else 0.5 ** (age / STALE_HALF_LIFE)
+
+    def nearest(self, items: list[str], max_age: int = 2 * STALE_HALF_LIFE) -> (tuple[str, int, int] | None):
+        """
+        Closest remembered cell holding one of items and seen at most max_age ago.
+        Returns (item, x, y), fresher cells win ties.
+        """
+        if not self:
+            return None
+        best = None
+        best_key = None
+        for item in items:
+            for cell in self._known.get(item, ()):
+                age = self.time - self.last_seen[cell]
+                if age > max_age:
+                    continue
+                x, y = cell % self.width, cell // self.width
+                key = (self.distance(x, y), age)
+                if best_key is None or key < best_key:
+                    best, best_key = (item, x, y), key
+        return best